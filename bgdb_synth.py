@@ -0,0 +1,456 @@
+"""
+bgdb_synth.py - Synthetic BGDatabase binaries for tests and scale benchmarks.
+
+bgdb_clean.bin ships inside the game APK and is not part of the repository.
+This module writes structurally valid stand-ins: every table extract_all.py
+reads (creatureBase ... artifact), with the same field names and types, the
+global name_map, and the 'name'/'koKR' localization dict blocks, all laid
+out exactly as bgdb_utils expects (see its module docstring):
+
+    field     : [uint32 name_len][name][31-byte header][uint32 data_size]
+                [data][22-byte separator: uint32 type marker + 18 bytes]
+    nested    : [uint32 count][count * (uint32 row, uint32 byte_off)][body]
+    rank      : [uint32 count][count * (int32 i, int32 i+1)][grade letters]
+    dict block: [uint32 total_len][uint32 count][count * (key, off)][blob]
+
+Values are random but deterministic for a given seed.  Row counts scale
+with ``scale`` (1 = the v1863 row counts, up to 100x).  At scale 1 with
+``compat=True`` the tables and string blocks sit at the real v1863
+offsets (KOKR_OFF, NAME_MAP_OFF, the detect_offsets() fallbacks), so the
+defaults in bgdb_utils/extract_all are exercised as well as auto-detection.
+
+Usage:
+    from bgdb_synth import build_synthetic_bgdb
+    data, layout = build_synthetic_bgdb(scale=10)
+"""
+
+import random
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+
+# ---------------------------------------------------------------------------
+# Shape of the generated database
+# ---------------------------------------------------------------------------
+
+#: v1863 row counts per table (scale=1).
+BASE_ROWS: Dict[str, int] = {
+    'creature': 539, 'item': 1320, 'enemy': 387, 'boss': 110, 'stage': 500,
+    'equip': 533, 'commander': 35, 'spec': 35, 'artifact': 557,
+}
+
+#: Table order in the file (and in the name_map).
+TABLE_ORDER: Tuple[str, ...] = tuple(BASE_ROWS)
+
+#: First field offset of each table in the real v1863 binary; used when
+#: ``compat`` pads the output to the real layout.
+V1863_TABLE_STARTS: Dict[str, int] = {
+    'creature': 9070, 'item': 105434, 'enemy': 170596, 'boss': 192831,
+    'stage': 210000, 'equip': 245888, 'commander': 279137, 'spec': 286500,
+    'artifact': 292276,
+}
+
+V1863_NAME_MAP_OFF = 485191
+V1863_KOKR_OFF = 629160
+
+#: Separator type marker written for each field type.  The values are
+#: arbitrary; TypeMarkerRegistry learns them from extract_all.FIELD_TYPE_ANCHORS.
+TYPE_MARKERS: Dict[str, int] = {
+    'int32': 10, 'float32': 11, 'bool': 12,
+    'nested_int32': 20, 'nested_float32': 21, 'nested_string': 30,
+    'rank': 31, 'name': 40,
+}
+
+#: The name_map is padded to at least this many entries so its header
+#: matches the detect_offsets() signature (entry_count in [9000, 12000]).
+MIN_NAME_MAP_ENTRIES = 9500
+
+_GRADES = 'EDCBASGXZHOPQ'
+
+_TYPE_LABELS = [('RaceTop', 5), ('Race', 30), ('Location', 20), ('Gender', 3),
+                ('House', 12), ('Religion', 8), ('Individuality', 10)]
+
+_SEC_TEMPLATES = ['데미지 {0}%', '공격 속도 {0}', '강타 배수 {0}', '최대 레벨 {0}',
+                  '효과 {0} {1}', '골드 획득량']
+
+
+# ---------------------------------------------------------------------------
+# Binary encoders
+# ---------------------------------------------------------------------------
+
+class _Writer:
+    """Encodes fields with the random header/separator bytes of one seed."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def noise(self, n: int) -> bytes:
+        return bytes(self.rng.randrange(256) for _ in range(n))
+
+    def field(self, name: str, ftype: str, payload: bytes) -> bytes:
+        nb = name.encode('ascii')
+        return b''.join((
+            struct.pack('<I', len(nb)), nb, self.noise(31),
+            struct.pack('<I', len(payload)), payload,
+            struct.pack('<I', TYPE_MARKERS[ftype]), self.noise(18),
+        ))
+
+    def locale_field(self, name: str, texts: Sequence[str]) -> bytes:
+        """A localization field: its data_size slot opens the dict block."""
+        nb = name.encode('ascii')
+        return b''.join((
+            struct.pack('<I', len(nb)), nb, self.noise(31),
+            dict_block(texts),
+            struct.pack('<I', TYPE_MARKERS['name']), self.noise(18),
+        ))
+
+
+def int32s(vals: Sequence[int]) -> bytes:
+    return struct.pack(f'<{len(vals)}i', *vals)
+
+
+def float32s(vals: Sequence[float]) -> bytes:
+    return struct.pack(f'<{len(vals)}f', *vals)
+
+
+def nested_block(rows: Sequence, fmt: str) -> bytes:
+    """Encode a nested field; ``fmt`` is 'i', 'f' or 's' (one string per row)."""
+    index = []
+    body = []
+    off = 0
+    for i, row in enumerate(rows):
+        index.append(struct.pack('<II', i, off))
+        chunk = row.encode('utf-8') if fmt == 's' else struct.pack(f'<{len(row)}{fmt}', *row)
+        body.append(chunk)
+        off += len(chunk)
+    return struct.pack('<I', len(rows)) + b''.join(index) + b''.join(body)
+
+
+def rank_block(letters: str) -> bytes:
+    n = len(letters)
+    pairs = b''.join(struct.pack('<ii', i, i + 1) for i in range(n))
+    return struct.pack('<I', n) + pairs + letters.encode('ascii')
+
+
+def dict_block(texts: Sequence[str]) -> bytes:
+    """Encode ``texts`` as a dict block keyed 0..n-1."""
+    pairs = []
+    blob = []
+    off = 0
+    for key, text in enumerate(texts):
+        pairs.append(struct.pack('<II', key, off))
+        chunk = text.encode('utf-8')
+        blob.append(chunk)
+        off += len(chunk)
+    return struct.pack('<II', off, len(texts)) + b''.join(pairs) + b''.join(blob)
+
+
+# ---------------------------------------------------------------------------
+# Generator
+# ---------------------------------------------------------------------------
+
+def build_synthetic_bgdb(
+    scale: int = 1,
+    seed: int = 1863,
+    compat: Optional[bool] = None,
+    locales: Sequence[str] = (),
+) -> Tuple[bytes, Dict[str, int]]:
+    """Build a synthetic BGDatabase binary.
+
+    Parameters
+    ----------
+    scale : int
+        Row-count multiplier for every table (1 = v1863, up to 100).
+    seed : int
+        Random seed; the same (scale, seed, compat, locales) gives the same
+        bytes.
+    compat : bool, optional
+        Pad tables and string blocks to the v1863 offsets.  Defaults to
+        True at scale 1 (where they fit) and False otherwise.
+    locales : sequence of str
+        Extra locale tables (e.g. 'enUS') written after koKR; their texts
+        are the Korean ones prefixed with the locale's language code.
+
+    Returns
+    -------
+    (bytes, dict)
+        The binary and its layout: first field offset per table, plus
+        'name_map' (entry_count offset) and 'kokr' / each extra locale
+        (dict block offset, as parse_kokr_strings() expects).
+    """
+    if scale < 1:
+        raise ValueError(f'scale must be >= 1, got {scale}')
+    if compat is None:
+        compat = scale == 1
+    rng = random.Random(seed)
+    w = _Writer(rng)
+    rows = {key: n * scale for key, n in BASE_ROWS.items()}
+
+    # -- Localization: (key, text) pairs; the str_id is the list position.
+    loc: List[Tuple[str, str]] = []
+
+    def add(key: str, text: str) -> int:
+        loc.append((key, text))
+        return len(loc) - 1
+
+    nc, ni = rows['creature'], rows['item']
+    creature_sids = []
+    for i in range(nc):
+        creature_sids.append(add(f'hn{i}', f'[FF0000]용병{i}[-]' if i % 7 == 0 else f'용병{i}'))
+        add(f'hc{i}', f'부제{i}')
+        if i % 3 == 0:
+            add(f'hcg{i}', f'등급부제{i}')
+        add(f'hs{i}', f'용병{i}의 이야기 입니다.\n줄바꿈')
+    for i in range(ni):
+        add(f'sn{i}', f'스킬{i}')
+        add(f'ss{i}', f'스킬 설명 {i}')
+    for t in range(800):
+        add(f'sec{t}', _SEC_TEMPLATES[t % len(_SEC_TEMPLATES)])
+    for prefix, count in _TYPE_LABELS:
+        for code in range(count):
+            add(f'{prefix}{code}', f'{prefix}라벨{code}')
+    for i in range(rows['boss']):
+        add(f'bn{i}', f'보스{i}')
+    for i in range(rows['equip']):
+        add(f'in{i}', f'장비{i}')
+    for i in range(rows['artifact']):
+        add(f'an{i}', f'아티팩트{i}')
+    for s in range(1, 40):
+        add(f'anSet{s}', f'세트{s}')
+
+    def strided(table: str, prefix: str, stride: int, label: str) -> List[int]:
+        bases = []
+        for i in range(rows[table]):
+            bases.append(len(loc))
+            for k in range(stride):
+                add(f'{prefix}{i}_{k}', label.format(i=i, k=k))
+        return bases
+
+    enemy_sids = strided('enemy', 'en', 5, ' 적{i}-{k} ')
+    cmd_sids = strided('commander', 'cm', 6, '지휘관{i}-{k}')
+    spec_sids = strided('spec', 'sp', 6, '특성{i}-{k}')
+
+    # -- Tables
+    tables = {
+        'creature': _creature_fields(w, rows),
+        'item': _item_fields(w, rows),
+        'enemy': _plain_fields(w, rows['enemy'], [
+            ('model', 'int32'), ('factorHp', 'float32'), ('resistPhysical', 'float32'),
+            ('resistMagical', 'float32'), ('factorGold', 'float32'), ('color', 'int32'),
+            ('isRunaway', 'bool'), ('resistClick', 'float32'), ('effectAttach', 'int32'),
+            ('block', 'float32'), ('alpha', 'float32'), ('cooldown', 'float32'),
+            ('chanceAttackAll', 'float32'), ('isMirroring', 'bool')]),
+        'boss': _plain_fields(w, rows['boss'], [
+            ('model', 'int32'), ('resistPhysical', 'float32'), ('resistMagical', 'float32'),
+            ('color', 'int32'), ('coin', 'int32'), ('resistClick', 'float32'),
+            ('effectAttach', 'int32'), ('factorHp', 'float32'), ('factorGold', 'float32'),
+            ('medal', 'int32'), ('block', 'float32'), ('alpha', 'float32'),
+            ('cooldown', 'float32'), ('chanceAttackAll', 'float32'),
+            ('isMirroring', 'bool'), ('essence', 'float32')]),
+        'stage': [
+            w.field('ambience', 'int32', int32s([rng.randrange(10) for _ in range(rows['stage'])])),
+            w.field('boss', 'int32', int32s([rng.randrange(110) for _ in range(rows['stage'])])),
+        ],
+        'equip': _equip_fields(w, rows),
+        'commander': _commander_fields(w, rows),
+        'spec': _spec_fields(w, rows),
+        'artifact': _artifact_fields(w, rows),
+    }
+
+    # -- name_map: str_id of each row's first string, in table order.
+    n_loc = len(loc)
+    name_map = []
+    name_map += [(i, creature_sids[i]) for i in range(nc)]
+    name_map += [(i, rng.randrange(n_loc)) for i in range(ni)]
+    name_map += [(i, enemy_sids[i]) for i in range(rows['enemy'])]
+    name_map += [(i, rng.randrange(n_loc)) for i in range(rows['boss'])]
+    name_map += [(i, 10 ** 6) for i in range(rows['stage'])]   # outside koKR
+    name_map += [(i, rng.randrange(n_loc)) for i in range(rows['equip'])]
+    name_map += [(i, cmd_sids[i]) for i in range(rows['commander'])]
+    name_map += [(i, spec_sids[i]) for i in range(rows['spec'])]
+    name_map += [(i, rng.randrange(n_loc)) for i in range(rows['artifact'])]
+    while len(name_map) < MIN_NAME_MAP_ENTRIES:
+        name_map.append((len(name_map) % 50, 10 ** 6 + len(name_map)))
+    name_map_bytes = (struct.pack('<I', len(name_map))
+                      + b''.join(struct.pack('<II', r, s) for r, s in name_map))
+
+    name_field = w.locale_field('name', [key for key, _ in loc])
+    kokr_field = w.locale_field('koKR', [text for _, text in loc])
+
+    # -- Assemble
+    out = bytearray(b'\x07' * 1000)
+    layout: Dict[str, int] = {}
+
+    def pad_to(target: int) -> None:
+        if compat and len(out) <= target:
+            out.extend(b'\xff' * (target - len(out)))
+
+    for key in TABLE_ORDER:
+        out += struct.pack('<I', len(key) + 4) + (key + 'Base').encode('ascii') + bytes(26)
+        pad_to(V1863_TABLE_STARTS[key])
+        layout[key] = len(out)
+        for f in tables[key]:
+            out += f
+        out += b'\xff' * 64
+    out += b'\xff' * 256
+    out += name_field
+    pad_to(V1863_NAME_MAP_OFF)
+    layout['name_map'] = len(out)
+    out += name_map_bytes
+    out += b'\xff' * 128
+    pad_to(V1863_KOKR_OFF - 39)
+    layout['kokr'] = len(out) + 39
+    out += kokr_field
+    for locale in locales:
+        out += b'\xff' * 64
+        layout[locale] = len(out) + 39
+        tag = locale[:2].upper() + ' '
+        out += w.locale_field(locale, [tag + text if text else text for _, text in loc])
+    out += b'\0' * 500
+    return bytes(out), layout
+
+
+def _creature_fields(w: _Writer, rows: Dict[str, int]) -> List[bytes]:
+    rng, nc, ni = w.rng, rows['creature'], rows['item']
+
+    def ints(make) -> bytes:
+        return int32s([make() for _ in range(nc)])
+
+    def flags() -> bytes:
+        return bytes(rng.randrange(2) for _ in range(nc))
+
+    fields = [
+        w.field('index', 'int32', int32s(list(range(nc)))),
+        w.field('model', 'int32', ints(lambda: rng.randrange(300))),
+        w.field('rank', 'rank', rank_block(''.join(rng.choice(_GRADES) for _ in range(nc)))),
+        w.field('attackType', 'int32', ints(lambda: rng.choice([0, 1, 2, 3, 6, 9]))),
+        w.field('canG', 'bool', flags()),
+        w.field('canAwaken', 'bool', flags()),
+    ]
+    for s in range(5):
+        fields.append(w.field(f'skill{s}', 'int32', ints(lambda: rng.randrange(ni))))
+    for name in ('damageUp', 'damage', 'damageClickUp', 'damageClick'):
+        fields.append(w.field(name, 'int32', ints(lambda: rng.randrange(1, 500))))
+    fields.append(w.field('attackCooldown', 'float32',
+                          float32s([rng.choice([0.0, 1.47, 2.0, 0.85]) for _ in range(nc)])))
+    for name in ('damageUpG', 'damageG', 'damageClickUpG', 'damageClickG'):
+        fields.append(w.field(name, 'int32', ints(lambda: rng.randrange(0, 500))))
+    fields.append(w.field('attackCooldownG', 'float32',
+                          float32s([rng.choice([0.0, 1.2]) for _ in range(nc)])))
+    for s in range(3):
+        fields.append(w.field(f'exclusiveID{s}', 'int32',
+                              ints(lambda: rng.randrange(-1, rows['equip']))))
+    for name in ('effectAttack', 'requireOrb', 'requireParticle'):
+        fields.append(w.field(name, 'int32', ints(lambda: rng.randrange(5))))
+    for name, count in (('typeRaceTop', 5), ('typeRace', 30), ('typeLocation', 20),
+                        ('typeGender', 3), ('typeIndividuality', 10), ('typeHouse', 12),
+                        ('typeReligion', 8)):
+        fields.append(w.field(name, 'int32', ints(lambda: rng.randrange(count + 2))))
+    return fields
+
+
+def _item_fields(w: _Writer, rows: Dict[str, int]) -> List[bytes]:
+    rng, ni = w.rng, rows['item']
+    fields = [
+        w.field('name', 'name', bytes(4)),
+        w.field('index', 'int32', int32s(list(range(ni)))),
+        w.field('icon', 'int32', int32s([rng.randrange(200) for _ in range(ni)])),
+        w.field('priceFactor', 'float32', float32s([rng.choice([1.0, 1.5, 0.25]) for _ in range(ni)])),
+        w.field('passiveType', 'int32', int32s([rng.choice([0, 0, 0, 1, 2]) for _ in range(ni)])),
+    ]
+    for s in range(3):
+        fields.append(w.field(f'type{s}', 'int32', int32s(
+            [rng.choice([0, 7, 15, 273, 530, 133, 80, 2, 17, 29, 1]) for _ in range(ni)])))
+        fields.append(w.field(f'effect{s}', 'float32', float32s(
+            [rng.choice([0.0, 0.04, 0.05, 1.5, 3.0, 12.0]) for _ in range(ni)])))
+    fields.append(w.field('randomValue', 'int32', int32s([rng.choice([0, 0, 1, 3]) for _ in range(ni)])))
+    return fields
+
+
+def _plain_fields(w: _Writer, n: int, names: Sequence[Tuple[str, str]]) -> List[bytes]:
+    rng = w.rng
+    fields = [w.field('name', 'name', bytes(4))]
+    for name, ftype in names:
+        if ftype == 'int32':
+            payload = int32s([rng.randrange(100) for _ in range(n)])
+        elif ftype == 'float32':
+            payload = float32s([rng.choice([0.0, 0.5, 1.0, 1.25, 2.5]) for _ in range(n)])
+        else:
+            payload = bytes(rng.randrange(2) for _ in range(n))
+        fields.append(w.field(name, ftype, payload))
+    return fields
+
+
+def _equip_fields(w: _Writer, rows: Dict[str, int]) -> List[bytes]:
+    rng, nq = w.rng, rows['equip']
+    fields = [
+        w.field('name', 'name', bytes(4)),
+        w.field('index', 'int32', int32s(list(range(nq)))),
+        w.field('icon', 'int32', int32s([rng.randrange(500) for _ in range(nq)])),
+        w.field('mainType', 'int32', int32s([rng.choice([0, 2, 17, 90, 999, 54]) for _ in range(nq)])),
+        w.field('mainEffect', 'float32', float32s([rng.choice([0.05, 0.1, 0.315, 1.0]) for _ in range(nq)])),
+        w.field('mainEffectG', 'float32', float32s([rng.choice([0.0, 0.2]) for _ in range(nq)])),
+        w.field('rank', 'rank', rank_block(''.join(rng.choice(_GRADES) for _ in range(nq)))),
+    ]
+    for h in range(6):
+        fields.append(w.field(f'specializedHero{h}', 'int32', int32s(
+            [rng.randrange(-1, rows['creature']) for _ in range(nq)])))
+    fields.append(w.field('specializedEffect', 'float32', float32s([rng.choice([0.0, 0.1]) for _ in range(nq)])))
+    fields.append(w.field('isAvailableG', 'bool', bytes(rng.randrange(2) for _ in range(nq))))
+    fields.append(w.field('cantPowerUp', 'bool', bytes(rng.randrange(2) for _ in range(nq))))
+    return fields
+
+
+def _commander_fields(w: _Writer, rows: Dict[str, int]) -> List[bytes]:
+    rng, n = w.rng, rows['commander']
+    fields = [w.field('name', 'name', bytes(4))]
+    for name in ('index', 'rarity', 'icon', 'gender', 'statStr', 'statInt', 'statLuck', 'statChar'):
+        vals = list(range(n)) if name == 'index' else [rng.randrange(20) for _ in range(n)]
+        fields.append(w.field(name, 'int32', int32s(vals)))
+    return fields
+
+
+def _spec_fields(w: _Writer, rows: Dict[str, int]) -> List[bytes]:
+    rng, n = w.rng, rows['spec']
+    return [
+        w.field('name', 'name', bytes(4)),
+        w.field('index', 'int32', int32s(list(range(n)))),
+        w.field('icon', 'int32', int32s([rng.randrange(20) for _ in range(n)])),
+        w.field('targetIndex', 'int32', int32s(
+            [rng.choice([-1] + list(range(rows['commander']))) for _ in range(n)])),
+        w.field('target', 'int32', int32s([rng.randrange(4) for _ in range(n)])),
+        w.field('type', 'nested_string', nested_block(
+            [rng.choice(['Damage', 'Gold', 'Click', '']) for _ in range(n)], 's')),
+        w.field('effect', 'float32', float32s([rng.choice([0.1, 0.25]) for _ in range(n)])),
+    ]
+
+
+def _artifact_fields(w: _Writer, rows: Dict[str, int]) -> List[bytes]:
+    rng, n = w.rng, rows['artifact']
+    atypes = [[rng.choice([0, 1, 2, 28, 314, 90, 7, 9999]) for _ in range(rng.randrange(3, 6))]
+              for _ in range(n)]
+    aeffects = [[rng.choice([0.02, 0.025, 0.1, 1.5]) for _ in row] for row in atypes]
+    return [
+        w.field('name', 'name', bytes(4)),
+        w.field('index', 'int32', int32s(list(range(n)))),
+        w.field('icon', 'int32', int32s([rng.randrange(600) for _ in range(n)])),
+        w.field('rank', 'int32', int32s(
+            [rng.choice([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 15]) for _ in range(n)])),
+        w.field('dropTable', 'int32', int32s([rng.randrange(5) for _ in range(n)])),
+        w.field('part', 'int32', int32s([rng.randrange(5) for _ in range(n)])),
+        w.field('set', 'int32', int32s([rng.randrange(0, 40) for _ in range(n)])),
+        w.field('aType', 'nested_int32', nested_block(atypes, 'i')),
+        w.field('aEffect', 'nested_float32', nested_block(aeffects, 'f')),
+    ]
+
+
+def write_synthetic_bgdb(path: Union[str, Path], scale: int = 1, seed: int = 1863,
+                         compat: Optional[bool] = None,
+                         locales: Sequence[str] = ()) -> Dict[str, int]:
+    """Build a synthetic binary and write it to ``path``; returns its layout."""
+    data, layout = build_synthetic_bgdb(scale, seed=seed, compat=compat, locales=locales)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return layout
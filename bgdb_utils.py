@@ -13,7 +13,8 @@ Data types:
     int32   : data_size = row_count * 4, LE signed int32 values
     float32 : data_size = row_count * 4, LE IEEE-754 float32 values
     bool    : data_size = row_count, single byte per row (0/1)
-    rank    : data_size = 9*row_count - 4 + 4, embedded row_count prefix,
+    rank    : data_size = 9*row_count + 4: [uint32 row_count]
+              [row_count * (int32, int32 rank)][row_count grade letters],
               rank[i] = flat_int32s[2*i + 1]
 
 String table (koKR) starts at offset 629160:
@@ -38,11 +39,25 @@ Table row ranges in name_map (sequential, zero-based index into name_map entries
     artifact      : entries 3459- 4015  (557 rows)
 """
 
+import hashlib
+import json
+import mmap
+import operator
+import os
 import re
 import struct
-from dataclasses import dataclass
+import sys
+import time
+import zipfile
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import lru_cache, wraps
+from itertools import accumulate, compress
 from pathlib import Path
-from typing import Union, Dict, List, Optional, Tuple
+from typing import Union, Dict, List, Optional, Sequence, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -58,9 +73,232 @@ KOKR_OFF: int = 629160
 NAME_MAP_OFF: int = 485191
 
 
+#: name_map header signature: entry_count in [9000, 12000] (so the two high
+#: bytes are zero and the second byte is 0x23-0x2E), then the first entry
+#: (row_id=0, str_id<20).  Wrapped in a lookahead so overlapping candidates
+#: are all reported.
+_NAME_MAP_SIG_RE = re.compile(
+    rb'(?=[\x00-\xff][\x23-\x2e]\x00\x00'
+    rb'\x00\x00\x00\x00'
+    rb'[\x00-\x13]\x00\x00\x00)'
+)
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation (opt-in: BGDB_STATS=1 or collect_stats())
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ParserStats:
+    """Accumulated cost of one parser or one field."""
+    calls: int = 0
+    bytes: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+
+
+class StatsCollector:
+    """Per-parser and per-field call counts, bytes, rows and wall time.
+
+    Parser times are inclusive (parse_int32_field counts the
+    decode_int32_column call it makes).  A field is only charged by the
+    outermost instrumented call, so the field table does not double count.
+    Field keys are 'name@offset' whether the field was decoded by a parser
+    or through a BGTable; derived BGTable columns, which have no offset,
+    are 'name@table_key'.  Rows are the length of the decoded column;
+    calls that do not decode one (scans, loaders) report none.
+    """
+
+    def __init__(self):
+        self.parsers: Dict[str, ParserStats] = {}
+        self.fields: Dict[str, ParserStats] = {}
+        self._depth = 0
+
+    def call(self, parser: str, fn, args, kwargs,
+             field: Optional[str] = None, nbytes: Optional[int] = None,
+             rows_of=None):
+        outer = self._depth == 0
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            self._depth -= 1
+        elapsed = time.perf_counter() - start
+        if nbytes is None:
+            nbytes = _buffer_len(args[0]) if args else 0
+        rows = (rows_of or _column_rows)(result)
+        _charge(self.parsers, parser, nbytes, rows, elapsed)
+        if field is not None and outer:
+            _charge(self.fields, field, nbytes, rows, elapsed)
+        return result
+
+    def top_fields(self, n: int = 10) -> List[Tuple[str, ParserStats]]:
+        """The *n* fields with the largest total decode time."""
+        return sorted(self.fields.items(), key=lambda kv: kv[1].seconds,
+                      reverse=True)[:n]
+
+    def snapshot(self) -> dict:
+        """JSON-ready copy: {'parsers': {...}, 'fields': {...}}."""
+        return {
+            'parsers': {k: asdict(v) for k, v in self.parsers.items()},
+            'fields': {k: asdict(v) for k, v in self.fields.items()},
+        }
+
+    def format_report(self, n: int = 10) -> str:
+        lines = [f"{'parser':<28} {'calls':>6} {'rows':>9} {'bytes':>11} {'ms':>9}"]
+        for name, st in sorted(self.parsers.items(),
+                               key=lambda kv: kv[1].seconds, reverse=True):
+            lines.append(f"{name:<28} {st.calls:>6} {st.rows:>9} "
+                         f"{st.bytes:>11} {st.seconds * 1000:>9.2f}")
+        lines.append('')
+        lines.append(f"top {n} fields by decode time")
+        for name, st in self.top_fields(n):
+            lines.append(f"  {name:<34} {st.rows:>7} rows {st.seconds * 1000:>8.2f} ms")
+        return '\n'.join(lines)
+
+
+def _charge(table: Dict[str, ParserStats], key: str, nbytes: int,
+            rows: int, elapsed: float) -> None:
+    st = table.get(key)
+    if st is None:
+        st = table[key] = ParserStats()
+    st.calls += 1
+    st.bytes += nbytes
+    st.rows += rows
+    st.seconds += elapsed
+
+
+def _buffer_len(obj) -> int:
+    return len(obj) if isinstance(obj, (bytes, bytearray, memoryview, mmap.mmap)) else 0
+
+
+def _column_rows(result) -> int:
+    """Rows of a decoded column (array, list, RaggedArray, RankColumn, ...)."""
+    if isinstance(result, (str, bytes, bytearray, mmap.mmap)):
+        return 0
+    try:
+        return len(result)
+    except TypeError:
+        return 0
+
+
+def _no_rows(result) -> int:
+    return 0
+
+
+def _values_rows(result) -> int:
+    """Rows of the column in the second item of a tuple result
+    (auto_parse_field()'s values, build_localization()'s strings)."""
+    return len(result[1])
+
+
+#: The active collector; None means instrumentation is off and every
+#: instrumented parser is a straight call through.
+_STATS: Optional[StatsCollector] = (StatsCollector()
+                                    if os.environ.get('BGDB_STATS') else None)
+
+
+def enable_stats() -> StatsCollector:
+    """Start collecting into a fresh StatsCollector and return it."""
+    global _STATS
+    _STATS = StatsCollector()
+    return _STATS
+
+
+def disable_stats() -> Optional[StatsCollector]:
+    """Stop collecting; returns the collector that was active (if any)."""
+    global _STATS
+    collector, _STATS = _STATS, None
+    return collector
+
+
+def stats_snapshot() -> Optional[dict]:
+    """Snapshot of the active collector, or None when stats are off."""
+    return _STATS.snapshot() if _STATS is not None else None
+
+
+@contextmanager
+def collect_stats():
+    """Collect parser statistics inside a ``with`` block::
+
+        with collect_stats() as stats:
+            extract(...)
+        print(stats.format_report())
+    """
+    global _STATS
+    previous = _STATS
+    collector = _STATS = StatsCollector()
+    try:
+        yield collector
+    finally:
+        _STATS = previous
+
+
+def _instrumented(fn=None, *, field_arg: bool = False, rows=_column_rows):
+    """Record calls of a public parser while stats are enabled.
+
+    With ``field_arg`` the second positional argument is a field offset:
+    the call is charged to that field ('name@offset') and its data_size
+    counts as the bytes decoded (otherwise the length of the input buffer).
+    ``rows(result)`` gives the rows decoded (default: len of the column;
+    _no_rows for calls that decode no column).
+    """
+    def decorate(fn):
+        name = fn.__name__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            stats = _STATS
+            if stats is None:
+                return fn(*args, **kwargs)
+            field = nbytes = None
+            if field_arg and len(args) >= 2:
+                try:
+                    field = f"{read_field_name(args[0], args[1])}@{args[1]}"
+                    nbytes = _field_data_region(args[0], args[1])[1]
+                except (struct.error, ValueError, IndexError):
+                    pass
+            return stats.call(name, fn, args, kwargs, field, nbytes, rows)
+        return wrapper
+    return decorate(fn) if fn is not None else decorate
+
+
+def binary_digest(data: bytes) -> str:
+    """Return the sha256 hex digest of the binary (cache key for layouts)."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def field_records_digest(data: bytes, offsets: Dict[str, int]) -> str:
+    """Return the sha256 hex digest of the given field records.
+
+    Each record (name, header, data and the trailing separator with its
+    type marker) is hashed in place and in offset order, so the digest
+    changes exactly when one of these fields does and the rest of the
+    binary is never read.  Used as the per-table cache key.
+    """
+    h = hashlib.sha256()
+    view = memoryview(data)
+    for name, off in sorted(offsets.items(), key=operator.itemgetter(1)):
+        h.update(name.encode('utf-8'))
+        h.update(view[off:min(next_field_offset(data, off), len(data))])
+    return h.hexdigest()
+
+
+@_instrumented(rows=_no_rows)
 def detect_offsets(data: bytes) -> tuple:
     """Auto-detect koKR and name_map offsets from the binary.
 
+    The name_map search runs a single regex over the 200 KB window before
+    the koKR marker instead of unpacking three uint32s at every byte offset.
+    The scan costs about as much as hashing the binary would, so results
+    are not memoized here; detect_layout() caches them on disk instead.
+
+    Binaries whose name_map is larger than the real one (synthetic builds
+    at scale > 1) miss that signature; they get a second, whole-file scan
+    that accepts any count and instead checks that the first row_ids run
+    0, 1, 2, ...
+
     Returns (kokr_off, name_map_off).  Falls back to hardcoded defaults
     if auto-detection fails.
     """
@@ -75,20 +313,51 @@ def detect_offsets(data: bytes) -> tuple:
     name_map_off = NAME_MAP_OFF
     search_start = max(0, kokr_off - 200000)
     search_end = kokr_off
-    for off in range(search_start, search_end):
-        if off + 12 > len(data):
+    # Let candidates near search_end see their full 12-byte header.
+    scan_end = min(len(data), search_end + 11)
+    for m in _NAME_MAP_SIG_RE.finditer(data, search_start, scan_end):
+        off = m.start()
+        if off >= search_end:
             break
         count = struct.unpack_from('<I', data, off)[0]
         if 9000 <= count <= 12000:
-            row0 = struct.unpack_from('<I', data, off + 4)[0]
-            sid0 = struct.unpack_from('<I', data, off + 8)[0]
-            if row0 == 0 and sid0 < 20:
-                name_map_off = off
-                break
+            name_map_off = off
+            break
+    else:
+        name_map_off = _scan_scaled_name_map(data, kokr_off) or NAME_MAP_OFF
 
     return kokr_off, name_map_off
 
 
+#: A name_map header of any size: entry_count >= 65536 or a low byte pattern,
+#: then the first entry (row_id=0, str_id<20).
+_SCALED_NAME_MAP_SIG_RE = re.compile(
+    rb'(?=[\x00-\xff]{3}\x00'
+    rb'\x00\x00\x00\x00'
+    rb'[\x00-\x13]\x00\x00\x00'
+    rb'\x01\x00\x00\x00)'
+)
+
+
+def _scan_scaled_name_map(data: bytes, kokr_off: int,
+                          min_count: int = 9000) -> Optional[int]:
+    """Find a name_map of at least ``min_count`` entries anywhere before
+    koKR whose first eight row_ids are 0..7.
+
+    Dict blocks ([total_len][count][(0, 0), (1, off1), ...]) have the same
+    shape one uint32 later, so candidates that open a dict block are skipped.
+    """
+    for m in _SCALED_NAME_MAP_SIG_RE.finditer(data, 0, min(kokr_off, len(data))):
+        off = m.start()
+        count = struct.unpack_from('<I', data, off)[0]
+        if count < min_count or off + 4 + count * 8 > len(data):
+            continue
+        if all(struct.unpack_from('<I', data, off + 4 + k * 8)[0] == k
+               for k in range(8)) and try_parse_dict_block(data, off - 4) is None:
+            return off
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Auto field scanner — detects table field offsets dynamically
 # ---------------------------------------------------------------------------
@@ -128,7 +397,9 @@ def _walk_table_fields(data: bytes, start_off: int,
     return result
 
 
-# Table scan definitions: (table_key, first_field_name, search_range)
+# Legacy table scan definitions: (table_key, first_field_name, search_range).
+# Only used by scan_all_table_fields_windowed() for benchmarking against the
+# catalog scan; they break whenever an APK moves a table out of its window.
 _TABLE_SCAN_DEFS = [
     ('creature',  'index',    (8000,   12000)),
     ('item',      'name',     (104000, 112000)),
@@ -142,8 +413,9 @@ _TABLE_SCAN_DEFS = [
 ]
 
 
-def scan_all_table_fields(data: bytes) -> Dict[str, Dict[str, int]]:
-    """Auto-detect field offsets for all tables in the binary.
+@_instrumented(rows=_no_rows)
+def scan_all_table_fields_windowed(data: bytes) -> Dict[str, Dict[str, int]]:
+    """Legacy per-table scan using the fixed _TABLE_SCAN_DEFS byte windows.
 
     Returns dict mapping table_key -> {field_name: byte_offset}.
     """
@@ -157,6 +429,212 @@ def scan_all_table_fields(data: bytes) -> Dict[str, Dict[str, int]]:
     return result
 
 
+# Field-name signatures identifying the known tables, in file order.  A field
+# chain is assigned to the first unclaimed table whose signature it contains.
+_TABLE_SIGNATURES = [
+    ('creature',  ('index', 'model', 'rank', 'attackType', 'skill0')),
+    ('item',      ('name', 'index', 'priceFactor', 'passiveType', 'randomValue')),
+    ('enemy',     ('name', 'model', 'factorHp', 'isRunaway')),
+    ('boss',      ('name', 'model', 'coin', 'medal')),
+    ('stage',     ('ambience',)),
+    ('equip',     ('name', 'index', 'mainType', 'mainEffect')),
+    ('commander', ('name', 'index', 'rarity', 'statStr')),
+    ('spec',      ('name', 'index', 'targetIndex', 'effect')),
+    ('artifact',  ('name', 'index', 'aType', 'aEffect')),
+    # Not extracted yet; output/potential_jewel.json and
+    # output/slot_and_research.json are still maintained by hand.
+    ('jewel',     ('level', 'ruby', 'topaz', 'sapphire', 'emerald', 'amethyst')),
+    ('research',  ('name', 'index', 'category', 'maxLevel', 'cost')),
+    ('slot',      ('name', 'index', 'condition', 'cost')),
+]
+
+# Every length-prefixed identifier of 1-30 chars:
+#   [uint32 n][n bytes of A-Z a-z 0-9 _]
+# n is encoded in the first byte, so each length gets its own alternative.
+_FIELD_HEADER_RE = re.compile(b'|'.join(
+    re.escape(struct.pack('<I', n)) + b'[A-Za-z0-9_]{%d}' % n
+    for n in range(1, 31)
+))
+
+
+@dataclass
+class FieldInfo:
+    """One field of a catalogued table."""
+    name: str
+    offset: int      # byte offset of the name_length prefix
+    size: int        # data_size
+    type: str        # inferred: 'scalar32' | 'bool' | 'array'
+    rows: int        # row count of the owning table
+    marker: Optional[int] = None   # type marker from the trailing separator
+
+
+@dataclass
+class TableInfo:
+    """A chain of consecutive fields found by build_field_catalog()."""
+    key: str
+    start: int
+    row_count: int
+    fields: Dict[str, FieldInfo]
+
+    def offsets(self) -> Dict[str, int]:
+        """Return {field_name: offset} (the scan_all_table_fields format)."""
+        return {name: f.offset for name, f in self.fields.items()}
+
+
+def _infer_field_type(data_size: int, rows: int) -> str:
+    if rows and data_size == rows * 4:
+        return 'scalar32'
+    if rows and data_size == rows:
+        return 'bool'
+    return 'array'
+
+
+def _chain_row_count(key: str, fields: List[Tuple[str, int, int]]) -> int:
+    """Row count of a chain: its _ROW_COUNT_FIELDS column, else the most
+    common int32-sized column length."""
+    count_field = _ROW_COUNT_FIELDS.get(key)
+    for name, _off, ds in fields:
+        if name == count_field:
+            return ds // 4
+    sizes: Dict[int, int] = {}
+    for _name, _off, ds in fields:
+        if ds > 4 and ds % 4 == 0:
+            sizes[ds // 4] = sizes.get(ds // 4, 0) + 1
+    if not sizes:
+        return 0
+    return max(sizes.items(), key=lambda kv: (kv[1], kv[0]))[0]
+
+
+def _unknown_table_key(names: Sequence[str], taken) -> str:
+    """Key of a chain no signature matches: its first field name plus a
+    digest of all its field names, e.g. 'name#1c9e04a2' ('-2', '-3', ...
+    appended when two chains have the same fields).  Stable across builds
+    as long as the table keeps its fields, wherever it moves."""
+    digest = hashlib.sha1('\0'.join(names).encode('ascii')).hexdigest()[:8]
+    key = base = f'{names[0]}#{digest}'
+    n = 1
+    while key in taken:
+        n += 1
+        key = f'{base}-{n}'
+    return key
+
+
+@_instrumented(rows=_no_rows)
+def build_field_catalog(data: bytes) -> Dict[str, TableInfo]:
+    """Catalog every table and field in the binary in one linear pass.
+
+    A single regex pass finds every length-prefixed identifier whose data
+    block fits in the file.  Headers whose next_field_offset() lands on
+    another header are linked, and each maximal chain is one table (a
+    repeated field name starts a new table).  Chains are named from
+    _TABLE_SIGNATURES; unrecognised chains get a key derived from their
+    field names (see _unknown_table_key).
+    No search windows are involved, so tables may move freely between
+    builds.
+
+    Returns
+    -------
+    dict[str, TableInfo]
+        table_key -> TableInfo, in file order.
+    """
+    size = len(data)
+    headers: Dict[int, Tuple[str, int, int]] = {}   # off -> (name, ds, next)
+    for m in _FIELD_HEADER_RE.finditer(data):
+        off = m.start()
+        name_len = m.end() - off - 4
+        data_region = off + 4 + name_len
+        if data_region + 35 > size:
+            continue
+        ds = struct.unpack_from('<I', data, data_region + 31)[0]
+        nxt = data_region + 35 + ds + 22
+        if nxt > size:
+            continue
+        headers[off] = (str(m.group()[4:], 'ascii'), ds, nxt)
+
+    linked = {nxt for _name, _ds, nxt in headers.values() if nxt in headers}
+    markers = {off: struct.unpack_from('<I', data, nxt - 22)[0]
+               for off, (_name, _ds, nxt) in headers.items()}
+
+    chains: List[List[Tuple[str, int, int]]] = []
+    for off in headers:
+        if off in linked:
+            continue
+        chain: List[Tuple[str, int, int]] = []
+        seen = set()
+        cur = off
+        while cur in headers:
+            name, ds, nxt = headers[cur]
+            if name in seen:
+                if len(chain) >= 2:
+                    chains.append(chain)
+                chain, seen = [], set()
+            chain.append((name, cur, ds))
+            seen.add(name)
+            cur = nxt
+        if len(chain) >= 2:
+            chains.append(chain)
+    chains.sort(key=lambda c: c[0][1])
+
+    catalog: Dict[str, TableInfo] = {}
+    for chain in chains:
+        names = {name for name, _off, _ds in chain}
+        key = next((k for k, sig in _TABLE_SIGNATURES
+                    if k not in catalog and names.issuperset(sig)), None)
+        if key is None:
+            key = _unknown_table_key([name for name, _off, _ds in chain], catalog)
+        rows = _chain_row_count(key, chain)
+        fields = {name: FieldInfo(name, off, ds, _infer_field_type(ds, rows),
+                                  rows, markers[off])
+                  for name, off, ds in chain}
+        catalog[key] = TableInfo(key=key, start=chain[0][1], row_count=rows,
+                                 fields=fields)
+    return catalog
+
+
+def catalog_to_dict(catalog: Dict[str, TableInfo]) -> dict:
+    """JSON-serializable form of a field catalog (see catalog_from_dict)."""
+    return {
+        key: {
+            'start': t.start,
+            'row_count': t.row_count,
+            'fields': {n: [f.offset, f.size, f.type, f.marker]
+                       for n, f in t.fields.items()},
+        }
+        for key, t in catalog.items()
+    }
+
+
+def catalog_from_dict(raw: dict) -> Dict[str, TableInfo]:
+    """Rebuild a field catalog from catalog_to_dict() output."""
+    catalog = {}
+    for key, t in raw.items():
+        rows = t['row_count']
+        fields = {n: FieldInfo(n, *entry[:3], rows, *entry[3:4])
+                  for n, entry in t['fields'].items()}
+        catalog[key] = TableInfo(key=key, start=t['start'], row_count=rows,
+                                 fields=fields)
+    return catalog
+
+
+def scan_all_table_fields(data: bytes,
+                          catalog: Optional[Dict[str, TableInfo]] = None,
+                          ) -> Dict[str, Dict[str, int]]:
+    """Auto-detect field offsets for all known tables in the binary.
+
+    Built on build_field_catalog(); pass a precomputed catalog to avoid
+    rescanning.
+
+    Returns dict mapping table_key -> {field_name: byte_offset}.
+    """
+    if catalog is None:
+        catalog = build_field_catalog(data)
+    result = {}
+    for tbl_key, _sig in _TABLE_SIGNATURES:
+        table = catalog.get(tbl_key)
+        result[tbl_key] = table.offsets() if table else {}
+    return result
+
+
 # Fields to use for row-count detection (must be int32, not string/bool)
 _ROW_COUNT_FIELDS = {
     'creature': 'index', 'item': 'index',
@@ -184,23 +662,213 @@ def detect_row_counts(data: bytes,
 # Binary loader
 # ---------------------------------------------------------------------------
 
-def load_binary(path: Union[str, Path] = DEFAULT_BIN_PATH) -> bytes:
+@_instrumented(rows=_no_rows)
+def load_binary(path: Union[str, Path] = DEFAULT_BIN_PATH,
+                mmap_mode: bool = False) -> Union[bytes, bytearray, mmap.mmap]:
     """Load the BGDatabase binary file into memory.
 
+    An ``.apk``/``.zip`` path is opened as an archive and the database asset
+    is streamed out of it in memory (see load_apk_binary); ``mmap_mode`` is
+    ignored in that case.
+
     Parameters
     ----------
     path : str or Path
-        Path to bgdb_clean.bin. Defaults to 'bgdb_clean.bin' in cwd.
+        Path to bgdb_clean.bin (or the game APK). Defaults to
+        'bgdb_clean.bin' in cwd.
+    mmap_mode : bool
+        Return a read-only memory map (see map_binary) instead of reading
+        the whole file into a bytes object.
 
     Returns
     -------
-    bytes
-        Full file contents.
+    bytes, bytearray or mmap.mmap
+        Full file contents (a bytearray when read out of an APK).
     """
+    if Path(path).suffix.lower() in APK_SUFFIXES:
+        return load_apk_binary(path)
+    if mmap_mode:
+        return map_binary(path)
     with open(path, 'rb') as fh:
         return fh.read()
 
 
+def map_binary(path: Union[str, Path] = DEFAULT_BIN_PATH) -> mmap.mmap:
+    """Memory-map the BGDatabase binary read-only.
+
+    The returned object supports everything the parsers use on bytes
+    (find, slicing, indexing, struct.unpack_from, the buffer protocol), but
+    pages are loaded lazily and shared through the OS page cache, so several
+    extraction processes mapping the same file hold a single copy.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to bgdb_clean.bin. Defaults to 'bgdb_clean.bin' in cwd.
+
+    Returns
+    -------
+    mmap.mmap
+        Read-only mapping of the whole file.
+    """
+    with open(path, 'rb') as fh:
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def region_view(data: bytes, start: int, end: int) -> memoryview:
+    """Return a zero-copy memoryview of data[start:end].
+
+    Slicing bytes or mmap objects copies; parsers use this instead when they
+    only need to read or decode a sub-range of the binary.
+    """
+    return memoryview(data)[start:end]
+
+
+# ---------------------------------------------------------------------------
+# APK ingestion
+# ---------------------------------------------------------------------------
+
+APK_SUFFIXES = ('.apk', '.zip')
+
+#: Member names tried first, in order, when auto-detecting the database.
+_APK_MEMBER_HINTS = ('bgdb', 'bansheegz', 'bgdatabase', 'database', '.bytes')
+
+#: Members that can never hold the database.
+_APK_SKIP_SUFFIXES = ('.png', '.jpg', '.jpeg', '.webp', '.ogg', '.mp3', '.wav',
+                      '.dex', '.so', '.xml', '.arsc', '.ttf', '.otf')
+
+#: Leading bytes of member formats that are never the database (checked on
+#: the first _APK_HEADER_SIZE bytes, before a member is decompressed).
+_APK_SKIP_MAGIC = (b'UnityFS', b'UnityWeb', b'UnityRaw', b'\x89PNG', b'\xff\xd8\xff',
+                   b'OggS', b'RIFF', b'PK\x03\x04', b'dex\n', b'\x7fELF',
+                   b'\x03\x00\x08\x00', b'\x02\x00\x0c\x00')
+
+_APK_HEADER_SIZE = 64
+
+
+def _payload_span(raw: Union[bytes, bytearray]) -> Optional[Tuple[int, int]]:
+    """(start, end) of the database in ``raw``; see clean_bgdb_payload()."""
+    kokr = raw.find(b'koKR')
+    if kokr < 0 or _NAME_MAP_SIG_RE.search(raw) is None:
+        return None
+    size = len(raw)
+    # The size prefix sits before the payload, so before koKR; its value
+    # must reach the end of the buffer (up to 3 bytes of alignment).
+    prefix = memoryview(raw)[:kokr - kokr % 4]
+    try:
+        for i, (n,) in enumerate(struct.iter_unpack('<I', prefix)):
+            p = 4 * i
+            if 0 <= size - (p + 4 + n) <= 3:
+                return p + 4, p + 4 + n
+    finally:
+        prefix.release()
+    return 0, size
+
+
+def clean_bgdb_payload(raw: Union[bytes, bytearray]) -> Optional[memoryview]:
+    """Locate the BGDatabase payload in an asset read out of the APK.
+
+    An exported TextAsset stores the database as ``[uint32 size][payload]``
+    (optionally 4-byte aligned) at the end of the object, preceded by the
+    asset name.  The first 4-aligned uint32 before the 'koKR' block whose
+    value runs exactly to the end of the buffer (give or take the padding)
+    is taken as that size prefix.  A buffer without such a wrapper is
+    returned whole.
+
+    Returns a zero-copy view of the payload, or None when the buffer has
+    no 'koKR' block or name_map header and so is not the database.
+    """
+    span = _payload_span(raw)
+    if span is None:
+        return None
+    return memoryview(raw)[span[0]:span[1]]
+
+
+def _member_header(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+    """The first _APK_HEADER_SIZE bytes of a member (only those are inflated)."""
+    with zf.open(info) as fh:
+        return fh.read(_APK_HEADER_SIZE)
+
+
+def _read_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytearray:
+    """Decompress one archive member straight into a preallocated buffer."""
+    buf = bytearray(info.file_size)
+    view = memoryview(buf)
+    pos = 0
+    with zf.open(info) as fh:
+        while pos < len(buf):
+            n = fh.readinto(view[pos:pos + (1 << 20)])
+            if not n:
+                break
+            pos += n
+    view.release()
+    return buf
+
+
+def find_apk_member(zf: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+    """Candidate database members of an APK, most likely first."""
+    def rank(info: zipfile.ZipInfo):
+        name = info.filename.lower()
+        hint = next((i for i, h in enumerate(_APK_MEMBER_HINTS) if h in name),
+                    len(_APK_MEMBER_HINTS))
+        return (hint, -info.file_size)
+
+    members = [info for info in zf.infolist()
+               if not info.is_dir()
+               and not info.filename.startswith('META-INF/')
+               and not info.filename.lower().endswith(_APK_SKIP_SUFFIXES)]
+    return sorted(members, key=rank)
+
+
+@_instrumented(rows=_no_rows)
+def load_apk_binary(apk, member: Optional[str] = None) -> bytearray:
+    """Stream the BGDatabase asset out of an APK without touching disk.
+
+    Parameters
+    ----------
+    apk : str, Path or binary file object
+        The game APK (any zip archive).
+    member : str, optional
+        Archive member holding the database.  Auto-detected when omitted:
+        members are tried in find_apk_member() order until one contains
+        the database.  Members whose header shows another format (UnityFS
+        bundles, images, audio, dex, ...) are skipped before they are
+        decompressed.
+
+    Returns
+    -------
+    bytearray
+        The cleaned database, ready for detect_offsets()/detect_layout().
+        It is the decompression buffer itself, trimmed in place, so the
+        database is never copied.
+
+    Raises
+    ------
+    FileNotFoundError
+        No member of the archive contains the database.
+    """
+    with zipfile.ZipFile(apk) as zf:
+        if member is not None:
+            candidates = [zf.getinfo(member)]
+        else:
+            candidates = find_apk_member(zf)
+        for info in candidates:
+            if _member_header(zf, info).startswith(_APK_SKIP_MAGIC):
+                continue
+            raw = _read_member(zf, info)
+            span = _payload_span(raw)
+            if span is None:
+                continue
+            start, end = span
+            del raw[end:]
+            del raw[:start]
+            return raw
+    where = member or 'any member'
+    raise FileNotFoundError(
+        f'BGDatabase not found in {where} of {apk} '
+        '(compressed UnityFS bundles must be unpacked first)')
+
+
 # ---------------------------------------------------------------------------
 # Field-level helpers
 # ---------------------------------------------------------------------------
@@ -234,11 +902,257 @@ def _field_data_region(data: bytes, field_off: int):
     return data_region, data_size, actual_start
 
 
+# ---------------------------------------------------------------------------
+# Bulk column decoders
+# ---------------------------------------------------------------------------
+
+#: True when the host byte order matches the little-endian file format.
+_NATIVE_LE: bool = sys.byteorder == 'little'
+
+
+def _typed_column(data: bytes, start: int, count: int, typecode: str) -> array:
+    """Decode ``count`` LE items of ``typecode`` starting at ``start``.
+
+    The column is copied straight out of a memoryview slice with a single
+    ``array.frombytes`` call, so no per-row Python objects are created.
+
+    Parameters
+    ----------
+    data : bytes
+        Full binary blob (any object supporting the buffer protocol).
+    start : int
+        Byte offset of the first item.
+    count : int
+        Number of items to decode.
+    typecode : str
+        ``array`` typecode: 'i' (int32), 'I' (uint32), 'f' (float32) or
+        'B' (uint8).
+
+    Returns
+    -------
+    array.array
+        Typed array of ``count`` items (shorter if the buffer runs out).
+    """
+    col = array(typecode)
+    end = start + count * col.itemsize
+    col.frombytes(memoryview(data)[start:end])
+    if not _NATIVE_LE and col.itemsize > 1:
+        col.byteswap()
+    return col
+
+
+@_instrumented(field_arg=True)
+def decode_int32_column(data: bytes, field_off: int) -> array:
+    """Decode an int32 field into ``array('i')`` in one bulk operation."""
+    _, data_size, actual_start = _field_data_region(data, field_off)
+    return _typed_column(data, actual_start, data_size // 4, 'i')
+
+
+@_instrumented(field_arg=True)
+def decode_float32_column(data: bytes, field_off: int) -> array:
+    """Decode a float32 field into ``array('f')`` in one bulk operation."""
+    _, data_size, actual_start = _field_data_region(data, field_off)
+    return _typed_column(data, actual_start, data_size // 4, 'f')
+
+
+@_instrumented(field_arg=True)
+def decode_bool_column(data: bytes, field_off: int) -> array:
+    """Decode a bool field into ``array('B')`` (0/1 per row) in one bulk operation."""
+    _, data_size, actual_start = _field_data_region(data, field_off)
+    return _typed_column(data, actual_start, data_size, 'B')
+
+
+# ---------------------------------------------------------------------------
+# Nested (ragged) fields
+# ---------------------------------------------------------------------------
+
+class RaggedArray:
+    """Variable-length rows stored as one flat typed array plus offsets.
+
+    Row ``i`` is ``values[offsets[i]:offsets[i + 1]]``.  ``row(i)`` returns a
+    zero-copy typed memoryview; indexing returns a plain list so the object
+    stays a drop-in replacement for the old list-of-lists.
+    """
+
+    __slots__ = ('values', 'offsets')
+
+    def __init__(self, values: array, offsets: array):
+        self.values = values
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def _bounds(self, i: int) -> Tuple[int, int]:
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError('RaggedArray index out of range')
+        return self.offsets[i], self.offsets[i + 1]
+
+    def row(self, i: int) -> memoryview:
+        """Zero-copy typed view of row ``i``."""
+        a, b = self._bounds(i)
+        return memoryview(self.values)[a:b]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        a, b = self._bounds(i)
+        return self.values[a:b].tolist()
+
+    def __iter__(self):
+        values, offsets = self.values, self.offsets
+        for i in range(len(self)):
+            yield values[offsets[i]:offsets[i + 1]].tolist()
+
+    def tolist(self) -> list:
+        return list(self)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RaggedArray):
+            return NotImplemented
+        if self.offsets == other.offsets and self.values == other.values:
+            return True
+        return self.tolist() == other.tolist()
+
+    __hash__ = None
+
+    def shifted(self, n: int = 1) -> 'RaggedArray':
+        """Rows moved down by ``n``: row i becomes row i+n, rows 0..n-1 empty.
+
+        Only the offsets are rebuilt; the value buffer is shared.
+        """
+        offsets = array(self.offsets.typecode, [self.offsets[0]] * n)
+        offsets.extend(self.offsets)
+        return RaggedArray(self.values, offsets)
+
+    def lengths(self) -> array:
+        """Number of values in each row."""
+        offs = self.offsets
+        return array('i', map(operator.sub, offs[1:], offs[:-1]))
+
+    def row_sums(self) -> list:
+        """Sum of each row, from one running total over the value buffer."""
+        totals = [0]
+        totals.extend(accumulate(self.values))
+        return [totals[b] - totals[a]
+                for a, b in zip(self.offsets, self.offsets[1:])]
+
+    def _row_extreme(self, better, default) -> list:
+        """Best value of each row under ``better`` (``default`` for empty
+        rows), from one walk over the value buffer.  Offsets never
+        decrease, so the rows are met in order along the way."""
+        n = len(self)
+        out = [default] * n
+        if not n:
+            return out
+        offsets = self.offsets
+        row, end, best = 0, offsets[1], None
+        view = memoryview(self.values)[offsets[0]:offsets[n]]
+        for pos, v in enumerate(view, offsets[0]):
+            while pos >= end:
+                if best is not None:
+                    out[row] = best
+                    best = None
+                row += 1
+                end = offsets[row + 1]
+            if best is None or better(v, best):
+                best = v
+        if best is not None:
+            out[row] = best
+        return out
+
+    def row_min(self, default=None) -> list:
+        """Minimum of each row (``default`` for empty rows), in one pass."""
+        return self._row_extreme(operator.lt, default)
+
+    def row_max(self, default=None) -> list:
+        """Maximum of each row (``default`` for empty rows), in one pass."""
+        return self._row_extreme(operator.gt, default)
+
+
+@_instrumented(field_arg=True)
+def decode_nested_strings(data: bytes, field_off: int) -> List[str]:
+    """Decode a nested string field -> one UTF-8 string per row."""
+    rows = decode_nested_column(data, field_off, 'B')
+    return [str(rows.row(i), 'utf-8', errors='replace') for i in range(len(rows))]
+
+
+@_instrumented(field_arg=True)
+def decode_nested_column(data: bytes, field_off: int,
+                         typecode: str) -> RaggedArray:
+    """Decode a nested array field into a RaggedArray in bulk.
+
+    Layout inside the data block:
+        [4-byte LE uint32 row_count]
+        [row_count * 8 bytes: (LE uint32 row_idx, LE uint32 byte_offset)]
+        [data section]
+
+    A row spans from its byte_offset to the next larger one (or the end of
+    the data section); rows without an entry are empty.  When entries are
+    in row order with item-aligned offsets (the normal case), the whole
+    data section becomes the value buffer in a single copy.
+
+    Parameters
+    ----------
+    data : bytes
+        Full binary blob.
+    field_off : int
+        Byte offset of the field's name_length prefix.
+    typecode : str
+        ``array`` typecode of the items: 'i', 'f' or 'B' (bytes/strings).
+    """
+    _, data_size, actual_start = _field_data_region(data, field_off)
+    end = actual_start + data_size
+    row_count = struct.unpack_from('<I', data, actual_start)[0]
+    flat = _typed_column(data, actual_start + 4, row_count * 2, 'I')
+    row_ids = flat[0::2]
+    byte_offs = flat[1::2]
+    ds_start = actual_start + 4 + row_count * 8
+    ds_len = max(0, end - ds_start)
+    itemsize = array(typecode).itemsize
+
+    in_order = (all(map(operator.eq, row_ids, range(row_count)))
+                and all(map(operator.le, byte_offs, byte_offs[1:]))
+                and all(off % itemsize == 0 for off in byte_offs)
+                and ds_len % itemsize == 0
+                and (not byte_offs or byte_offs[-1] <= ds_len))
+    if in_order:
+        values = _typed_column(data, ds_start, ds_len // itemsize, typecode)
+        offsets = array('I', (off // itemsize for off in byte_offs))
+        offsets.append(len(values))
+        return RaggedArray(values, offsets)
+
+    # General case: rows sorted by byte offset, last entry per row wins.
+    order = sorted(range(row_count), key=byte_offs.__getitem__)
+    slices = {}
+    for pos, j in enumerate(order):
+        bend = byte_offs[order[pos + 1]] if pos + 1 < row_count else ds_len
+        slices[row_ids[j]] = (byte_offs[j], bend)
+
+    view = memoryview(data)
+    values = array(typecode)
+    offsets = array('I', [0])
+    for row_idx in range(row_count):
+        s, e = slices.get(row_idx, (0, 0))
+        s = min(s, ds_len)
+        e = min(max(e, s), ds_len)
+        n = (e - s) // itemsize
+        values.frombytes(view[ds_start + s:ds_start + s + n * itemsize])
+        offsets.append(len(values))
+    if not _NATIVE_LE and itemsize > 1:
+        values.byteswap()
+    return RaggedArray(values, offsets)
+
+
 # ---------------------------------------------------------------------------
 # Typed field parsers
 # ---------------------------------------------------------------------------
 
-def parse_int32_field(data: bytes, field_off: int) -> list:
+@_instrumented(field_arg=True)
+def parse_int32_field(data: bytes, field_off: int, as_list: bool = False):
     """Parse an int32 field (4 bytes per row, LE signed).
 
     Parameters
@@ -247,19 +1161,20 @@ def parse_int32_field(data: bytes, field_off: int) -> list:
         Full binary blob.
     field_off : int
         Byte offset of the field's name_length prefix.
+    as_list : bool
+        Return a plain ``list[int]`` instead of a typed array.
 
     Returns
     -------
-    list[int]
+    array.array('i') or list[int]
         One signed int32 per row.
     """
-    _, data_size, actual_start = _field_data_region(data, field_off)
-    count = data_size // 4
-    return [struct.unpack_from('<i', data, actual_start + i * 4)[0]
-            for i in range(count)]
+    col = decode_int32_column(data, field_off)
+    return col.tolist() if as_list else col
 
 
-def parse_float32_field(data: bytes, field_off: int) -> list:
+@_instrumented(field_arg=True)
+def parse_float32_field(data: bytes, field_off: int, as_list: bool = False):
     """Parse a float32 field (4 bytes per row, LE IEEE-754).
 
     Parameters
@@ -268,19 +1183,20 @@ def parse_float32_field(data: bytes, field_off: int) -> list:
         Full binary blob.
     field_off : int
         Byte offset of the field's name_length prefix.
+    as_list : bool
+        Return a plain ``list[float]`` instead of a typed array.
 
     Returns
     -------
-    list[float]
+    array.array('f') or list[float]
         One float32 per row.
     """
-    _, data_size, actual_start = _field_data_region(data, field_off)
-    count = data_size // 4
-    return [struct.unpack_from('<f', data, actual_start + i * 4)[0]
-            for i in range(count)]
+    col = decode_float32_column(data, field_off)
+    return col.tolist() if as_list else col
 
 
-def parse_bool_field(data: bytes, field_off: int) -> list:
+@_instrumented(field_arg=True)
+def parse_bool_field(data: bytes, field_off: int, as_array: bool = False):
     """Parse a bool field (1 byte per row).
 
     Parameters
@@ -289,22 +1205,80 @@ def parse_bool_field(data: bytes, field_off: int) -> list:
         Full binary blob.
     field_off : int
         Byte offset of the field's name_length prefix.
+    as_array : bool
+        Return the raw ``array('B')`` of 0/1 bytes instead of a list of
+        bools (no per-row objects; wrap items in ``bool()`` before
+        serializing).
 
     Returns
     -------
-    list[bool]
-        One bool per row (non-zero byte -> True).
+    list[bool] or array.array('B')
+        One flag per row (non-zero byte -> True).
     """
-    _, data_size, actual_start = _field_data_region(data, field_off)
-    return [bool(data[actual_start + i]) for i in range(data_size)]
+    col = decode_bool_column(data, field_off)
+    return col if as_array else list(map(bool, col))
 
 
-def parse_rank_field(data: bytes, field_off: int, row_count: int) -> list:
-    """Parse the rank field with its special 9-bytes-per-row encoding.
+@dataclass
+class RankColumn:
+    """Rank ints and grade letters decoded from one rank block."""
+    ranks: Sequence[int]   # strided int32 view over the pairs (array on BE hosts)
+    grades: str            # one letter per row, e.g. 'E', 'S', 'Z'
+
+    def __len__(self) -> int:
+        return len(self.grades)
+
+
+@_instrumented(field_arg=True)
+def decode_rank_column(data: bytes, field_off: int) -> RankColumn:
+    """Decode a rank field's 9-bytes-per-row block without searching it.
 
     Layout inside the data block:
+        [4-byte LE uint32 n]
+        [n * 8 bytes: (int32, int32 rank)]
+        [n bytes: ASCII grade letters]
+
+    The ranks are a stride-2 int32 view of the pair region (no copy on
+    little-endian hosts) and the grades are the trailing n bytes, located
+    from the embedded count alone.
+
+    Raises
+    ------
+    ValueError
+        If data_size is not 9*n + 4 for the embedded n.
+    """
+    _, data_size, start = _field_data_region(data, field_off)
+    n = struct.unpack_from('<I', data, start)[0]
+    if data_size != 9 * n + 4:
+        raise ValueError(f'field at {field_off} is not a rank block '
+                         f'(data_size {data_size}, embedded rows {n})')
+    pairs_start = start + 4
+    letters_start = pairs_start + 8 * n
+    if _NATIVE_LE:
+        ranks = memoryview(data)[pairs_start:letters_start].cast('i')[1::2]
+    else:
+        ranks = _typed_column(data, pairs_start, 2 * n, 'i')[1::2]
+    grades = str(region_view(data, letters_start, letters_start + n),
+                 'ascii', errors='replace')
+    return RankColumn(ranks=ranks, grades=grades)
+
+
+def _fit_ranks(ranks: Sequence[int], row_count: int) -> array:
+    """``ranks`` as an array('i') of exactly row_count items (0-padded)."""
+    col = array('i', ranks[:row_count])
+    if len(col) < row_count:
+        col.extend(array('i', [0]) * (row_count - len(col)))
+    return col
+
+
+@_instrumented(field_arg=True)
+def parse_rank_field(data: bytes, field_off: int, row_count: int,
+                     as_list: bool = False):
+    """Parse the rank field with its special 9-bytes-per-row encoding.
+
+    The ranks of decode_rank_column(), which reads the block layout:
         [4-byte LE uint32 embedded_row_count]
-        [flat bytes: pairs of (something, rank_value) as int32s]
+        [pairs of (something, rank_value) as int32s][grade letters]
 
     rank[i] = flat_int32s[2*i + 1]
 
@@ -315,44 +1289,85 @@ def parse_rank_field(data: bytes, field_off: int, row_count: int) -> list:
     field_off : int
         Byte offset of the field's name_length prefix.
     row_count : int
-        Expected number of rows (used to bound index access).
+        Expected number of rows; the embedded row count is truncated or
+        0-padded to it.
+    as_list : bool
+        Return a plain ``list[int]`` instead of a typed array.
 
     Returns
     -------
-    list[int]
-        Rank value per row; 0 for any out-of-bounds index.
-    """
-    _, data_size, actual_start = _field_data_region(data, field_off)
-
-    # Skip the embedded row_count uint32 (4 bytes)
-    flat_start = actual_start + 4
-    flat_bytes = data[flat_start: actual_start + data_size]
-    n_int32 = len(flat_bytes) // 4
-    flat_ints = [struct.unpack_from('<i', flat_bytes, j * 4)[0]
-                 for j in range(n_int32)]
+    array.array('i') or list[int]
+        Rank value per row; 0 for rows the block does not cover.
 
-    ranks = []
-    for i in range(row_count):
-        idx = 2 * i + 1
-        ranks.append(flat_ints[idx] if idx < len(flat_ints) else 0)
-    return ranks
+    Raises
+    ------
+    ValueError
+        If the field is not a rank block (see decode_rank_column()).
+    """
+    ranks = _fit_ranks(decode_rank_column(data, field_off).ranks, row_count)
+    return ranks.tolist() if as_list else ranks
 
 
 # ---------------------------------------------------------------------------
 # Auto-detect parser
 # ---------------------------------------------------------------------------
 
-def auto_parse_field(data: bytes, field_off: int) -> tuple:
-    """Auto-detect field type from data_size vs implied row count and parse.
+_SCALAR_PARSERS = {
+    'int32':   parse_int32_field,
+    'float32': parse_float32_field,
+    'bool':    lambda data, off, as_list=False: parse_bool_field(data, off, as_array=not as_list),
+}
+
+
+#: float32 exponent range accepted as a real float by _guess_scalar_type()
+#: (|v| roughly 1e-9 .. 1e10); small ints read as floats are denormals.
+_FLOAT_EXP_MIN = 97
+_FLOAT_EXP_MAX = 160
+
+
+def _guess_scalar_type(data: bytes, field_off: int) -> str:
+    """Guess 'int32', 'float32' or 'bool' for a field of unknown type.
+
+    Only used when the field's type marker is not in the registry.  The
+    data block is looked at once, as raw uint32 words (a zero-copy view on
+    little-endian hosts), without decoding it as either type:
+
+        data_size % 4 != 0                       -> bool (1 byte/row)
+        every non-zero word has a float32
+        exponent in the plausible range          -> float32
+        otherwise (denormal, NaN/inf, tiny/huge) -> int32
+
+    Small and negative ints fail the exponent test on their first word, so
+    int columns are usually rejected after a few rows.
+    """
+    _, data_size, start = _field_data_region(data, field_off)
+    if data_size % 4 != 0:
+        return 'bool'
+    count = data_size // 4
+    if _NATIVE_LE:
+        words = memoryview(data)[start:start + 4 * count].cast('I')
+    else:
+        words = _typed_column(data, start, count, 'I')
+    seen_value = False
+    for w in words:
+        if not w & 0x7FFFFFFF:
+            continue
+        exp = (w >> 23) & 0xFF
+        if exp < _FLOAT_EXP_MIN or exp > _FLOAT_EXP_MAX:
+            return 'int32'
+        seen_value = True
+    return 'float32' if seen_value else 'int32'
+
 
-    Heuristic:
-        data_size % 4 == 0 AND data_size // 4 rows look plausible -> try int32
-        data_size % 4 != 0 -> bool (1 byte/row)
-        For int32-sized blocks we try float32 vs int32 based on value ranges:
-            if all values are between -1e10 and 1e10 and many are non-integer
-            -> float32; otherwise -> int32.
+@_instrumented(field_arg=True, rows=_values_rows)
+def auto_parse_field(data: bytes, field_off: int, as_list: bool = False,
+                     registry: Optional['TypeMarkerRegistry'] = None) -> tuple:
+    """Parse a scalar field of unknown declared type with one decoder.
 
-    This is a best-effort heuristic; for known fields prefer the typed parsers.
+    The type comes from the field's separator type marker when
+    ``registry`` knows it; only otherwise is it guessed from the raw words
+    (see _guess_scalar_type()).  Either way the column is decoded exactly
+    once, with the parser for the chosen type.
 
     Parameters
     ----------
@@ -360,49 +1375,576 @@ def auto_parse_field(data: bytes, field_off: int) -> tuple:
         Full binary blob.
     field_off : int
         Byte offset of the field's name_length prefix.
+    as_list : bool
+        Return plain lists instead of typed arrays.
+    registry : TypeMarkerRegistry, optional
+        Calibrated marker registry (see TypeMarkerRegistry.calibrate()).
 
     Returns
     -------
-    tuple[str, list]
+    tuple[str, array.array | list]
         ('int32' | 'float32' | 'bool', parsed_values)
     """
-    _, data_size, actual_start = _field_data_region(data, field_off)
+    ftype = registry.type_of(data, field_off) if registry is not None else None
+    if ftype not in _SCALAR_PARSERS:
+        ftype = _guess_scalar_type(data, field_off)
+    return (ftype, _SCALAR_PARSERS[ftype](data, field_off, as_list=as_list))
 
-    if data_size == 0:
-        return ('int32', [])
 
-    if data_size % 4 != 0:
-        # Likely bool
-        values = [bool(data[actual_start + i]) for i in range(data_size)]
-        return ('bool', values)
+# ---------------------------------------------------------------------------
+# Column-oriented table access
+# ---------------------------------------------------------------------------
+
+#: Column decoders by declared type: fn(data, field_info) -> sequence.
+COLUMN_DECODERS = {
+    'int32':   lambda data, f: decode_int32_column(data, f.offset),
+    'float32': lambda data, f: decode_float32_column(data, f.offset),
+    'bool':    lambda data, f: decode_bool_column(data, f.offset),
+    'rank':    lambda data, f: parse_rank_field(data, f.offset, f.rows),
+    'nested_int32':   lambda data, f: decode_nested_column(data, f.offset, 'i'),
+    'nested_float32': lambda data, f: decode_nested_column(data, f.offset, 'f'),
+    'nested_string':  lambda data, f: decode_nested_strings(data, f.offset),
+}
+
+#: Type used when neither the marker nor a declaration gives one, keyed by
+#: FieldInfo.type.  4-byte columns are left to auto_parse_field(), which
+#: tells int32 from float32.
+_DEFAULT_COLUMN_TYPES = {'bool': 'bool'}
+
+
+class BGRow:
+    """Lightweight view of one table row; attributes index the columns.
+
+    ``row.index`` / ``row['index']`` read ``table.column('index')[row]``,
+    so only the columns a caller actually touches are ever decoded.
+    """
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: 'BGTable', row: int):
+        self._table = table
+        self._row = row
+
+    def __getattr__(self, name: str):
+        try:
+            return self._table.column(name)[self._row]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, name: str):
+        return self._table.column(name)[self._row]
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    def __repr__(self) -> str:
+        return f'<BGRow {self._table.key}[{self._row}]>'
+
+
+class BGTable:
+    """Column-oriented view of one catalogued table.
+
+    Columns are decoded on first access (with the decoder the registry
+    assigns to the field's type marker, else the one named in
+    ``column_types``, else from the catalogued field type) and cached as
+    typed arrays.  ``column_types`` values may also be callables
+    ``fn(table) -> sequence``; those define derived columns and may use a
+    name that is not a field (e.g. 'grade' from the rank region).
+
+    Parameters
+    ----------
+    data : bytes
+        Full binary blob.
+    info : TableInfo
+        Catalog entry for the table (see build_field_catalog()).
+    column_types : dict[str, str | callable], optional
+        Column name -> COLUMN_DECODERS key (used when the marker is not
+        known) or derived-column function.
+    registry : TypeMarkerRegistry, optional
+        Types columns from their separator type marker.
+    """
+
+    def __init__(self, data: bytes, info: TableInfo,
+                 column_types: Optional[dict] = None,
+                 registry: Optional['TypeMarkerRegistry'] = None):
+        self.data = data
+        self.info = info
+        self.column_types = dict(column_types or {})
+        self.registry = registry
+        self._columns: dict = {}
+        self._rank_columns: Dict[str, RankColumn] = {}
+
+    @classmethod
+    def from_offsets(cls, data: bytes, key: str, offsets: Dict[str, int],
+                     row_count: int,
+                     column_types: Optional[dict] = None,
+                     registry: Optional['TypeMarkerRegistry'] = None,
+                     ) -> 'BGTable':
+        """Build a table from a {field_name: offset} map (e.g. *_FIELDS)."""
+        fields = {}
+        for name, off in offsets.items():
+            _, ds, _ = _field_data_region(data, off)
+            fields[name] = FieldInfo(name, off, ds,
+                                     _infer_field_type(ds, row_count),
+                                     row_count, read_type_marker(data, off))
+        info = TableInfo(key=key, start=min(offsets.values(), default=0),
+                         row_count=row_count, fields=fields)
+        return cls(data, info, column_types, registry)
+
+    @property
+    def key(self) -> str:
+        return self.info.key
+
+    @property
+    def names(self) -> List[str]:
+        """Field names in file order followed by derived column names."""
+        derived = [n for n, t in self.column_types.items()
+                   if callable(t) and n not in self.info.fields]
+        return list(self.info.fields) + derived
+
+    def __len__(self) -> int:
+        return self.info.row_count
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.info.fields or callable(self.column_types.get(name))
+
+    def field(self, name: str) -> FieldInfo:
+        return self.info.fields[name]
+
+    def column(self, name: str):
+        """Decoded column ``name`` (decoded once, then cached).
+
+        Raises KeyError if the table has no such field or derived column.
+        """
+        col = self._columns.get(name)
+        if col is None:
+            col = self._columns[name] = self._decode(name)
+        return col
+
+    __getitem__ = column
+
+    def rank_column(self, name: str = 'rank') -> RankColumn:
+        """The rank block of field ``name``, decoded once.
+
+        The 'rank' column type and derived grade columns both read it, so
+        a rank block is only walked once per table.
+
+        Raises ValueError if the field is not a rank block.
+        """
+        rc = self._rank_columns.get(name)
+        if rc is None:
+            rc = decode_rank_column(self.data, self.field(name).offset)
+            self._rank_columns[name] = rc
+        return rc
+
+    def column_type(self, name: str) -> Optional[str]:
+        """Decoder used for ``name``: the registry type of its separator
+        marker, else its declared type, else one implied by the data size
+        (None -> derived column or auto_parse_field()).
+
+        Declared types are only a fallback for fields whose marker the
+        registry does not know; type_disagreements() lists the declared
+        columns whose marker says otherwise.
+        """
+        declared = self.column_types.get(name)
+        if callable(declared):
+            return None
+        f = self.info.fields[name]
+        ctype = self.registry.lookup(f.marker) if self.registry is not None else None
+        if ctype is None:
+            ctype = declared
+        if ctype is None:
+            ctype = _DEFAULT_COLUMN_TYPES.get(f.type)
+        return ctype
+
+    def type_disagreements(self) -> Dict[str, Tuple[str, str]]:
+        """name -> (declared type, marker type) for declared columns whose
+        separator marker maps to a different type in the registry (the
+        marker type is the one used)."""
+        if self.registry is None:
+            return {}
+        out = {}
+        for name, declared in self.column_types.items():
+            f = self.info.fields.get(name)
+            if f is None or not isinstance(declared, str):
+                continue
+            marker_type = self.registry.lookup(f.marker)
+            if marker_type is not None and marker_type != declared:
+                out[name] = (declared, marker_type)
+        return out
+
+    def _decode(self, name: str):
+        stats = _STATS
+        if stats is None:
+            return self._decode_column(name)
+        f = self.info.fields.get(name)
+        key = f"{name}@{f.offset}" if f else f"{name}@{self.key}"
+        return stats.call('BGTable.column', self._decode_column, (name,), {},
+                          key, f.size if f else 0)
+
+    def _decode_column(self, name: str):
+        ctype = self.column_types.get(name)
+        if callable(ctype):
+            return ctype(self)
+        ctype = self.column_type(name)
+        f = self.info.fields[name]
+        if ctype is None:
+            return auto_parse_field(self.data, f.offset)[1]
+        if ctype == 'rank':
+            return _fit_ranks(self.rank_column(name).ranks, len(self))
+        return COLUMN_DECODERS[ctype](self.data, f)
+
+    def decoded(self) -> List[str]:
+        """Names of the columns decoded so far."""
+        return list(self._columns)
+
+    def row(self, i: int) -> BGRow:
+        return BGRow(self, i)
+
+    def rows(self):
+        """Iterate BGRow views over every row."""
+        return (BGRow(self, i) for i in range(len(self)))
+
+    def get(self, name: str, i: int, default=None):
+        """``column(name)[i]``, or *default* when the row is out of range."""
+        col = self.column(name)
+        return col[i] if i < len(col) else default
+
+
+def load_tables(data: bytes, catalog: Dict[str, TableInfo],
+                column_types: Optional[Dict[str, dict]] = None,
+                registry: Optional['TypeMarkerRegistry'] = None,
+                ) -> Dict[str, BGTable]:
+    """Wrap every catalogued table in a BGTable (nothing is decoded yet).
+
+    ``column_types`` maps table_key -> column_types for that table.
+    """
+    column_types = column_types or {}
+    return {key: BGTable(data, info, column_types.get(key), registry)
+            for key, info in catalog.items()}
+
+
+# ---------------------------------------------------------------------------
+# Table diff
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RowChange:
+    """One changed cell: ``field`` may carry an element index (aEffect[1])."""
+    key: int
+    field: str
+    old: object
+    new: object
+
+
+@dataclass
+class TableDiff:
+    """Differences between two builds of one table (see diff_tables())."""
+    table: str
+    added_rows: List[int]
+    removed_rows: List[int]
+    added_fields: List[str]
+    removed_fields: List[str]
+    changes: List[RowChange]
+
+    def __bool__(self) -> bool:
+        return bool(self.added_rows or self.removed_rows or self.added_fields
+                    or self.removed_fields or self.changes)
+
+
+def _row_keys(table: BGTable, key_column: Optional[str]) -> list:
+    if key_column and key_column in table:
+        keys = list(table[key_column])
+        if len(keys) == len(table) and len(set(keys)) == len(keys):
+            return keys
+    return list(range(len(table)))
+
+
+def _same(a, b) -> bool:
+    return a == b or (a != a and b != b)   # NaN == NaN
+
+
+def _cell(col, i: int):
+    if i >= len(col):
+        return None
+    value = col[i]
+    return value.tolist() if isinstance(value, (array, memoryview)) else value
+
+
+def diff_tables(old: BGTable, new: BGTable, key_column: Optional[str] = 'index',
+                renames: Optional[Dict[str, str]] = None) -> TableDiff:
+    """Compare two builds of a table column by column.
+
+    Rows are matched by ``key_column`` (row position when the table has no
+    such column or its values are not unique) and fields by name, with
+    ``renames`` mapping old field names to new ones.  Whole columns are
+    compared first, so only columns that differ are walked row by row;
+    list cells (nested columns) are compared element by element when their
+    lengths agree.
+    """
+    renames = renames or {}
+    old_keys = _row_keys(old, key_column)
+    new_keys = _row_keys(new, key_column)
+    old_pos = {k: i for i, k in enumerate(old_keys)}
+    new_pos = {k: i for i, k in enumerate(new_keys)}
+    aligned = old_keys == new_keys
+    pairs = [(old_pos[k], i, k) for i, k in enumerate(new_keys) if k in old_pos]
+
+    old_names = {renames.get(n, n): n for n in old.names}
+    new_names = new.names
+    changes: List[RowChange] = []
+    for name in new_names:
+        if name not in old_names:
+            continue
+        a, b = old[old_names[name]], new[name]
+        if aligned and len(a) == len(b) and a == b:
+            continue
+        for i, j, key in pairs:
+            x, y = _cell(a, i), _cell(b, j)
+            if isinstance(x, list) and isinstance(y, list) and len(x) == len(y):
+                changes.extend(RowChange(key, f'{name}[{e}]', u, v)
+                               for e, (u, v) in enumerate(zip(x, y))
+                               if not _same(u, v))
+            elif not _same(x, y):
+                changes.append(RowChange(key, name, x, y))
+
+    return TableDiff(
+        table=new.key,
+        added_rows=[k for k in new_keys if k not in old_pos],
+        removed_rows=[k for k in old_keys if k not in new_pos],
+        added_fields=[n for n in new_names if n not in old_names],
+        removed_fields=[old_names[n] for n in old_names if n not in new_names],
+        changes=changes,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Discovery dump
+# ---------------------------------------------------------------------------
+
+DUMP_VERSION = 1
+DUMP_COLUMNS_FILE = 'columns.bin'
+DUMP_MANIFEST_FILE = 'catalog.json'
+
+
+@_instrumented(rows=_no_rows)
+def write_discovery_dump(data: bytes, out_dir: Union[str, Path],
+                         catalog: Optional[Dict[str, TableInfo]] = None,
+                         registry: Optional['TypeMarkerRegistry'] = None,
+                         ) -> Path:
+    """Dump every catalogued table and field to a columnar directory.
+
+    ``columns.bin`` holds each field record (name, header, data and the
+    trailing separator) copied verbatim, table after table, so the dump is
+    parsed with the same decoders as the binary and nothing is decoded up
+    front.  ``catalog.json`` holds the catalog re-based onto columns.bin,
+    the marker registry and the resolved column type of every field.
+
+    Parameters
+    ----------
+    data : bytes
+        Full binary blob.
+    out_dir : str or Path
+        Directory to write (created if missing).
+    catalog : dict[str, TableInfo], optional
+        Precomputed build_field_catalog() result.
+    registry : TypeMarkerRegistry, optional
+        Used to resolve the recorded column types.
+
+    Returns
+    -------
+    Path
+        Path of the written catalog.json.
+    """
+    if catalog is None:
+        catalog = build_field_catalog(data)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    view = memoryview(data)
+    tables: Dict[str, TableInfo] = {}
+    column_types: Dict[str, Dict[str, Optional[str]]] = {}
+    tmp = out / (DUMP_COLUMNS_FILE + '.tmp')
+    with open(tmp, 'wb') as fh:
+        pos = 0
+        for key, table in catalog.items():
+            fields = {}
+            for name, f in table.fields.items():
+                end = next_field_offset(data, f.offset)
+                fh.write(view[f.offset:end])
+                fields[name] = FieldInfo(name, pos, f.size, f.type, f.rows,
+                                         f.marker)
+                pos += end - f.offset
+            start = min((f.offset for f in fields.values()), default=pos)
+            tables[key] = TableInfo(key=key, start=start,
+                                    row_count=table.row_count, fields=fields)
+            bg = BGTable(data, table, registry=registry)
+            column_types[key] = {name: bg.column_type(name)
+                                 for name in table.fields}
+    os.replace(tmp, out / DUMP_COLUMNS_FILE)
+
+    manifest = {
+        'version': DUMP_VERSION,
+        'source': {'sha256': binary_digest(data), 'size': len(data)},
+        'registry': registry.to_dict() if registry is not None else {},
+        'column_types': column_types,
+        'tables': catalog_to_dict(tables),
+    }
+    path = out / DUMP_MANIFEST_FILE
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=1),
+                   encoding='utf-8')
+    os.replace(tmp, path)
+    return path
+
+
+def load_discovery_dump(dump_dir: Union[str, Path],
+                        column_types: Optional[Dict[str, dict]] = None,
+                        ) -> Dict[str, BGTable]:
+    """Open a write_discovery_dump() directory as {table_key: BGTable}.
+
+    columns.bin is memory-mapped and columns decode on first access; the
+    recorded column types apply unless overridden by ``column_types``
+    (table_key -> column_types, as for load_tables()).
+    """
+    base = Path(dump_dir)
+    manifest = json.loads((base / DUMP_MANIFEST_FILE).read_text(encoding='utf-8'))
+    if manifest.get('version') != DUMP_VERSION:
+        raise ValueError(f'unsupported discovery dump version in {base}')
+    columns_path = base / DUMP_COLUMNS_FILE
+    blob = (load_binary(columns_path, mmap_mode=True)
+            if columns_path.stat().st_size else b'')
+    registry = TypeMarkerRegistry.from_dict(manifest.get('registry', {}))
+    types = {key: {n: t for n, t in cols.items() if t is not None}
+             for key, cols in manifest.get('column_types', {}).items()}
+    for key, overrides in (column_types or {}).items():
+        types.setdefault(key, {}).update(overrides)
+    return load_tables(blob, catalog_from_dict(manifest['tables']), types,
+                       registry)
+
+
+# ---------------------------------------------------------------------------
+# Lazy string tables
+# ---------------------------------------------------------------------------
+
+#: Decoded entries kept per LazyStringTable (raw and color-stripped each).
+STRING_CACHE_SIZE = 4096
 
-    count = data_size // 4
 
-    # Read as both int32 and float32 and decide
-    int_vals = [struct.unpack_from('<i', data, actual_start + i * 4)[0]
-                for i in range(count)]
-    float_vals = [struct.unpack_from('<f', data, actual_start + i * 4)[0]
-                  for i in range(count)]
+class LazyStringTable(Mapping):
+    """Read-only str_id -> text mapping over a raw UTF-8 string blob.
 
-    # If any float is NaN or infinite -> not float32
-    import math
-    has_bad_float = any(math.isnan(v) or math.isinf(v) for v in float_vals)
-    if has_bad_float:
-        return ('int32', int_vals)
+    Only the blob (a memoryview, usually into the mapped binary) and three
+    parallel uint32 arrays are held: sorted ids and the [start, end) byte
+    range of each entry.  An entry is decoded the first time it is looked
+    up and kept in a small LRU cache, so tables can be built for every
+    locale or binary version without materialising their strings.
 
-    # If many values have a fractional part -> float32
-    non_integer = sum(1 for v in float_vals if v != int(v) if abs(v) < 1e10)
-    if non_integer > count * 0.1:
-        return ('float32', float_vals)
+    Behaves like the ``dict[int, str]`` the parsers used to return.
+    """
 
-    return ('int32', int_vals)
+    def __init__(self, blob, ids: array, starts: array, ends: array,
+                 errors: str = 'replace',
+                 cache_size: int = STRING_CACHE_SIZE):
+        self._blob = memoryview(blob)
+        self._ids = ids
+        self._starts = starts
+        self._ends = ends
+        self._errors = errors
+        self._decode = lru_cache(maxsize=cache_size)(self._decode_at)
+        self._clean = lru_cache(maxsize=cache_size)(self._clean_at)
+
+    @classmethod
+    def from_offsets(cls, blob, ids, offsets, end: int,
+                     errors: str = 'replace') -> 'LazyStringTable':
+        """Build a table from (id, start offset) pairs in id order.
+
+        Each entry ends where the next pair starts (or at ``end`` for the
+        last one).  Repeated ids keep their last entry, as a dict would.
+        """
+        starts = array('I', offsets)
+        ends = starts[1:]
+        ends.append(end)
+        ids = array('I', ids)
+        if len(set(ids)) != len(ids):
+            keep = [i for i in range(len(ids))
+                    if i + 1 == len(ids) or ids[i + 1] != ids[i]]
+            ids = array('I', [ids[i] for i in keep])
+            starts = array('I', [starts[i] for i in keep])
+            ends = array('I', [ends[i] for i in keep])
+        return cls(blob, ids, starts, ends, errors=errors)
+
+    def _index(self, sid) -> int:
+        i = bisect_left(self._ids, sid)
+        if i < len(self._ids) and self._ids[i] == sid:
+            return i
+        return -1
+
+    def _decode_at(self, i: int) -> str:
+        return str(self._blob[self._starts[i]:self._ends[i]],
+                   'utf-8', self._errors)
+
+    def _clean_at(self, i: int) -> str:
+        return _COLOR_TAG_RE.sub('', self._decode(i)).strip()
+
+    def __getitem__(self, sid) -> str:
+        i = self._index(sid)
+        if i < 0:
+            raise KeyError(sid)
+        return self._decode(i)
+
+    def __contains__(self, sid) -> bool:
+        return self._index(sid) >= 0
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def get(self, sid, default=None):
+        i = self._index(sid)
+        return self._decode(i) if i >= 0 else default
+
+    def clean(self, sid, default: str = '') -> str:
+        """Return the entry with color tags stripped, or *default*."""
+        i = self._index(sid)
+        return self._clean(i) if i >= 0 else default
+
+    @property
+    def max_id(self) -> Optional[int]:
+        """Largest str_id in the table (None when empty)."""
+        return self._ids[-1] if self._ids else None
+
+    def prefetch(self, sids) -> int:
+        """Decode the given ids into the cache; returns how many exist."""
+        found = 0
+        for sid in sids:
+            i = self._index(sid)
+            if i >= 0:
+                self._decode(i)
+                found += 1
+        return found
+
+    def cache_info(self):
+        """LRU statistics of the raw decode cache."""
+        return self._decode.cache_info()
+
+    def offsets(self) -> Tuple[array, array, array]:
+        """The (ids, starts, ends) index; with the same blob it rebuilds
+        this table without reparsing (see parse_kokr_strings(index=...))."""
+        return self._ids, self._starts, self._ends
 
 
 # ---------------------------------------------------------------------------
 # String table parser
 # ---------------------------------------------------------------------------
 
-def parse_kokr_strings(data: bytes, kokr_off: int = KOKR_OFF) -> dict:
+@_instrumented
+def parse_kokr_strings(data: bytes, kokr_off: int = KOKR_OFF,
+                       index: Optional[Tuple[array, array, array]] = None,
+                       ) -> LazyStringTable:
     """Parse the koKR string table.
 
     Layout at kokr_off:
@@ -420,46 +1962,37 @@ def parse_kokr_strings(data: bytes, kokr_off: int = KOKR_OFF) -> dict:
         Full binary blob.
     kokr_off : int
         Byte offset of total_data_size. Defaults to KOKR_OFF (629160).
+    index : tuple of array, optional
+        LazyStringTable.offsets() of this table as parsed elsewhere (e.g.
+        by the parent of a worker process); the offset table is then not
+        read, only the string blob is mapped.
 
     Returns
     -------
-    dict[int, str]
-        Mapping str_id -> decoded UTF-8 string.
+    LazyStringTable
+        Mapping str_id -> UTF-8 string, decoded on first access.
     """
-    total_data_size = struct.unpack_from('<I', data, kokr_off)[0]
-    string_count = struct.unpack_from('<I', data, kokr_off + 4)[0]
+    total_data_size, string_count = struct.unpack_from('<II', data, kokr_off)
+    if index is not None:
+        str_data_start = kokr_off + 8 + string_count * 8
+        return LazyStringTable(region_view(data, str_data_start, len(data)), *index)
 
-    offset_table: dict = {}
-    for i in range(string_count):
-        entry_off = kokr_off + 8 + i * 8
-        sid = struct.unpack_from('<I', data, entry_off)[0]
-        boff = struct.unpack_from('<I', data, entry_off + 4)[0]
-        offset_table[sid] = boff
+    flat = _typed_column(data, kokr_off + 8, string_count * 2, 'I')
+    offset_table = dict(zip(flat[0::2], flat[1::2]))
+    sorted_sids = sorted(offset_table)
 
     str_data_start = kokr_off + 8 + string_count * 8
-
-    sorted_sids = sorted(offset_table.keys())
-    sid_to_next: dict = {}
-    for i, sid in enumerate(sorted_sids):
-        if i + 1 < len(sorted_sids):
-            sid_to_next[sid] = offset_table[sorted_sids[i + 1]]
-        else:
-            sid_to_next[sid] = total_data_size
-
-    strings: dict = {}
-    for sid in sorted_sids:
-        b0 = offset_table[sid]
-        b1 = sid_to_next[sid]
-        raw = data[str_data_start + b0: str_data_start + b1]
-        strings[sid] = raw.decode('utf-8', errors='replace')
-
-    return strings
+    blob = region_view(data, str_data_start, len(data))
+    return LazyStringTable.from_offsets(
+        blob, sorted_sids, map(offset_table.__getitem__, sorted_sids),
+        total_data_size)
 
 
 # ---------------------------------------------------------------------------
 # Name map parser
 # ---------------------------------------------------------------------------
 
+@_instrumented
 def parse_name_map(data: bytes, off: int = NAME_MAP_OFF) -> list:
     """Parse the global name_map into a flat list of (row_id, str_id) tuples.
 
@@ -482,21 +2015,154 @@ def parse_name_map(data: bytes, off: int = NAME_MAP_OFF) -> list:
     list[tuple[int, int]]
         [(row_id, str_id), ...] in file order.
     """
+    pairs = _name_map_pairs(data, off)
+    return list(zip(pairs[0::2], pairs[1::2]))
+
+
+def _name_map_pairs(data: bytes, off: int) -> array:
     entry_count = struct.unpack_from('<I', data, off)[0]
-    entries_start = off + 4
-    result = []
-    for i in range(entry_count):
-        entry_off = entries_start + i * 8
-        row_id = struct.unpack_from('<I', data, entry_off)[0]
-        str_id = struct.unpack_from('<I', data, entry_off + 4)[0]
-        result.append((row_id, str_id))
-    return result
+    return _typed_column(data, off + 4, entry_count * 2, 'I')
+
+
+@_instrumented
+def parse_name_map_str_ids(data: bytes, off: int = NAME_MAP_OFF,
+                           copy: bool = True) -> Sequence[int]:
+    """Return the str_id column of the name_map as one ``array('I')``.
+
+    This is what gather_table_string_ids() slices; the row_ids are not
+    needed for string lookup.  With ``copy=False`` it is a strided uint32
+    view straight over ``data`` instead (little-endian hosts only;
+    elsewhere an array is returned as usual).
+    """
+    if not copy and _NATIVE_LE:
+        entry_count = struct.unpack_from('<I', data, off)[0]
+        return memoryview(data)[off + 4:off + 4 + entry_count * 8].cast('I')[1::2]
+    return _name_map_pairs(data, off)[1::2]
 
 
 # ---------------------------------------------------------------------------
 # Table-level string accessor
 # ---------------------------------------------------------------------------
 
+class StringIdMatrix:
+    """A row_count x stride matrix of str_ids, resolved to text on demand.
+
+    Built by gather_table_string_ids().  Rows whose base str_id falls
+    outside the string table (or past the end of the name_map) hold -1 and
+    resolve to an empty list, as in get_table_strings().
+    """
+
+    __slots__ = ('ids', 'rows', 'stride', 'strings')
+
+    def __init__(self, ids: array, rows: int, stride: int, strings):
+        self.ids = ids
+        self.rows = rows
+        self.stride = stride
+        self.strings = strings
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.rows, self.stride)
+
+    def row_ids(self, r: int) -> array:
+        """str_ids of row *r* (all -1 when the row has no strings)."""
+        return self.ids[r * self.stride:(r + 1) * self.stride]
+
+    def text(self, r: int, c: int) -> str:
+        """Stripped text of cell (r, c); '' when missing."""
+        sid = self.ids[r * self.stride + c]
+        s = self.strings.get(sid, '') if sid >= 0 else ''
+        return s.strip() if s else ''
+
+    def row(self, r: int) -> List[str]:
+        """Stripped texts of row *r*; [] when the row has no strings."""
+        if self.stride == 0 or self.ids[r * self.stride] < 0:
+            return []
+        get = self.strings.get
+        return [(s.strip() if s else '')
+                for s in (get(sid, '') for sid in self.row_ids(r))]
+
+    def __getitem__(self, r: int) -> List[str]:
+        if not -self.rows <= r < self.rows:
+            raise IndexError(r)
+        return self.row(r % self.rows)
+
+    def __iter__(self):
+        return (self.row(r) for r in range(self.rows))
+
+    def tolist(self) -> List[List[str]]:
+        return [self.row(r) for r in range(self.rows)]
+
+
+#: Plain-dict string tables seen by _string_table_max_id():
+#: id(table) -> (table, len(table), max id).
+_DICT_MAX_IDS: Dict[int, tuple] = {}
+
+
+def _string_table_max_id(strings) -> int:
+    """Largest str_id of ``strings`` (0 when empty).
+
+    LazyStringTable knows it; for a plain dict the key scan is done once
+    per dict (and redone only if its size changes).
+    """
+    max_id = getattr(strings, 'max_id', None)
+    if max_id is not None or not strings:
+        return max_id or 0
+    cached = _DICT_MAX_IDS.get(id(strings))
+    if cached is not None and cached[0] is strings and cached[1] == len(strings):
+        return cached[2]
+    max_id = max(strings.keys())
+    if len(_DICT_MAX_IDS) >= 8:
+        _DICT_MAX_IDS.clear()
+    _DICT_MAX_IDS[id(strings)] = (strings, len(strings), max_id)
+    return max_id
+
+
+@_instrumented
+def gather_table_string_ids(
+    str_ids,
+    strings,
+    map_start: int,
+    row_count: int,
+    stride: int = 5,
+) -> StringIdMatrix:
+    """Gather the str_ids of every row x stride cell of a table at once.
+
+    Parameters
+    ----------
+    str_ids : array.array or list[tuple[int, int]]
+        name_map str_id column from parse_name_map_str_ids() (a legacy
+        parse_name_map() list is accepted too).
+    strings : LazyStringTable or dict[int, str]
+        koKR string table; only consulted for its max id until a cell is
+        resolved (a dict's max id is computed once and cached).
+    map_start, row_count, stride
+        As in get_table_strings().
+
+    Returns
+    -------
+    StringIdMatrix
+    """
+    if str_ids and isinstance(str_ids[0], tuple):
+        str_ids = array('I', (sid for _row_id, sid in str_ids))
+    max_sid = _string_table_max_id(strings)
+    bases = str_ids[map_start:map_start + row_count]
+    n = len(bases)
+    # Cell (r, k) is bases[r] + k: fill each of the stride columns in one
+    # C-level pass, then blank the rows whose base is out of range.
+    ids = array('q', [-1]) * (row_count * stride)
+    for k in range(stride):
+        ids[k:n * stride:stride] = array('q', map(k.__add__, bases))
+    if stride:
+        missing = array('q', [-1]) * stride
+        for r in compress(range(n), map(max_sid.__lt__, bases)):
+            ids[r * stride:(r + 1) * stride] = missing
+    return StringIdMatrix(ids, row_count, stride, strings)
+
+
 def get_table_strings(
     name_map_entries: list,
     strings: dict,
@@ -516,8 +2182,9 @@ def get_table_strings(
 
     Parameters
     ----------
-    name_map_entries : list[tuple[int, int]]
-        Full name_map as returned by parse_name_map().
+    name_map_entries : list[tuple[int, int]] or array.array
+        Full name_map as returned by parse_name_map(), or its str_id column
+        from parse_name_map_str_ids().
     strings : dict[int, str]
         koKR string dict as returned by parse_kokr_strings().
     map_start : int
@@ -534,30 +2201,8 @@ def get_table_strings(
         Outer list has row_count elements; inner list has up to default_stride
         strings (stripped, may be empty strings if str_id not in koKR).
     """
-    max_kokr_sid = max(strings.keys()) if strings else 0
-
-    result = []
-    for row in range(row_count):
-        map_idx = map_start + row
-        if map_idx >= len(name_map_entries):
-            result.append([])
-            continue
-
-        _row_id, base_sid = name_map_entries[map_idx]
-
-        if base_sid > max_kokr_sid:
-            # This table's strings are outside the koKR range
-            result.append([])
-            continue
-
-        row_strs = []
-        for offset in range(default_stride):
-            sid = base_sid + offset
-            s = strings.get(sid, '')
-            row_strs.append(s.strip() if s else '')
-        result.append(row_strs)
-
-    return result
+    return gather_table_string_ids(name_map_entries, strings, map_start,
+                                   row_count, default_stride).tolist()
 
 
 # ---------------------------------------------------------------------------
@@ -580,7 +2225,8 @@ def read_field_name(data: bytes, field_off: int) -> str:
         The field name as an ASCII string.
     """
     name_len = struct.unpack_from('<I', data, field_off)[0]
-    return data[field_off + 4: field_off + 4 + name_len].decode('ascii', errors='replace')
+    return str(region_view(data, field_off + 4, field_off + 4 + name_len),
+               'ascii', errors='replace')
 
 
 # ---------------------------------------------------------------------------
@@ -615,6 +2261,71 @@ def next_field_offset(data: bytes, field_off: int) -> int:
     return end_of_data + 22  # skip inter-field separator
 
 
+def read_type_marker(data: bytes, field_off: int) -> Optional[int]:
+    """Return the 4-byte type marker that follows this field's data block.
+
+    It is the first part of the 22-byte separator skipped by
+    next_field_offset(); None if the separator lies past the end of data.
+    """
+    try:
+        sep = next_field_offset(data, field_off) - 22
+    except struct.error:
+        return None
+    if sep < 0 or sep + 4 > len(data):
+        return None
+    return struct.unpack_from('<I', data, sep)[0]
+
+
+class TypeMarkerRegistry:
+    """Type marker value -> column type (a COLUMN_DECODERS key).
+
+    The marker encoding is not documented, so it is learned from fields
+    whose type is already known (see calibrate()).  A marker seen with two
+    different types is treated as carrying no type information and is
+    never used for lookups; the conflict is kept for reporting.
+    """
+
+    def __init__(self, markers: Optional[Dict[int, str]] = None):
+        self.markers: Dict[int, str] = dict(markers or {})
+        self.conflicts: Dict[int, set] = {}
+
+    def learn(self, marker: Optional[int], ftype: str) -> None:
+        if marker is None:
+            return
+        if marker in self.conflicts:
+            self.conflicts[marker].add(ftype)
+            return
+        known = self.markers.get(marker)
+        if known is None:
+            self.markers[marker] = ftype
+        elif known != ftype:
+            del self.markers[marker]
+            self.conflicts[marker] = {known, ftype}
+
+    def lookup(self, marker: Optional[int]) -> Optional[str]:
+        return self.markers.get(marker)
+
+    def type_of(self, data: bytes, field_off: int) -> Optional[str]:
+        """Column type of the field at field_off, or None if unknown."""
+        return self.lookup(read_type_marker(data, field_off))
+
+    @classmethod
+    def calibrate(cls, data: bytes,
+                  known: Dict[int, str]) -> 'TypeMarkerRegistry':
+        """Learn markers from {field_offset: column_type} of known fields."""
+        registry = cls()
+        for off, ftype in known.items():
+            registry.learn(read_type_marker(data, off), ftype)
+        return registry
+
+    def to_dict(self) -> dict:
+        return {str(m): t for m, t in sorted(self.markers.items())}
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> 'TypeMarkerRegistry':
+        return cls({int(m): t for m, t in raw.items()})
+
+
 # ---------------------------------------------------------------------------
 # Dictionary Block parser (BGDatabase localization system)
 # ---------------------------------------------------------------------------
@@ -627,22 +2338,45 @@ class DictBlock:
     count: int
     pairs: List[Tuple[int, int]]
     blob_start: int
-    blob: bytes
+    blob: memoryview
+    keys: Optional[array] = None
+    offsets: Optional[array] = None
 
 
-def try_parse_dict_block(buf: bytes, start: int) -> Optional[DictBlock]:
+#: Number of evenly spaced pairs checked before the full monotonicity check.
+_DICT_SAMPLE_PAIRS = 32
+
+#: Upper bound on a dict block's entry count (real koKR: ~9,700; synthetic
+#: 100x builds: ~900,000).
+_DICT_MAX_COUNT = 2_000_000
+
+
+def try_parse_dict_block(buf: bytes, start: int,
+                         min_count: int = 1) -> Optional[DictBlock]:
     """Try to parse a dictionary block at the given byte offset.
 
     Block structure:
         [total_len: 4B][count: 4B][pairs: count * 8B (key, offset)][blob: total_len B]
+
+    Candidates are rejected in increasing order of cost: header bounds,
+    then a sampled monotonicity check over a few pairs, and only then a full
+    check over all pairs decoded in bulk into a uint32 array.
+
+    Parameters
+    ----------
+    buf : bytes
+        Full binary blob.
+    start : int
+        Candidate offset of total_len.
+    min_count : int
+        Reject blocks with fewer entries before decoding any pairs.
     """
     if start < 0 or start + 8 > len(buf):
         return None
 
-    total_len = struct.unpack_from('<I', buf, start)[0]
-    count = struct.unpack_from('<I', buf, start + 4)[0]
+    total_len, count = struct.unpack_from('<II', buf, start)
 
-    if not (1 <= count <= 200_000):
+    if not (max(1, min_count) <= count <= _DICT_MAX_COUNT):
         return None
     if not (1 <= total_len <= len(buf)):
         return None
@@ -653,23 +2387,35 @@ def try_parse_dict_block(buf: bytes, start: int) -> Optional[DictBlock]:
     if blob_end > len(buf):
         return None
 
-    pairs: List[Tuple[int, int]] = []
-    last_off = -1
-    last_key = -1
-    for i in range(count):
-        k = struct.unpack_from('<I', buf, pair_start + i * 8)[0]
-        off = struct.unpack_from('<I', buf, pair_start + i * 8 + 4)[0]
+    # Sampled check: keys and offsets must be non-decreasing across a few
+    # evenly spaced pairs, and offsets must stay inside the blob.
+    step = max(1, count // _DICT_SAMPLE_PAIRS)
+    last_key = last_off = -1
+    for i in list(range(0, count, step)) + [count - 1]:
+        k, off = struct.unpack_from('<II', buf, pair_start + i * 8)
         if off < last_off or k < last_key or off >= total_len:
             return None
-        pairs.append((k, off))
-        last_off = off
-        last_key = k
+        last_key, last_off = k, off
+
+    # Full check over every pair.
+    flat = _typed_column(buf, pair_start, count * 2, 'I')
+    keys = flat[0::2]
+    offs = flat[1::2]
+    if not (all(map(operator.le, keys, keys[1:]))
+            and all(map(operator.le, offs, offs[1:]))):
+        return None
+    # offsets are non-decreasing, so the last one bounds them all
+    if offs[-1] >= total_len:
+        return None
 
-    blob = buf[blob_start:blob_end]
+    pairs: List[Tuple[int, int]] = list(zip(keys, offs))
+    blob = region_view(buf, blob_start, blob_end)
     return DictBlock(start=start, total_len=total_len, count=count,
-                     pairs=pairs, blob_start=blob_start, blob=blob)
+                     pairs=pairs, blob_start=blob_start, blob=blob,
+                     keys=keys, offsets=offs)
 
 
+@_instrumented(rows=_no_rows)
 def find_dict_block_by_probe(buf: bytes, probe: str,
                               min_count: int = 1000) -> DictBlock:
     """Find a dictionary block by probing for a known string nearby.
@@ -686,35 +2432,41 @@ def find_dict_block_by_probe(buf: bytes, probe: str,
         if pos == -1:
             break
         search_pos = pos + 1
-
-        scan_start = pos + len(probe_bytes)
-        scan_end = min(pos + 700, len(buf) - 16)
-        for pair_start in range(scan_start, scan_end):
-            start = pair_start - 8
-            block = try_parse_dict_block(buf, start)
-            if block is None:
-                continue
-            if block.count < min_count:
-                continue
-            candidates.append(block)
+        candidates.extend(_dict_blocks_near(buf, pos, pos + len(probe_bytes),
+                                            min_count))
 
     if not candidates:
         raise RuntimeError(f"Dictionary block not found for probe='{probe}'")
 
-    candidates.sort(key=lambda b: (b.count, b.total_len), reverse=True)
-    return candidates[0]
+    return max(candidates, key=_dict_block_size)
 
 
-def decode_dict_block(block: DictBlock) -> Dict[int, str]:
-    """Decode a DictBlock into an {id: string} mapping."""
-    out: Dict[int, str] = {}
-    for i, (k, off) in enumerate(block.pairs):
-        next_off = (block.pairs[i + 1][1]
-                    if i + 1 < len(block.pairs)
-                    else block.total_len)
-        chunk = block.blob[off:next_off]
-        out[k] = chunk.decode('utf-8', errors='ignore')
-    return out
+def _dict_block_size(block: DictBlock) -> Tuple[int, int]:
+    return (block.count, block.total_len)
+
+
+def _dict_blocks_near(buf: bytes, pos: int, scan_start: int,
+                      min_count: int) -> List[DictBlock]:
+    """Every valid DictBlock whose pairs start in [scan_start, pos + 700)."""
+    blocks = []
+    scan_end = min(pos + 700, len(buf) - 16)
+    for pair_start in range(scan_start, scan_end):
+        block = try_parse_dict_block(buf, pair_start - 8, min_count=min_count)
+        if block is not None:
+            blocks.append(block)
+    return blocks
+
+
+@_instrumented
+def decode_dict_block(block: DictBlock) -> LazyStringTable:
+    """Index a DictBlock as a lazily decoded {id: string} mapping."""
+    if block.keys is not None:
+        keys, offs = block.keys, block.offsets
+    else:
+        keys = [k for k, _ in block.pairs]
+        offs = [off for _, off in block.pairs]
+    return LazyStringTable.from_offsets(block.blob, keys, offs,
+                                        block.total_len, errors='ignore')
 
 
 # ---------------------------------------------------------------------------
@@ -724,22 +2476,126 @@ def decode_dict_block(block: DictBlock) -> Dict[int, str]:
 _COLOR_TAG_RE = re.compile(r'\[[0-9A-Fa-f]{6}\]|\[-\]')
 
 
-def build_localization(data: bytes) -> Tuple[Dict[str, int], Dict[int, str]]:
+#: Probe strings and minimum entry counts of the two localization blocks.
+_LOCALIZATION_PROBES = {'name': 4000, 'koKR': 4000}
+
+
+#: A length-prefixed locale code (koKR, enUS, jaJP, ...), or 'name' (the
+#: localization key block).  Locale texts are stored as localization fields
+#: named by their code.
+_LOCALE_FIELD_RE = re.compile(rb'\x04\x00\x00\x00([a-z]{2}[A-Z]{2}|name)')
+
+
+def _scan_dict_blocks(data: bytes, min_count: int = 1000) -> Dict[str, DictBlock]:
+    """The 'name' block and every locale block, found in one pass.
+
+    Each hit is tried where its block normally starts (39 bytes after the
+    name prefix, at the field's data_size); only if that does not validate
+    is the window after the name probed as in find_dict_block_by_probe().
+    The largest block per name wins.  Returned in file order.
+    """
+    best: Dict[str, DictBlock] = {}
+    for m in _LOCALE_FIELD_RE.finditer(data):
+        locale = str(m.group(1), 'ascii')
+        block = try_parse_dict_block(data, m.start() + 39, min_count=min_count)
+        blocks = ([block] if block is not None
+                  else _dict_blocks_near(data, m.start(), m.end(), min_count))
+        for block in blocks:
+            if locale not in best or _dict_block_size(block) > _dict_block_size(best[locale]):
+                best[locale] = block
+    return dict(sorted(best.items(), key=lambda kv: kv[1].start))
+
+
+def _localization_starts(data: bytes,
+                         blocks: Dict[str, DictBlock]) -> Dict[str, int]:
+    """{'name': start, 'koKR': start} from _scan_dict_blocks() output,
+    probing only for a block the scan missed or found too small."""
+    starts = {}
+    for probe, min_count in _LOCALIZATION_PROBES.items():
+        block = blocks.get(probe)
+        if block is None or block.count < min_count:
+            block = find_dict_block_by_probe(data, probe, min_count=min_count)
+        starts[probe] = block.start
+    return starts
+
+
+@_instrumented(rows=_no_rows)
+def locate_localization_blocks(data: bytes) -> Dict[str, int]:
+    """Return the start offsets of the 'name' and 'koKR' dictionary blocks."""
+    return _localization_starts(data, _scan_dict_blocks(data))
+
+
+@_instrumented(rows=_no_rows)
+def locate_locale_blocks(data: bytes, min_count: int = 1000) -> Dict[str, int]:
+    """Find the dict block of every locale in one pass over the binary.
+
+    Returns
+    -------
+    dict[str, int]
+        locale -> dict block start, in file order.
+    """
+    return {locale: block.start for locale, block in
+            _scan_dict_blocks(data, min_count).items() if locale != 'name'}
+
+
+def locate_dict_blocks(data: bytes) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """(locate_localization_blocks(), locate_locale_blocks()) from a single
+    scan of the binary."""
+    blocks = _scan_dict_blocks(data)
+    return (_localization_starts(data, blocks),
+            {locale: block.start for locale, block in blocks.items()
+             if locale != 'name'})
+
+
+def _localization_block(data: bytes, probe: str,
+                        block_starts: Optional[Dict[str, int]]) -> DictBlock:
+    """Parse a localization block at a known start, locating it if that fails.
+
+    Raises RuntimeError if no block of at least the probe's minimum count
+    is found either way.
+    """
+    min_count = _LOCALIZATION_PROBES[probe]
+    start = (block_starts or {}).get(probe)
+    block = try_parse_dict_block(data, start) if start is not None else None
+    if block is None or block.count < min_count:
+        start = locate_localization_blocks(data).get(probe)
+        block = try_parse_dict_block(data, start) if start is not None else None
+    if block is None or block.count < min_count:
+        raise RuntimeError(f"localization block {probe!r} not found")
+    return block
+
+
+@_instrumented(rows=_values_rows)
+def build_localization(data: bytes,
+                       block_starts: Optional[Dict[str, int]] = None,
+                       ) -> Tuple[Dict[str, int], LazyStringTable]:
     """Build the full localization lookup from the binary payload.
 
     The BGDatabase stores two parallel dictionary blocks:
         - 'name' block:  numeric_id -> key string  (e.g. "sn97", "hn96", "Race26")
         - 'koKR' block:  numeric_id -> Korean text  (e.g. "발목 공격", "제리", "인간")
 
+    Parameters
+    ----------
+    data : bytes
+        Full binary blob.
+    block_starts : dict[str, int], optional
+        Known block offsets ({'name': ..., 'koKR': ...}), e.g. the layout's
+        'dict_blocks'.  Blocks are parsed directly at these offsets and only
+        located again if they do not validate; without them both blocks
+        come from one locate_localization_blocks() scan.
+
     Returns
     -------
-    tuple[dict[str, int], dict[int, str]]
+    tuple[dict[str, int], LazyStringTable]
         (key_to_id, ko_map) where:
         - key_to_id maps localization key string -> numeric id
-        - ko_map maps numeric id -> Korean text
+        - ko_map maps numeric id -> Korean text (decoded on demand)
     """
-    name_block = find_dict_block_by_probe(data, 'name', min_count=4000)
-    ko_block = find_dict_block_by_probe(data, 'koKR', min_count=4000)
+    if block_starts is None:
+        block_starts = locate_localization_blocks(data)
+    name_block = _localization_block(data, 'name', block_starts)
+    ko_block = _localization_block(data, 'koKR', block_starts)
 
     key_id_map = decode_dict_block(name_block)   # id -> key string
     ko_map = decode_dict_block(ko_block)          # id -> Korean text
@@ -770,5 +2626,396 @@ def loc_text(key_to_id: Dict[str, int], ko_map: Dict[int, str],
     idx = key_to_id.get(key)
     if idx is None:
         return None
+    if isinstance(ko_map, LazyStringTable):
+        return ko_map.clean(idx)
     text = ko_map.get(idx, '')
     return _COLOR_TAG_RE.sub('', text).strip()
+
+
+#: Localization key -> (prefix, numeric id), e.g. 'hcg96' -> ('hcg', 96).
+_LOC_KEY_RE = re.compile(r'^(.*?)(0|[1-9][0-9]*)$')
+
+LOC_INDEX_VERSION = 1
+
+
+class LocalizationIndex:
+    """Precompiled localization lookup: key -> cleaned Korean text.
+
+    Built in one pass over the 'name' and 'koKR' blocks; every text is
+    color-stripped once.  Keys of the form <prefix><id> (hn96, sn97,
+    sec12, Race26, ...) are also filed in per-prefix tables so hot loops
+    can call ``lookup('sn', skill_id)`` instead of formatting a key.
+    Dense prefix tables are lists indexed by id; sparse ones are dicts.
+
+    ``text()`` follows loc_text(): None for an unknown key, '' for a key
+    without Korean text.
+    """
+
+    def __init__(self, texts: Dict[str, str]):
+        self.texts = texts
+        self.tables: Dict[str, Union[list, dict]] = {}
+        grouped: Dict[str, Dict[int, str]] = {}
+        for key, text in texts.items():
+            m = _LOC_KEY_RE.match(key)
+            if m:
+                grouped.setdefault(m.group(1), {})[int(m.group(2))] = text
+        for prefix, entries in grouped.items():
+            top = max(entries) + 1
+            if top <= 4 * len(entries) + 64:
+                table = [None] * top
+                for i, text in entries.items():
+                    table[i] = text
+                self.tables[prefix] = table
+            else:
+                self.tables[prefix] = entries
+
+    @classmethod
+    def from_maps(cls, key_to_id: Dict[str, int],
+                  ko_map: Mapping) -> 'LocalizationIndex':
+        """Build from build_localization() output."""
+        if isinstance(ko_map, LazyStringTable):
+            clean = ko_map.clean
+        else:
+            def clean(idx):
+                return _COLOR_TAG_RE.sub('', ko_map.get(idx, '')).strip()
+        return cls({key: clean(idx) for key, idx in key_to_id.items()})
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.texts
+
+    def text(self, key: str) -> Optional[str]:
+        return self.texts.get(key)
+
+    def lookup(self, prefix: str, idx: int, default: str = '') -> str:
+        """Text of key ``f'{prefix}{idx}'``, or *default* when missing/empty."""
+        table = self.tables.get(prefix)
+        if table is None:
+            return default
+        if isinstance(table, list):
+            text = table[idx] if 0 <= idx < len(table) else None
+        else:
+            text = table.get(idx)
+        return text or default
+
+    def to_dict(self) -> dict:
+        return {'version': LOC_INDEX_VERSION, 'texts': self.texts}
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> 'LocalizationIndex':
+        if raw.get('version') != LOC_INDEX_VERSION:
+            raise ValueError('unsupported localization index version')
+        return cls(raw['texts'])
+
+    def save(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.to_dict(), ensure_ascii=False),
+                       encoding='utf-8')
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'LocalizationIndex':
+        return cls.from_dict(json.loads(Path(path).read_text(encoding='utf-8')))
+
+
+def localization_index_path(cache_dir: Union[str, Path], digest: str) -> Path:
+    """Where build_localization_index() caches the index of a binary."""
+    return Path(cache_dir) / f'{digest}.loc.json'
+
+
+@_instrumented(rows=_no_rows)
+def build_localization_index(data: bytes,
+                             block_starts: Optional[Dict[str, int]] = None,
+                             cache_dir: Optional[Union[str, Path]] = None,
+                             digest: Optional[str] = None,
+                             ) -> Tuple[LocalizationIndex, bool]:
+    """Build the LocalizationIndex, reusing ``<cache_dir>/<sha256>.loc.json``.
+
+    Returns (index, cached) where cached is True when it came from disk.
+    """
+    path = None
+    if cache_dir is not None:
+        path = localization_index_path(cache_dir, digest or binary_digest(data))
+        try:
+            return LocalizationIndex.load(path), True
+        except (OSError, ValueError, KeyError):
+            pass
+    key_to_id, ko_map = build_localization(data, block_starts)
+    index = LocalizationIndex.from_maps(key_to_id, ko_map)
+    if path is not None:
+        index.save(path)
+    return index, False
+
+
+class LocaleIndexes(Mapping):
+    """locale -> LocalizationIndex, each built on first access.
+
+    All locales share the 'name' block (decoded once, when the first
+    locale is requested), so adding a language costs one more string table.
+    Indexes already built (e.g. the koKR index extract_all.py extracts
+    with) are passed in ``indexes`` and not decoded again.
+    """
+
+    def __init__(self, data: bytes, locale_starts: Dict[str, int],
+                 block_starts: Optional[Dict[str, int]] = None,
+                 indexes: Optional[Dict[str, LocalizationIndex]] = None):
+        self._data = data
+        self._starts = dict(locale_starts)
+        self._block_starts = block_starts
+        self._key_to_id: Optional[Dict[str, int]] = None
+        self._indexes: Dict[str, LocalizationIndex] = dict(indexes or {})
+
+    def __getitem__(self, locale: str) -> LocalizationIndex:
+        index = self._indexes.get(locale)
+        if index is None:
+            block = try_parse_dict_block(self._data, self._starts[locale])
+            if block is None:
+                raise KeyError(locale)
+            if self._key_to_id is None:
+                names = decode_dict_block(
+                    _localization_block(self._data, 'name', self._block_starts))
+                self._key_to_id = {v: k for k, v in names.items()}
+            index = LocalizationIndex.from_maps(self._key_to_id,
+                                                decode_dict_block(block))
+            self._indexes[locale] = index
+        return index
+
+    def __iter__(self):
+        return iter(self._starts)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+
+# ---------------------------------------------------------------------------
+# String pool
+# ---------------------------------------------------------------------------
+
+STRING_POOL_VERSION = 1
+
+
+class StringPool:
+    """Interned strings with stable integer ids.
+
+    Ids are assigned in first-seen order and never change, so a pool loaded
+    from disk and extended with a newer build keeps every existing id.
+    ``intern_tree()`` makes equal strings in extracted rows share one
+    object; ``encode_rows()`` replaces them by ids for writing to disk.
+    """
+
+    def __init__(self, strings=()):
+        self._strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for text in strings:
+            self.id(text)
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._ids
+
+    def __getitem__(self, sid: int) -> str:
+        return self._strings[sid]
+
+    def id(self, text: str) -> int:
+        """Id of *text*, adding it to the pool if new."""
+        sid = self._ids.get(text)
+        if sid is None:
+            sid = self._ids[text] = len(self._strings)
+            self._strings.append(text)
+        return sid
+
+    def intern(self, text: str) -> str:
+        """The pooled object equal to *text*."""
+        return self._strings[self.id(text)]
+
+    def intern_tree(self, obj):
+        """Intern every str value in nested dicts/lists, in place."""
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                if isinstance(value, str):
+                    obj[key] = self.intern(value)
+                elif isinstance(value, (dict, list)):
+                    self.intern_tree(value)
+        elif isinstance(obj, list):
+            for i, value in enumerate(obj):
+                if isinstance(value, str):
+                    obj[i] = self.intern(value)
+                elif isinstance(value, (dict, list)):
+                    self.intern_tree(value)
+        return obj
+
+    def encode_rows(self, rows) -> dict:
+        """Replace string values by pool ids.
+
+        Only paths (``name``, ``skills.*.name``, ...) that hold nothing but
+        strings (or None) are encoded, so an int in the result is a pool id
+        exactly when its path is listed in ``string_paths``.
+        """
+        kinds: Dict[str, set] = {}
+        _collect_value_kinds(rows, '', kinds)
+        paths = sorted(p for p, k in kinds.items() if k == {str} or k == {str, type(None)})
+        return {'version': STRING_POOL_VERSION, 'string_paths': paths,
+                'rows': _map_paths(rows, '', set(paths),
+                                   lambda v: v if v is None else self.id(v))}
+
+    def decode_rows(self, doc: dict):
+        """Inverse of encode_rows()."""
+        strings = self._strings
+        return _map_paths(doc['rows'], '', set(doc['string_paths']),
+                          lambda v: v if v is None else strings[v])
+
+    def to_dict(self) -> dict:
+        return {'version': STRING_POOL_VERSION, 'strings': self._strings}
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> 'StringPool':
+        if raw.get('version') != STRING_POOL_VERSION:
+            raise ValueError('unsupported string pool version')
+        return cls(raw['strings'])
+
+    def save(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.to_dict(), ensure_ascii=False),
+                       encoding='utf-8')
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'StringPool':
+        return cls.from_dict(json.loads(Path(path).read_text(encoding='utf-8')))
+
+
+def _child_path(path: str, key: str) -> str:
+    return f'{path}.{key}' if path else key
+
+
+def _collect_value_kinds(obj, path: str, kinds: Dict[str, set]) -> None:
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            _collect_value_kinds(value, _child_path(path, key), kinds)
+    elif isinstance(obj, list):
+        for value in obj:
+            _collect_value_kinds(value, _child_path(path, '*'), kinds)
+    else:
+        kinds.setdefault(path, set()).add(type(obj))
+
+
+def _map_paths(obj, path: str, paths: set, fn):
+    if isinstance(obj, dict):
+        return {key: _map_paths(value, _child_path(path, key), paths, fn)
+                for key, value in obj.items()}
+    if isinstance(obj, list):
+        child = _child_path(path, '*')
+        return [_map_paths(value, child, paths, fn) for value in obj]
+    return fn(obj) if path in paths else obj
+
+
+# ---------------------------------------------------------------------------
+# Persistent layout cache
+# ---------------------------------------------------------------------------
+
+DEFAULT_CACHE_DIR = '.bgdb_cache'
+
+#: Bump when the layout dict gains or changes keys.
+LAYOUT_CACHE_VERSION = 5
+
+
+def _layout_cache_path(cache_dir: Union[str, Path], digest: str) -> Path:
+    return Path(cache_dir) / f'{digest}.json'
+
+
+def load_layout_cache(data: bytes, cache_dir: Union[str, Path],
+                      digest: Optional[str] = None) -> Optional[dict]:
+    """Load a cached layout for this binary, or None on miss.
+
+    The entry is only accepted if its recorded file size and sha256 match
+    the binary and its format version is current; anything else (missing,
+    unreadable, stale) counts as a miss.
+    """
+    digest = digest or binary_digest(data)
+    path = _layout_cache_path(cache_dir, digest)
+    try:
+        with open(path, encoding='utf-8') as fh:
+            layout = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if (layout.get('version') != LAYOUT_CACHE_VERSION
+            or layout.get('sha256') != digest
+            or layout.get('size') != len(data)):
+        return None
+    return layout
+
+
+def save_layout_cache(layout: dict, cache_dir: Union[str, Path]) -> Path:
+    """Write a layout dict to <cache_dir>/<sha256>.json atomically."""
+    path = _layout_cache_path(cache_dir, layout['sha256'])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix('.json.tmp')
+    with open(tmp, 'w', encoding='utf-8') as fh:
+        json.dump(layout, fh, indent=1)
+    os.replace(tmp, path)
+    return path
+
+
+@_instrumented(rows=_no_rows)
+def detect_layout(data: bytes,
+                  cache_dir: Optional[Union[str, Path]] = None) -> dict:
+    """Detect (or load from cache) everything needed before column decoding.
+
+    Parameters
+    ----------
+    data : bytes
+        Full binary blob.
+    cache_dir : str or Path, optional
+        Layout cache directory.  None disables the cache.
+
+    Returns
+    -------
+    dict
+        {
+            'version', 'sha256', 'size',
+            'kokr_off', 'name_map_off',
+            'table_fields': {table_key: {field_name: offset}},
+            'row_counts':   {table_key: rows},
+            'dict_blocks':  {'name': start, 'koKR': start},
+            'locale_blocks': {locale: start},   # every locale, one scan
+            'catalog':      catalog_to_dict(build_field_catalog(data)),
+            'cached': bool,   # True when served from the cache
+        }
+    """
+    digest = binary_digest(data)
+    if cache_dir is not None:
+        layout = load_layout_cache(data, cache_dir, digest)
+        if layout is not None:
+            layout['cached'] = True
+            return layout
+
+    kokr_off, name_map_off = detect_offsets(data)
+    catalog = build_field_catalog(data)
+    table_fields = scan_all_table_fields(data, catalog)
+    dict_blocks, locale_blocks = locate_dict_blocks(data)
+    layout = {
+        'version': LAYOUT_CACHE_VERSION,
+        'sha256': digest,
+        'size': len(data),
+        'kokr_off': kokr_off,
+        'name_map_off': name_map_off,
+        'table_fields': table_fields,
+        'row_counts': detect_row_counts(data, table_fields),
+        'dict_blocks': dict_blocks,
+        'locale_blocks': locale_blocks,
+        'catalog': catalog_to_dict(catalog),
+    }
+    if cache_dir is not None:
+        save_layout_cache(layout, cache_dir)
+    layout['cached'] = False
+    return layout
@@ -15,14 +15,24 @@ Reads bgdb_clean.bin and outputs 9 JSON files:
 Usage:
     python3 extract_all.py
     python3 extract_all.py --bin /path/to/bgdb_clean.bin --out /path/to/output/dir
+    python3 extract_all.py --apk /path/to/game.apk
 """
 
+import hashlib
+import io
 import json
+import os
 import re
 import struct
 import sys
 import argparse
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import Mapping, Optional, Sequence
 
 # ---------------------------------------------------------------------------
 # Path setup — import bgdb_utils from same directory
@@ -30,22 +40,33 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from bgdb_utils import (
+    BGTable,
+    RaggedArray,
+    RankColumn,
+    TypeMarkerRegistry,
+    decode_nested_column,
+    decode_rank_column,
+    load_apk_binary,
     load_binary,
+    map_binary,
     parse_int32_field,
     parse_float32_field,
-    parse_bool_field,
-    parse_rank_field,
     parse_kokr_strings,
     parse_name_map,
-    get_table_strings,
+    gather_table_string_ids,
+    parse_name_map_str_ids,
     _field_data_region,
-    build_localization,
-    loc_text,
+    LocalizationIndex,
+    LocaleIndexes,
+    StringPool,
+    build_localization_index,
+    field_records_digest,
+    localization_index_path,
     KOKR_OFF,
     NAME_MAP_OFF,
-    detect_offsets,
-    scan_all_table_fields,
-    detect_row_counts,
+    detect_layout,
+    enable_stats,
+    DEFAULT_CACHE_DIR,
 )
 from enhancement_multipliers import get_enhancement_multiplier
 
@@ -263,7 +284,7 @@ def _load_sec_mapping() -> dict:
 SEC_KOREAN_MAP = _load_sec_mapping()
 
 # ---------------------------------------------------------------------------
-# Table row counts
+# Table row counts (v1863 defaults; detected values live in ExtractionContext)
 # ---------------------------------------------------------------------------
 CREATURE_ROWS  = 539
 ITEM_ROWS      = 1320
@@ -282,19 +303,6 @@ RAW_TO_GAME_CLICK = 0.7
 # Grade normalization
 GRADE_NORMALIZE = {'Z': 'H'}
 
-# ---------------------------------------------------------------------------
-# Name-map slice starts (zero-based index into the name_map entries list)
-# ---------------------------------------------------------------------------
-CREATURE_MAP_START = 0
-ITEM_MAP_START     = 539
-ENEMY_MAP_START    = 1859
-BOSS_MAP_START     = 2246
-STAGE_MAP_START    = 2356
-EQUIP_MAP_START    = 2856
-CMD_MAP_START      = 3389
-SPEC_MAP_START     = 3424
-ART_MAP_START      = 3459
-
 # ---------------------------------------------------------------------------
 # Field offsets — creatureBase (539 rows)
 # ---------------------------------------------------------------------------
@@ -373,11 +381,6 @@ ENEMY_FIELDS = {
     'chanceAttackAll':188917,
     'isMirroring':    190541,
 }
-ENEMY_BOOL_FIELDS  = {'isRunaway', 'isMirroring'}
-ENEMY_FLOAT_FIELDS = {
-    'factorHp', 'resistPhysical', 'resistMagical', 'factorGold',
-    'resistClick', 'block', 'alpha', 'cooldown', 'chanceAttackAll',
-}
 
 # ---------------------------------------------------------------------------
 # Field offsets — boss (110 rows)  [extracted but not output]
@@ -472,27 +475,23 @@ ART_FIELDS = {
 # Helper — float32 bit-cast from int32
 # ===========================================================================
 
-def parse_grade_codes(data: bytes, rank_field_off: int, next_field_off: int, row_count: int) -> list:
-    """Parse grade letter codes from the rank field region.
+def parse_grade_codes(data: bytes, rank_field_off: int, row_count: int,
+                      rank_column: Optional[RankColumn] = None) -> list:
+    """Parse grade letter codes from the rank field.
 
-    The rank column region contains a run of uppercase ASCII letters (E, C, A, S, G, X, Z, etc.)
-    where each letter is the grade code for one creature row.
-    Z is normalized to H.
+    The rank block ends with one uppercase ASCII letter (E, C, A, S, G, X,
+    Z, etc.) per row; decode_rank_column() reads them straight from the
+    block layout (pass an already decoded ``rank_column`` to reuse it).
+    Z is normalized to H; rows the block does not cover (or a field that
+    is not a rank block) get '?'.
     """
-    region = data[rank_field_off:next_field_off]
-    best = None
-    for m in re.finditer(rb'[A-Z]{100,}', region):
-        s = m.group(0)
-        if len(s) < row_count:
-            continue
-        if best is None or abs(len(s) - row_count) < abs(len(best) - row_count):
-            best = s
-            if len(s) == row_count:
-                break
-    if best is None:
-        return ['?' for _ in range(row_count)]
-    codes = best[:row_count].decode('ascii', errors='ignore')
-    return [GRADE_NORMALIZE.get(c, c) for c in codes]
+    try:
+        if rank_column is None:
+            rank_column = decode_rank_column(data, rank_field_off)
+        codes = rank_column.grades[:row_count]
+    except ValueError:
+        codes = ''
+    return [GRADE_NORMALIZE.get(c, c) for c in codes] + ['?'] * (row_count - len(codes))
 
 
 def int_to_float(val: int) -> float:
@@ -745,7 +744,7 @@ def format_skill_template_value(template: str, value: float, fmt: str) -> str:
     return text
 
 
-def resolve_skill_effects(types: list, effects: list, key_to_id: dict, ko_map: dict) -> list:
+def resolve_skill_effects(types: list, effects: list, loc: LocalizationIndex) -> list:
     """Resolve itemBase skill effect type codes via sec templates.
 
     itemBase skill codes are sec codes, not equipment/artifact mainType codes.
@@ -786,7 +785,7 @@ def resolve_skill_effects(types: list, effects: list, key_to_id: dict, ko_map: d
             })
             continue
         sec_key = f'sec{t}'
-        template = (loc_text(key_to_id, ko_map, sec_key) or SEC_KOREAN_MAP.get(sec_key) or f'효과{t}').replace('\n', ' ').replace('\r', '')
+        template = (loc.lookup('sec', t) or SEC_KOREAN_MAP.get(sec_key) or f'효과{t}').replace('\n', ' ').replace('\r', '')
         efmt = SKILL_EFFECT_FORMAT_OVERRIDES.get(t) or infer_skill_effect_format(template, e)
         display_value = scale_skill_effect_display_value(t, e, template)
         val_str = format_skill_template_value(template, display_value, efmt)
@@ -895,89 +894,25 @@ def apply_artifact_overrides(index: int, effects: list) -> list:
 # Nested array parsers (from fix_array_fields.py)
 # ===========================================================================
 
-def _parse_nested_index_table(raw: bytes, row_count: int):
-    """Return (entries, data_section) for a BGDatabase nested-array block."""
-    entries = []
-    for i in range(row_count):
-        entry_off = 4 + i * 8
-        row_idx = struct.unpack_from('<I', raw, entry_off)[0]
-        byte_off = struct.unpack_from('<I', raw, entry_off + 4)[0]
-        entries.append((row_idx, byte_off))
-    data_section_start = 4 + row_count * 8
-    data_section = raw[data_section_start:]
-    return entries, data_section
-
-
-def _nested_row_slices(entries: list, data_section_len: int) -> dict:
-    """Return {row_idx: (start, end)} byte slices within data_section."""
-    sorted_entries = sorted(entries, key=lambda x: x[1])
-    slices = {}
-    for i, (ridx, boff) in enumerate(sorted_entries):
-        bend = sorted_entries[i + 1][1] if i + 1 < len(sorted_entries) else data_section_len
-        slices[ridx] = (boff, bend)
-    return slices
-
-
-def parse_nested_int32(data: bytes, field_off: int) -> list:
-    """Parse a nested int32[] field -> list[list[int]], one list per row."""
-    _, data_size, actual_start = _field_data_region(data, field_off)
-    raw = data[actual_start: actual_start + data_size]
-    row_count = struct.unpack_from('<I', raw, 0)[0]
-    entries, ds = _parse_nested_index_table(raw, row_count)
-    slices = _nested_row_slices(entries, len(ds))
-    result = []
-    for row_idx in range(row_count):
-        if row_idx not in slices:
-            result.append([])
-            continue
-        s, e = slices[row_idx]
-        chunk = ds[s:e]
-        vals = [struct.unpack_from('<i', chunk, j * 4)[0] for j in range(len(chunk) // 4)]
-        result.append(vals)
-    return result
+def parse_nested_int32(data: bytes, field_off: int) -> RaggedArray:
+    """Parse a nested int32[] field -> RaggedArray, one int row per table row."""
+    return decode_nested_column(data, field_off, 'i')
 
 
-def parse_nested_float32(data: bytes, field_off: int) -> list:
-    """Parse a nested float32[] field -> list[list[float]], one list per row."""
-    _, data_size, actual_start = _field_data_region(data, field_off)
-    raw = data[actual_start: actual_start + data_size]
-    row_count = struct.unpack_from('<I', raw, 0)[0]
-    entries, ds = _parse_nested_index_table(raw, row_count)
-    slices = _nested_row_slices(entries, len(ds))
-    result = []
-    for row_idx in range(row_count):
-        if row_idx not in slices:
-            result.append([])
-            continue
-        s, e = slices[row_idx]
-        chunk = ds[s:e]
-        vals = [struct.unpack_from('<f', chunk, j * 4)[0] for j in range(len(chunk) // 4)]
-        result.append(vals)
-    return result
+def parse_nested_float32(data: bytes, field_off: int) -> RaggedArray:
+    """Parse a nested float32[] field -> RaggedArray, one float row per table row."""
+    return decode_nested_column(data, field_off, 'f')
 
 
 def parse_nested_string(data: bytes, field_off: int) -> list:
     """Parse a nested string field -> list[str], one string per row."""
-    _, data_size, actual_start = _field_data_region(data, field_off)
-    raw = data[actual_start: actual_start + data_size]
-    row_count = struct.unpack_from('<I', raw, 0)[0]
-    entries, ds = _parse_nested_index_table(raw, row_count)
-    slices = _nested_row_slices(entries, len(ds))
-    result = []
-    for row_idx in range(row_count):
-        if row_idx not in slices:
-            result.append('')
-            continue
-        s, e = slices[row_idx]
-        result.append(ds[s:e].decode('utf-8', errors='replace'))
-    return result
+    rows = decode_nested_column(data, field_off, 'B')
+    return [str(rows.row(i), 'utf-8', errors='replace') for i in range(len(rows))]
 
 
-def parse_plain_float32(data: bytes, field_off: int) -> list:
-    """Parse a plain scalar float32 field -> list[float]."""
-    _, data_size, actual_start = _field_data_region(data, field_off)
-    count = data_size // 4
-    return [struct.unpack_from('<f', data, actual_start + i * 4)[0] for i in range(count)]
+def parse_plain_float32(data: bytes, field_off: int) -> array:
+    """Parse a plain scalar float32 field -> array('f')."""
+    return parse_float32_field(data, field_off)
 
 
 # ===========================================================================
@@ -995,21 +930,23 @@ def _extract_name_from_story(story: str) -> str:
     return tokens[0] if tokens else ''
 
 
-def assign_creature_strings(name_map_entries: list, strings: dict) -> list:
+def assign_creature_strings(name_map_entries: list, strings: dict,
+                            row_count: int = CREATURE_ROWS) -> list:
     """Assign name/class_name/story for each creature row.
 
     name_map_entries: flat list of (row_id, str_id) from parse_name_map().
-    The first CREATURE_ROWS entries (indices 0..538) correspond to creatures.
+    The first row_count entries (indices 0..538 in v1863) correspond to
+    creatures.
     """
     # Build dict: row_index (0-based position in creature slice) -> str_id
     creature_map = {}
-    for pos in range(CREATURE_ROWS):
+    for pos in range(row_count):
         if pos < len(name_map_entries):
             _row_id, str_id = name_map_entries[pos]
             creature_map[pos] = str_id
 
     results = []
-    for i in range(CREATURE_ROWS):
+    for i in range(row_count):
         if i not in creature_map:
             results.append({'name': '', 'class_name': '', 'story': ''})
             continue
@@ -1055,64 +992,324 @@ def assign_creature_strings(name_map_entries: list, strings: dict) -> list:
     return results
 
 
+# ===========================================================================
+# Column tables (decoded lazily, see bgdb_utils.BGTable)
+# ===========================================================================
+
+def _grade_column(table: BGTable) -> list:
+    """Derived 'grade' column: letter codes stored in the rank block
+    (shares the table's cached RankColumn with the 'rank' column)."""
+    try:
+        rank_column = table.rank_column('rank')
+    except ValueError:
+        return ['?'] * len(table)
+    return parse_grade_codes(table.data, table.field('rank').offset, len(table),
+                             rank_column=rank_column)
+
+
+# Declared column types are a fallback for when a field's type marker is not
+# in the calibrated registry; scalar columns need none (see FIELD_TYPE_ANCHORS).
+CREATURE_COLUMN_TYPES = {
+    'rank':  'rank',
+    'grade': _grade_column,
+}
+
+# Equipment field name aliases (new binary may rename fields)
+EQUIP_FIELD_ALIASES = {
+    'hero0': 'specializedHero0', 'hero1': 'specializedHero1',
+    'hero2': 'specializedHero2', 'hero3': 'specializedHero3',
+    'hero4': 'specializedHero4', 'hero5': 'specializedHero5',
+    'specEffect': 'specializedEffect',
+}
+
+EQUIP_COLUMN_TYPES = {
+    'rank':  'rank',
+    'grade': _grade_column,
+}
+
+SPEC_COLUMN_TYPES = {
+    'type': 'nested_string',
+}
+
+ART_COLUMN_TYPES = {
+    'aType':   'nested_int32',
+    'aEffect': 'nested_float32',
+}
+
+
+def _table_specs() -> dict:
+    """table_key -> (default field offsets, row count, declared column types)."""
+    return {
+        'creature':  (CREATURE_FIELDS, CREATURE_ROWS, CREATURE_COLUMN_TYPES),
+        'item':      (ITEM_FIELDS, ITEM_ROWS, {}),
+        'enemy':     (ENEMY_FIELDS, ENEMY_ROWS, {}),
+        'boss':      (BOSS_FIELDS, BOSS_ROWS, {}),
+        'equip':     (EQUIP_FIELDS, EQUIP_ROWS, EQUIP_COLUMN_TYPES),
+        'commander': (CMD_FIELDS, CMD_ROWS, {}),
+        'spec':      (SPEC_FIELDS, SPEC_ROWS, SPEC_COLUMN_TYPES),
+        'artifact':  (ART_FIELDS, ART_ROWS, ART_COLUMN_TYPES),
+    }
+
+
+def table_column_types() -> dict:
+    """table_key -> declared column types, with EQUIP_FIELD_ALIASES applied
+    so equipment types also cover the renamed fields of newer binaries."""
+    declared = {}
+    for key, (_fields, _rows, column_types) in _table_specs().items():
+        if key == 'equip':
+            column_types = dict(column_types)
+            for old_name, new_name in EQUIP_FIELD_ALIASES.items():
+                if old_name in column_types:
+                    column_types[new_name] = column_types[old_name]
+        declared[key] = column_types
+    return declared
+
+
+#: Fields whose type is known in every build, (table_key, field) -> type.
+#: They only teach TypeMarkerRegistry what each separator marker means;
+#: every other column is then typed by its own marker.
+FIELD_TYPE_ANCHORS = {
+    ('creature', 'index'):          'int32',
+    ('equip', 'index'):             'int32',
+    ('creature', 'attackCooldown'): 'float32',
+    ('enemy', 'factorHp'):          'float32',
+    ('creature', 'canG'):           'bool',
+    ('equip', 'cantPowerUp'):       'bool',
+    ('creature', 'rank'):           'rank',
+    ('equip', 'rank'):              'rank',
+    ('artifact', 'aType'):          'nested_int32',
+    ('artifact', 'aEffect'):        'nested_float32',
+    ('spec', 'type'):               'nested_string',
+}
+
+
+def calibrate_field_types(data: bytes,
+                          table_fields: dict = None) -> TypeMarkerRegistry:
+    """Learn the separator type markers from the FIELD_TYPE_ANCHORS fields.
+
+    Field offsets are the v1863 defaults unless a detected layout's (or an
+    ExtractionContext's) ``table_fields`` are given; an anchor missing from
+    them is skipped.
+    """
+    known = {}
+    for (key, name), ctype in FIELD_TYPE_ANCHORS.items():
+        fields = (_table_specs()[key][0] if table_fields is None
+                  else table_fields.get(key, {}))
+        off = fields.get(name)
+        if off is not None:
+            known[off] = ctype
+    return TypeMarkerRegistry.calibrate(data, known)
+
+
+
+# ===========================================================================
+# Extraction context
+# ===========================================================================
+# The *_FIELDS/*_ROWS constants above describe v1863 and are never modified;
+# everything detected for a particular binary lives in an ExtractionContext,
+# so several binaries can be extracted in one process.
+
+#: Order of the table slices in name_map (each table's rows are contiguous).
+NAME_MAP_ORDER = ('creature', 'item', 'enemy', 'boss', 'stage', 'equip',
+                  'commander', 'spec', 'artifact')
+
+#: Default row count per table key, and the constant it is named after.
+_DEFAULT_ROWS = {
+    'creature': ('CREATURE_ROWS', CREATURE_ROWS), 'item': ('ITEM_ROWS', ITEM_ROWS),
+    'enemy': ('ENEMY_ROWS', ENEMY_ROWS), 'boss': ('BOSS_ROWS', BOSS_ROWS),
+    'stage': ('STAGE_ROWS', STAGE_ROWS), 'equip': ('EQUIP_ROWS', EQUIP_ROWS),
+    'commander': ('CMD_ROWS', CMD_ROWS), 'spec': ('SPEC_ROWS', SPEC_ROWS),
+    'artifact': ('ART_ROWS', ART_ROWS),
+}
+
+
+@dataclass
+class ExtractionContext:
+    """Per-binary state shared by the extract_* functions.
+
+    ``fields`` and ``rows`` are keyed by table key ('creature', 'equip',
+    ...); field names are the ones the extractors use (equipment fields
+    renamed in newer binaries keep their EQUIP_FIELD_ALIASES source name).
+    The string tables are filled in by load_strings(); ``loc`` is set by
+    the caller.
+    """
+    data: Optional[bytes]
+    fields: dict
+    rows: dict
+    field_types: TypeMarkerRegistry = field(default_factory=TypeMarkerRegistry)
+    kokr_off: int = KOKR_OFF
+    name_map_off: int = NAME_MAP_OFF
+    strings: Optional[Mapping] = None
+    name_map: Optional[list] = None
+    name_sids: Optional[Sequence[int]] = None
+    loc: Optional[LocalizationIndex] = None
+
+    @classmethod
+    def defaults(cls, data: Optional[bytes]) -> 'ExtractionContext':
+        """The v1863 layout, as extract_all.py assumes before detection."""
+        specs = _table_specs()
+        fields = {key: dict(spec[0]) for key, spec in specs.items()}
+        rows = {key: default for key, (_, default) in _DEFAULT_ROWS.items()}
+        return cls(data, fields, rows)
+
+    @classmethod
+    def from_layout(cls, data: bytes, layout: dict,
+                    verbose: bool = True) -> 'ExtractionContext':
+        """Defaults updated from a detect_layout() result, with the
+        separator type markers calibrated for this binary."""
+        ctx = cls.defaults(data)
+        ctx.kokr_off, ctx.name_map_off = layout['kokr_off'], layout['name_map_off']
+        scanned = layout['table_fields']
+        for tbl_key, fields_dict in ctx.fields.items():
+            s = scanned.get(tbl_key, {})
+            if not s:
+                continue
+            updated = 0
+            for old_name in list(fields_dict.keys()):
+                if old_name in s:
+                    if fields_dict[old_name] != s[old_name]:
+                        fields_dict[old_name] = s[old_name]
+                        updated += 1
+                elif tbl_key == 'equip' and old_name in EQUIP_FIELD_ALIASES:
+                    new_name = EQUIP_FIELD_ALIASES[old_name]
+                    if new_name in s:
+                        fields_dict[old_name] = s[new_name]
+                        updated += 1
+            if updated and verbose:
+                print(f"  [auto-detect] {tbl_key}: {updated} field offsets updated")
+
+        for tbl_key, (var_name, old_val) in _DEFAULT_ROWS.items():
+            new_val = layout['row_counts'].get(tbl_key)
+            if new_val and new_val != old_val:
+                ctx.rows[tbl_key] = new_val
+                if verbose:
+                    print(f"  [auto-detect] {var_name}: {old_val} -> {new_val}")
+
+        ctx.field_types = calibrate_field_types(data, ctx.fields)
+        if verbose:
+            for tbl_key in ctx.fields:
+                for name, (declared, marker_type) in ctx.table(tbl_key).type_disagreements().items():
+                    print(f"  WARNING: {tbl_key}.{name} declared {declared}, "
+                          f"type marker says {marker_type}; using {marker_type}")
+        return ctx
+
+    @property
+    def map_starts(self) -> dict:
+        """table_key -> index of its first entry in name_map."""
+        starts, pos = {}, 0
+        for key in NAME_MAP_ORDER:
+            starts[key] = pos
+            pos += self.rows[key]
+        return starts
+
+    def load_strings(self, kokr_index: Optional[tuple] = None) -> None:
+        """Parse the koKR string table and name_map of ``data``.
+
+        With ``kokr_index`` (``strings.offsets()`` of a context already
+        loaded from the same binary) nothing is parsed: koKR entries are
+        resolved through that index, name_sids is a view over ``data`` and
+        name_map, which no extractor reads, is left unset.
+        """
+        if kokr_index is not None:
+            self.strings = parse_kokr_strings(self.data, kokr_off=self.kokr_off,
+                                              index=kokr_index)
+            self.name_sids = parse_name_map_str_ids(self.data, off=self.name_map_off,
+                                                    copy=False)
+            return
+        self.strings = parse_kokr_strings(self.data, kokr_off=self.kokr_off)
+        self.name_map = parse_name_map(self.data, off=self.name_map_off)
+        self.name_sids = parse_name_map_str_ids(self.data, off=self.name_map_off)
+
+    def layout_only(self) -> 'ExtractionContext':
+        """A copy without the binary and string tables (small to pickle)."""
+        return replace(self, data=None, strings=None, name_map=None,
+                       name_sids=None, loc=None)
+
+    def table(self, key: str) -> BGTable:
+        """One of the known tables as a BGTable (columns decode on access)."""
+        column_types = _table_specs()[key][2]
+        return BGTable.from_offsets(self.data, key, self.fields[key],
+                                    self.rows[key], column_types,
+                                    registry=self.field_types)
+
+
 # ===========================================================================
 # Phase 1-3: Raw extraction of all tables
 # ===========================================================================
 
-def extract_creatures(data: bytes, name_map: list, strings: dict,
-                      key_to_id: dict, ko_map: dict) -> list:
+#: creatures.json 'types' key -> localization prefix of its label.
+CREATURE_TYPE_PREFIXES = (
+    ('race_top', 'RaceTop'), ('race', 'Race'), ('location', 'Location'),
+    ('gender', 'Gender'), ('house', 'House'), ('religion', 'Religion'),
+    ('individuality', 'Individuality'),
+)
+
+
+def creature_skills(loc: LocalizationIndex, skill_ids: list) -> list:
+    """Skill slots of one creature with their localized name/description."""
+    return [{'slot': slot, 'id': sid,
+             'name': loc.lookup('sn', sid),
+             'description': loc.lookup('ss', sid)}
+            for slot, sid in enumerate(skill_ids, start=1)]
+
+
+def creature_type_labels(loc: LocalizationIndex, codes: dict) -> dict:
+    """{'race': code, ...} -> {'race': label, ...} (CREATURE_TYPE_PREFIXES)."""
+    return {key: loc.lookup(prefix, codes[key])
+            for key, prefix in CREATURE_TYPE_PREFIXES}
+
+
+def extract_creatures(ctx: ExtractionContext) -> list:
     print("  [creatureBase] Parsing fields...", flush=True)
-    f = CREATURE_FIELDS
-    index_vals         = parse_int32_field(data, f['index'])
-    model_vals         = parse_int32_field(data, f['model'])
-    rank_vals          = parse_rank_field(data, f['rank'], CREATURE_ROWS)
-    attack_type_vals   = parse_int32_field(data, f['attackType'])
-    can_g_vals         = parse_bool_field(data, f['canG'])
-    can_awaken_vals    = parse_bool_field(data, f['canAwaken'])
-    skill0_vals        = parse_int32_field(data, f['skill0'])
-    skill1_vals        = parse_int32_field(data, f['skill1'])
-    skill2_vals        = parse_int32_field(data, f['skill2'])
-    skill3_vals        = parse_int32_field(data, f['skill3'])
-    skill4_vals        = parse_int32_field(data, f['skill4'])
-    damage_up_vals     = parse_int32_field(data, f['damageUp'])
-    damage_vals        = parse_int32_field(data, f['damage'])
-    dmg_clk_up_vals    = parse_int32_field(data, f['damageClickUp'])
-    dmg_clk_vals       = parse_int32_field(data, f['damageClick'])
-    atk_cd_vals        = parse_float32_field(data, f['attackCooldown'])
-    damage_up_g_vals   = parse_int32_field(data, f['damageUpG'])
-    damage_g_vals      = parse_int32_field(data, f['damageG'])
-    dmg_clk_up_g_vals  = parse_int32_field(data, f['damageClickUpG'])
-    dmg_clk_g_vals     = parse_int32_field(data, f['damageClickG'])
-    atk_cd_g_vals      = parse_float32_field(data, f['attackCooldownG'])
-    excl_id0_vals      = parse_int32_field(data, f['exclusiveID0'])
-    excl_id1_vals      = parse_int32_field(data, f['exclusiveID1'])
-    excl_id2_vals      = parse_int32_field(data, f['exclusiveID2'])
-    effect_atk_vals    = parse_int32_field(data, f['effectAttack'])
-    req_orb_vals       = parse_int32_field(data, f['requireOrb'])
-    req_part_vals      = parse_int32_field(data, f['requireParticle'])
-    type_race_top_vals = parse_int32_field(data, f['typeRaceTop'])
-    type_race_vals     = parse_int32_field(data, f['typeRace'])
-    type_loc_vals      = parse_int32_field(data, f['typeLocation'])
-    type_gen_vals      = parse_int32_field(data, f['typeGender'])
-    type_ind_vals      = parse_int32_field(data, f['typeIndividuality'])
-    type_house_vals    = parse_int32_field(data, f['typeHouse'])
-    type_rel_vals      = parse_int32_field(data, f['typeReligion'])
-
-    # Parse grade codes from rank field region
-    grade_codes = parse_grade_codes(data, f['rank'], f['attackType'], CREATURE_ROWS)
-
-    def _loc(key):
-        return loc_text(key_to_id, ko_map, key) or ''
+    loc = ctx.loc
+    t = ctx.table('creature')
+    index_vals         = t['index']
+    model_vals         = t['model']
+    rank_vals          = t['rank']
+    attack_type_vals   = t['attackType']
+    can_g_vals         = t['canG']
+    can_awaken_vals    = t['canAwaken']
+    skill0_vals        = t['skill0']
+    skill1_vals        = t['skill1']
+    skill2_vals        = t['skill2']
+    skill3_vals        = t['skill3']
+    skill4_vals        = t['skill4']
+    damage_up_vals     = t['damageUp']
+    damage_vals        = t['damage']
+    dmg_clk_up_vals    = t['damageClickUp']
+    dmg_clk_vals       = t['damageClick']
+    atk_cd_vals        = t['attackCooldown']
+    damage_up_g_vals   = t['damageUpG']
+    damage_g_vals      = t['damageG']
+    dmg_clk_up_g_vals  = t['damageClickUpG']
+    dmg_clk_g_vals     = t['damageClickG']
+    atk_cd_g_vals      = t['attackCooldownG']
+    excl_id0_vals      = t['exclusiveID0']
+    excl_id1_vals      = t['exclusiveID1']
+    excl_id2_vals      = t['exclusiveID2']
+    effect_atk_vals    = t['effectAttack']
+    req_orb_vals       = t['requireOrb']
+    req_part_vals      = t['requireParticle']
+    type_race_top_vals = t['typeRaceTop']
+    type_race_vals     = t['typeRace']
+    type_loc_vals      = t['typeLocation']
+    type_gen_vals      = t['typeGender']
+    type_ind_vals      = t['typeIndividuality']
+    type_house_vals    = t['typeHouse']
+    type_rel_vals      = t['typeReligion']
+
+    # Grade codes from the rank field region
+    grade_codes = t['grade']
 
     creatures = []
-    for i in range(CREATURE_ROWS):
+    for i in range(ctx.rows['creature']):
         hero_id = index_vals[i]
 
         # Localization-based name resolution
-        name = _loc(f'hn{hero_id}')
-        subtitle = _loc(f'hc{hero_id}')
-        subtitle_grade = _loc(f'hcg{hero_id}')
-        story = _loc(f'hs{hero_id}')
+        name = loc.lookup('hn', hero_id)
+        subtitle = loc.lookup('hc', hero_id)
+        subtitle_grade = loc.lookup('hcg', hero_id)
+        story = loc.lookup('hs', hero_id)
 
         # Fallback: extract name from story if hn key missing
         if not name and story:
@@ -1121,25 +1318,24 @@ def extract_creatures(data: bytes, name_map: list, strings: dict,
                 name = m.group(1).strip()
 
         # Skill resolution via localization keys
-        skill_ids = [skill0_vals[i], skill1_vals[i], skill2_vals[i],
-                     skill3_vals[i], skill4_vals[i]]
-        skills = []
-        for slot, sid in enumerate(skill_ids, start=1):
-            skills.append({
-                'slot': slot,
-                'id': sid,
-                'name': _loc(f'sn{sid}'),
-                'description': _loc(f'ss{sid}'),
-            })
+        skills = creature_skills(loc, [skill0_vals[i], skill1_vals[i], skill2_vals[i],
+                                       skill3_vals[i], skill4_vals[i]])
 
         # Type label resolution via localization keys
-        type_race_code = type_race_vals[i]
-        type_loc_code = type_loc_vals[i]
-        type_gen_code = type_gen_vals[i]
-        type_house_code = type_house_vals[i]
-        type_rel_code = type_rel_vals[i]
-        type_ind_code = type_ind_vals[i]
-        type_race_top_code = type_race_top_vals[i]
+        type_codes = {
+            'race_top': type_race_top_vals[i],
+            'race': type_race_vals[i],
+            'location': type_loc_vals[i],
+            'gender': type_gen_vals[i],
+            'house': type_house_vals[i],
+            'religion': type_rel_vals[i],
+            'individuality': type_ind_vals[i],
+        }
+        type_labels = creature_type_labels(loc, type_codes)
+        types = {}
+        for key, _prefix in CREATURE_TYPE_PREFIXES:
+            types[f'{key}_code'] = type_codes[key]
+            types[key] = type_labels[key]
 
         # Damage scaling
         raw_dmg = damage_vals[i]
@@ -1172,8 +1368,8 @@ def extract_creatures(data: bytes, name_map: list, strings: dict,
             'rank': rank_vals[i],
             'attackType': attack_type_vals[i],
             'attackType_kr': ATTACK_TYPE_MAP.get(attack_type_vals[i], '없음'),
-            'canG': can_g_vals[i],
-            'canAwaken': can_awaken_vals[i],
+            'canG': bool(can_g_vals[i]),
+            'canAwaken': bool(can_awaken_vals[i]),
             'skills': skills,
             'damage_raw': {
                 'damage': raw_dmg, 'damageUp': raw_dmg_up,
@@ -1198,70 +1394,53 @@ def extract_creatures(data: bytes, name_map: list, strings: dict,
             'effectAttack': effect_atk_vals[i],
             'requireOrb': req_orb_vals[i],
             'requireParticle': req_part_vals[i],
-            'types': {
-                'race_top_code': type_race_top_code,
-                'race_top': _loc(f'RaceTop{type_race_top_code}'),
-                'race_code': type_race_code,
-                'race': _loc(f'Race{type_race_code}'),
-                'location_code': type_loc_code,
-                'location': _loc(f'Location{type_loc_code}'),
-                'gender_code': type_gen_code,
-                'gender': _loc(f'Gender{type_gen_code}'),
-                'house_code': type_house_code,
-                'house': _loc(f'House{type_house_code}'),
-                'religion_code': type_rel_code,
-                'religion': _loc(f'Religion{type_rel_code}'),
-                'individuality_code': type_ind_code,
-                'individuality': _loc(f'Individuality{type_ind_code}'),
-            },
+            'types': types,
         })
     print(f"  [creatureBase] {len(creatures)} rows extracted.")
     return creatures
 
 
-def extract_items(data: bytes, name_map: list, strings: dict,
-                   key_to_id: dict, ko_map: dict) -> list:
+def extract_items(ctx: ExtractionContext) -> list:
     print("  [itemBase] Parsing fields...", flush=True)
-    f = ITEM_FIELDS
+    data, loc = ctx.data, ctx.loc
+    f = ctx.fields['item']
     index_vals   = parse_int32_field(data, f['index'])
     icon_vals    = parse_int32_field(data, f['icon'])
-    pf_vals      = parse_int32_field(data, f['priceFactor'])
+    # priceFactor/effectN hold float32 bit patterns; decode them as float32
+    # columns directly instead of bit-casting each int32 row.
+    pf_vals      = parse_float32_field(data, f['priceFactor'])
     pt_vals      = parse_int32_field(data, f['passiveType'])
     t0_vals      = parse_int32_field(data, f['type0'])
-    e0_vals      = parse_int32_field(data, f['effect0'])
+    e0_vals      = parse_float32_field(data, f['effect0'])
     t1_vals      = parse_int32_field(data, f['type1'])
-    e1_vals      = parse_int32_field(data, f['effect1'])
+    e1_vals      = parse_float32_field(data, f['effect1'])
     t2_vals      = parse_int32_field(data, f['type2'])
-    e2_vals      = parse_int32_field(data, f['effect2'])
+    e2_vals      = parse_float32_field(data, f['effect2'])
     rv_vals      = parse_int32_field(data, f['randomValue'])
 
-    def _loc(key):
-        return loc_text(key_to_id, ko_map, key) or ''
-
     items = []
-    for i in range(ITEM_ROWS):
+    for i in range(ctx.rows['item']):
         idx = index_vals[i]
         types_raw = [t0_vals[i], t1_vals[i], t2_vals[i]]
         effects_raw = [
-            round(int_to_float(e0_vals[i]), 6),
-            round(int_to_float(e1_vals[i]), 6),
-            round(int_to_float(e2_vals[i]), 6),
+            round(e0_vals[i], 6),
+            round(e1_vals[i], 6),
+            round(e2_vals[i], 6),
         ]
 
         # Resolve skill name via localization (sn{index})
-        skill_name = _loc(f'sn{idx}')
-        skill_desc = _loc(f'ss{idx}')
+        skill_name = loc.lookup('sn', idx)
+        skill_desc = loc.lookup('ss', idx)
 
         # Resolve effect descriptions via sec{type} templates
-        effects_resolved = resolve_skill_effects(types_raw, effects_raw,
-                                                 key_to_id, ko_map)
+        effects_resolved = resolve_skill_effects(types_raw, effects_raw, loc)
 
         items.append({
             'index':       idx,
             'name':        skill_name,
             'description': skill_desc,
             'icon':        icon_vals[i],
-            'priceFactor': round(int_to_float(pf_vals[i]), 6),
+            'priceFactor': round(pf_vals[i], 6),
             'passiveType': pt_vals[i],
             'types':       types_raw,
             'effects':     effects_raw,
@@ -1272,31 +1451,32 @@ def extract_items(data: bytes, name_map: list, strings: dict,
     return items
 
 
-def extract_enemies(data: bytes, name_map: list, strings: dict) -> list:
+def extract_enemies(ctx: ExtractionContext) -> list:
     print("  [enemy] Parsing fields...", flush=True)
-    f = ENEMY_FIELDS
-    row_strings = get_table_strings(name_map, strings, ENEMY_MAP_START, ENEMY_ROWS, default_stride=5)
-
-    model_vals    = parse_int32_field(data, f['model'])
-    factorhp_vals = [round(v, 6) for v in parse_float32_field(data, f['factorHp'])]
-    resphys_vals  = [round(v, 6) for v in parse_float32_field(data, f['resistPhysical'])]
-    resmag_vals   = [round(v, 6) for v in parse_float32_field(data, f['resistMagical'])]
-    factorgold    = [round(v, 6) for v in parse_float32_field(data, f['factorGold'])]
-    color_vals    = parse_int32_field(data, f['color'])
-    isrunaway     = parse_bool_field(data, f['isRunaway'])
-    resclick      = [round(v, 6) for v in parse_float32_field(data, f['resistClick'])]
-    effectattach  = parse_int32_field(data, f['effectAttach'])
-    block_vals    = [round(v, 6) for v in parse_float32_field(data, f['block'])]
-    alpha_vals    = [round(v, 6) for v in parse_float32_field(data, f['alpha'])]
-    cooldown_vals = [round(v, 6) for v in parse_float32_field(data, f['cooldown'])]
-    chanceatk     = [round(v, 6) for v in parse_float32_field(data, f['chanceAttackAll'])]
-    ismirroring   = parse_bool_field(data, f['isMirroring'])
+    row_strings = gather_table_string_ids(ctx.name_sids, ctx.strings, ctx.map_starts['enemy'],
+                                          ctx.rows['enemy'], stride=5)
+
+    t = ctx.table('enemy')
+    model_vals    = t['model']
+    factorhp_vals = [round(v, 6) for v in t['factorHp']]
+    resphys_vals  = [round(v, 6) for v in t['resistPhysical']]
+    resmag_vals   = [round(v, 6) for v in t['resistMagical']]
+    factorgold    = [round(v, 6) for v in t['factorGold']]
+    color_vals    = t['color']
+    isrunaway     = t['isRunaway']
+    resclick      = [round(v, 6) for v in t['resistClick']]
+    effectattach  = t['effectAttach']
+    block_vals    = [round(v, 6) for v in t['block']]
+    alpha_vals    = [round(v, 6) for v in t['alpha']]
+    cooldown_vals = [round(v, 6) for v in t['cooldown']]
+    chanceatk     = [round(v, 6) for v in t['chanceAttackAll']]
+    ismirroring   = t['isMirroring']
 
     def _g(lst, i, d=None):
         return lst[i] if i < len(lst) else d
 
     enemies = []
-    for i in range(ENEMY_ROWS):
+    for i in range(ctx.rows['enemy']):
         enemies.append({
             'strings':        row_strings[i] if i < len(row_strings) else [],
             'model':          _g(model_vals, i, 0),
@@ -1318,32 +1498,24 @@ def extract_enemies(data: bytes, name_map: list, strings: dict) -> list:
     return enemies
 
 
-def extract_bosses(data: bytes, key_to_id: dict, ko_map: dict) -> list:
+def extract_bosses(ctx: ExtractionContext) -> list:
     """보스 110개 추출 (이름, 저항, 배율, 보상 등)"""
     print("  [boss] Parsing fields...", flush=True)
-    f = BOSS_FIELDS
-
-    FLOAT_FIELDS = {'resistPhysical', 'resistMagical', 'resistClick',
-                    'factorHp', 'factorGold', 'block', 'alpha',
-                    'cooldown', 'chanceAttackAll', 'essence'}
-
-    parsed = {}
-    for fname, foff in f.items():
-        if fname == 'isMirroring':
-            parsed[fname] = parse_bool_field(data, foff)
-        elif fname in FLOAT_FIELDS:
-            parsed[fname] = [round(v, 6) for v in parse_float32_field(data, foff)]
-        else:
-            parsed[fname] = parse_int32_field(data, foff)
+    loc = ctx.loc
+    t = ctx.table('boss')
 
     def _g(field, i, d=None):
-        lst = parsed.get(field, [])
-        return lst[i] if i < len(lst) else d
+        if field not in t:
+            return d
+        col = t[field]
+        if i >= len(col):
+            return d
+        return round(col[i], 6) if t.column_type(field) == 'float32' else col[i]
 
     bosses = []
-    for i in range(BOSS_ROWS):
+    for i in range(ctx.rows['boss']):
         # Resolve boss name via bn{index} localization
-        name = loc_text(key_to_id, ko_map, f'bn{i}') or ''
+        name = loc.lookup('bn', i)
 
         bosses.append({
             'index':           i,
@@ -1369,51 +1541,49 @@ def extract_bosses(data: bytes, key_to_id: dict, ko_map: dict) -> list:
     return bosses
 
 
-def extract_equipment(data: bytes, name_map: list, strings: dict,
-                       key_to_id: dict, ko_map: dict) -> list:
+def extract_equipment(ctx: ExtractionContext) -> list:
     print("  [equipment] Parsing fields...", flush=True)
-    f = EQUIP_FIELDS
-
-    index_vals  = parse_int32_field(data, f['index'])
-    icon_vals   = parse_int32_field(data, f['icon'])
-    maintype    = parse_int32_field(data, f['mainType'])
-    maineff     = parse_float32_field(data, f['mainEffect'])
-    maineffg    = parse_int32_field(data, f['mainEffectG'])
-    rank_vals   = parse_rank_field(data, f['rank'], EQUIP_ROWS)
-    hero0       = parse_int32_field(data, f['hero0'])
-    hero1       = parse_int32_field(data, f['hero1'])
-    hero2       = parse_int32_field(data, f['hero2'])
-    hero3       = parse_int32_field(data, f['hero3'])
-    hero4       = parse_int32_field(data, f['hero4'])
-    hero5       = parse_int32_field(data, f['hero5'])
-    speceff     = parse_float32_field(data, f['specEffect'])
-    availg      = parse_bool_field(data, f['isAvailableG'])
-    cantpu      = parse_bool_field(data, f['cantPowerUp'])
-
-    # Parse grade codes from rank field region
-    grade_codes = parse_grade_codes(data, f['rank'], f['hero0'], EQUIP_ROWS)
+    loc = ctx.loc
+    t = ctx.table('equip')
+
+    index_vals  = t['index']
+    icon_vals   = t['icon']
+    maintype    = t['mainType']
+    maineff     = t['mainEffect']
+    maineffg    = parse_int32_field(ctx.data, ctx.fields['equip']['mainEffectG'])  # raw float32 bits
+    maineffg_f  = t['mainEffectG']
+    rank_vals   = t['rank']
+    hero0       = t['hero0']
+    hero1       = t['hero1']
+    hero2       = t['hero2']
+    hero3       = t['hero3']
+    hero4       = t['hero4']
+    hero5       = t['hero5']
+    speceff     = t['specEffect']
+    availg      = t['isAvailableG']
+    cantpu      = t['cantPowerUp']
+
+    # Grade codes from the rank field region
+    grade_codes = t['grade']
 
     def _g(lst, i, d=0):
         return lst[i] if i < len(lst) else d
 
-    def _loc(key):
-        return loc_text(key_to_id, ko_map, key) or ''
-
     equipment = []
-    for i in range(EQUIP_ROWS):
+    for i in range(ctx.rows['equip']):
         idx = _g(index_vals, i)
         mt = _g(maintype, i)
         me = round(_g(maineff, i, 0.0), 6)
 
         # Resolve name via in{index} localization
-        name = _loc(f'in{idx}')
+        name = loc.lookup('in', idx)
 
         # Resolve main effect type from calibrated mapping
         mapping = MAINTYPE_TO_EFFECT.get(mt)
         if mapping:
             main_type_name, val_fmt, display_ratio = mapping
         else:
-            main_type_name = _loc(f'sec{mt}') if mt is not None else ''
+            main_type_name = loc.lookup('sec', mt) if mt is not None else ''
             val_fmt = 'raw'
             display_ratio = 1.0
 
@@ -1450,14 +1620,14 @@ def extract_equipment(data: bytes, name_map: list, strings: dict,
             raw_g = _g(maineffg, i, 0)
             if raw_g and raw_g != 0:
                 try:
-                    me_g = struct.unpack('f', struct.pack('I', raw_g & 0xFFFFFFFF))[0]
+                    me_g = _g(maineffg_f, i, 0.0)
                     display_val_g = me_g * display_ratio
                     val_str_g = format_effect_value(display_val_g, val_fmt)
                     effect_0_g = f"{main_type_name} {val_str_g}" if main_type_name and val_str_g else ''
                     # G-grade always uses ×6 enhancement
                     val_20_g = display_val_g * 6.0
                     effect_20_g = f"{main_type_name} {format_effect_value(val_20_g, val_fmt)}" if main_type_name else ''
-                except (struct.error, OverflowError):
+                except OverflowError:
                     pass
 
         equipment.append({
@@ -1488,10 +1658,12 @@ def extract_equipment(data: bytes, name_map: list, strings: dict,
     return equipment
 
 
-def extract_commanders(data: bytes, name_map: list, strings: dict) -> list:
+def extract_commanders(ctx: ExtractionContext) -> list:
     print("  [commander] Parsing fields...", flush=True)
-    f = CMD_FIELDS
-    cmd_strings = get_table_strings(name_map, strings, CMD_MAP_START, CMD_ROWS, default_stride=6)
+    data = ctx.data
+    f = ctx.fields['commander']
+    cmd_strings = gather_table_string_ids(ctx.name_sids, ctx.strings, ctx.map_starts['commander'],
+                                          ctx.rows['commander'], stride=6)
 
     index_vals    = parse_int32_field(data, f['index'])
     rarity_vals   = parse_int32_field(data, f['rarity'])
@@ -1503,7 +1675,7 @@ def extract_commanders(data: bytes, name_map: list, strings: dict) -> list:
     statchar_vals = parse_int32_field(data, f['statChar'])
 
     commanders = []
-    for i in range(CMD_ROWS):
+    for i in range(ctx.rows['commander']):
         commanders.append({
             'index':    index_vals[i]    if i < len(index_vals)    else None,
             'strings':  cmd_strings[i]   if i < len(cmd_strings)   else [],
@@ -1519,10 +1691,12 @@ def extract_commanders(data: bytes, name_map: list, strings: dict) -> list:
     return commanders
 
 
-def extract_specialties(data: bytes, name_map: list, strings: dict) -> list:
+def extract_specialties(ctx: ExtractionContext) -> list:
     print("  [commanderSpecialty] Parsing fields...", flush=True)
-    f = SPEC_FIELDS
-    spec_strings = get_table_strings(name_map, strings, SPEC_MAP_START, SPEC_ROWS, default_stride=6)
+    data = ctx.data
+    f = ctx.fields['spec']
+    spec_strings = gather_table_string_ids(ctx.name_sids, ctx.strings, ctx.map_starts['spec'],
+                                           ctx.rows['spec'], stride=6)
 
     index_vals       = parse_int32_field(data, f['index'])
     icon_vals        = parse_int32_field(data, f['icon'])
@@ -1534,7 +1708,7 @@ def extract_specialties(data: bytes, name_map: list, strings: dict) -> list:
     effect_vals  = parse_plain_float32(data, f['effect'])  # list[float]
 
     specialties = []
-    for i in range(SPEC_ROWS):
+    for i in range(ctx.rows['spec']):
         specialties.append({
             'index':       index_vals[i]       if i < len(index_vals)       else None,
             'strings':     spec_strings[i]     if i < len(spec_strings)     else [],
@@ -1548,10 +1722,10 @@ def extract_specialties(data: bytes, name_map: list, strings: dict) -> list:
     return specialties
 
 
-def extract_artifacts(data: bytes, name_map: list, strings: dict,
-                       key_to_id: dict, ko_map: dict) -> list:
+def extract_artifacts(ctx: ExtractionContext) -> list:
     print("  [artifact] Parsing fields...", flush=True)
-    f = ART_FIELDS
+    data, loc = ctx.data, ctx.loc
+    f = ctx.fields['artifact']
 
     index_vals     = parse_int32_field(data, f['index'])
     icon_vals      = parse_int32_field(data, f['icon'])
@@ -1560,9 +1734,13 @@ def extract_artifacts(data: bytes, name_map: list, strings: dict,
     part_vals      = parse_int32_field(data, f['part'])
     set_vals       = parse_int32_field(data, f['set'])
 
-    # Phase 2 nested array fields
-    atype_rows   = parse_nested_int32(data, f['aType'])     # list[list[int]]
-    aeffect_rows = parse_nested_float32(data, f['aEffect'])  # list[list[float]]
+    # Phase 2 nested array fields.  Shift+1 offset correction: artifact at
+    # position i uses BOTH aType AND aEffect from position i-1.  Verified by
+    # cross-referencing APK data with xlsx reference (56% main-value match
+    # with both shifted vs 8% type-only).  Row 0 has no previous row and
+    # comes out empty.
+    atype_rows   = parse_nested_int32(data, f['aType']).shifted()
+    aeffect_rows = parse_nested_float32(data, f['aEffect']).shifted()
 
     # Part label mapping (confirmed: 0=무기, 1=투구, 2=갑옷, 3=보조)
     PART_LABELS = {0: '무기', 1: '투구', 2: '갑옷', 3: '보조'}
@@ -1572,31 +1750,21 @@ def extract_artifacts(data: bytes, name_map: list, strings: dict,
     def _g(lst, i, d=None):
         return lst[i] if i < len(lst) else d
 
-    def _loc(key):
-        return loc_text(key_to_id, ko_map, key) or ''
-
     artifacts = []
-    for i in range(ART_ROWS):
+    for i in range(ctx.rows['artifact']):
         idx = _g(index_vals, i, 0)
         set_id = _g(set_vals, i, 0)
         part_code = _g(part_vals, i, 0)
 
         # Resolve name via an{index} localization
-        name = _loc(f'an{idx}')
+        name = loc.lookup('an', idx)
 
         # Resolve set name via anSet{set_id}
-        set_name = _loc(f'anSet{set_id}') if set_id else ''
-
-        # Shift+1 offset correction: artifact at position i uses BOTH aType AND
-        # aEffect from position i-1.  Verified by cross-referencing APK data with
-        # xlsx reference (56% main-value match with both shifted vs 8% type-only).
-        # Artifact at i=0 has no previous row, so use empty arrays.
-        if i >= 1:
-            atypes = atype_rows[i - 1] if (i - 1) < len(atype_rows) else []
-            aeffects = [round(v, 6) for v in (aeffect_rows[i - 1] if (i - 1) < len(aeffect_rows) else [])]
-        else:
-            atypes = []
-            aeffects = []
+        set_name = loc.lookup('anSet', set_id) if set_id else ''
+
+        atypes = atype_rows[i] if i < len(atype_rows) else []
+        aeffects = ([round(v, 6) for v in aeffect_rows.row(i)]
+                    if i < len(aeffect_rows) else [])
         # v1863 artifact effects are already stored at display scale.
         rank_code = _g(rank_vals, i, 0)
 
@@ -1623,6 +1791,274 @@ def extract_artifacts(data: bytes, name_map: list, strings: dict,
     return artifacts
 
 
+
+# ===========================================================================
+# Phase 1-3b: Parallel extraction (--jobs)
+# ===========================================================================
+# The extractors only read the binary, so once the layout and localization
+# are known they can run in separate processes.  Workers map the binary
+# themselves (the OS page cache holds one copy), load the precompiled
+# LocalizationIndex from its JSON file and receive the context without its
+# buffers; results are collected in EXTRACTORS order.
+
+#: Phase 1-3 extractors in output order.
+EXTRACTORS = [
+    ('creatures',   extract_creatures),
+    ('items',       extract_items),
+    ('enemies',     extract_enemies),
+    ('bosses',      extract_bosses),
+    ('equipment',   extract_equipment),
+    ('commanders',  extract_commanders),
+    ('specialties', extract_specialties),
+    ('artifacts',   extract_artifacts),
+]
+
+#: Context of a worker process (see _init_extract_worker).
+_WORKER_CTX: Optional[ExtractionContext] = None
+
+
+def run_extractors(ctx: ExtractionContext, names=None) -> dict:
+    """Run EXTRACTORS (all, or those in ``names``) in this process; name -> rows."""
+    return {name: fn(ctx) for name, fn in EXTRACTORS if names is None or name in names}
+
+
+def _init_extract_worker(bin_path: str, loc_path: str,
+                         layout_ctx: ExtractionContext, kokr_index: tuple) -> None:
+    global _WORKER_CTX
+    ctx = replace(layout_ctx, data=map_binary(bin_path))
+    ctx.load_strings(kokr_index)
+    ctx.loc = LocalizationIndex.load(loc_path)
+    _WORKER_CTX = ctx
+
+
+def _extract_in_worker(name: str) -> tuple:
+    log = io.StringIO()
+    with redirect_stdout(log):
+        rows = dict(EXTRACTORS)[name](_WORKER_CTX)
+    return rows, log.getvalue()
+
+
+def extract_tables_parallel(ctx: ExtractionContext, jobs: int,
+                            bin_path=None, loc_path=None, names=None) -> dict:
+    """Run EXTRACTORS (all, or those in ``names``) in a pool of ``jobs``
+    processes; name -> rows.
+
+    ``bin_path`` is the file the workers map; pass None when ``ctx.data``
+    did not come from a plain file (APK) and it is spilled to a temporary
+    file instead.  Likewise ``ctx.loc`` is saved to a temporary file when
+    ``loc_path`` (the cached index) does not exist.  Workers reuse the
+    offset index of ``ctx.strings`` rather than parsing the koKR table and
+    name_map again.  Each worker's console output is replayed in EXTRACTORS
+    order, so the log matches a serial run.
+    """
+    names = [name for name, _ in EXTRACTORS if names is None or name in names]
+    if not names:
+        return {}
+    with tempfile.TemporaryDirectory(prefix='extract_all_') as tmp:
+        if bin_path is None:
+            bin_path = Path(tmp) / 'bgdb.bin'
+            bin_path.write_bytes(ctx.data)
+        if loc_path is None or not Path(loc_path).exists():
+            loc_path = ctx.loc.save(Path(tmp) / 'loc.json')
+        results = {}
+        with ProcessPoolExecutor(
+                max_workers=min(jobs, len(names)),
+                initializer=_init_extract_worker,
+                initargs=(str(bin_path), str(loc_path), ctx.layout_only(),
+                          ctx.strings.offsets())) as pool:
+            for name, (rows, log) in zip(names, pool.map(_extract_in_worker, names)):
+                print(log, end='', flush=True)
+                results[name] = rows
+    return results
+
+
+# ===========================================================================
+# Phase 1-3c: Per-table cache
+# ===========================================================================
+# Each extractor's rows are cached under a content key: the bytes of its
+# table's field records plus everything else it reads (localization
+# prefixes, name_map string rows, mapping files and module constants) and
+# a digest of the extraction code itself.  A game update that only touches
+# artifacts re-extracts only artifacts, and output files whose inputs did
+# not change are not re-serialized.
+
+#: Bump when the format of the cache entries or the manifest changes (code
+#: changes are covered by _code_digest()).
+TABLE_CACHE_VERSION = 1
+
+#: Modules whose source is part of every table and output key.
+_CODE_FILES = ('extract_all.py', 'bgdb_utils.py')
+
+#: Subdirectory of the layout cache holding the per-table entries.
+TABLE_CACHE_SUBDIR = 'tables'
+
+_CREATURE_LOC_PREFIXES = ('hn', 'hc', 'hcg', 'hs', 'sn', 'ss', 'RaceTop', 'Race',
+                          'Location', 'Gender', 'House', 'Religion', 'Individuality')
+
+_SKILL_CONSTANTS = (
+    'SKILL_EFFECT_FORMAT_OVERRIDES', 'SKILL_PERSONAL_DAMAGE_EFFECT_CODES',
+    'SKILL_ALL_DAMAGE_EFFECT_CODES', 'SKILL_CLICK_DAMAGE_EFFECT_CODES',
+    'SKILL_ALL_CLICK_DAMAGE_EFFECT_CODES', 'SKILL_ADDITIONAL_DAMAGE_EFFECT_CODES',
+    'SKILL_ALL_ADDITIONAL_DAMAGE_EFFECT_CODES', 'SKILL_HOLY_DAMAGE_EFFECT_CODES',
+    'SKILL_BASE_DAMAGE_EFFECT_CODES', 'SKILL_EFFECT_DISPLAY_MULTIPLIERS',
+    'SKILL_EFFECT_STATIC_DESCRIPTIONS', 'SKILL_EFFECT_VALUE_DESCRIPTIONS',
+)
+
+#: What each extractor reads besides its own table's field records:
+#: localization prefixes, (table, stride) of its name_map string rows,
+#: mapping files next to this script and module constants.
+TABLE_DEPENDENCIES = {
+    'creatures':   {'table': 'creature', 'loc': _CREATURE_LOC_PREFIXES,
+                    'constants': ('RAW_TO_GAME_DAMAGE', 'RAW_TO_GAME_CLICK', 'GRADE_NORMALIZE')},
+    'items':       {'table': 'item', 'loc': ('sn', 'ss', 'sec'),
+                    'files': ('sec_korean_mapping.json',), 'constants': _SKILL_CONSTANTS},
+    'enemies':     {'table': 'enemy', 'strings': 5},
+    'bosses':      {'table': 'boss', 'loc': ('bn',)},
+    'equipment':   {'table': 'equip', 'loc': ('in', 'sec'),
+                    'files': ('enhancement_multipliers.py',),
+                    'constants': ('MAINTYPE_TO_EFFECT', 'GRADE_NORMALIZE')},
+    'commanders':  {'table': 'commander', 'strings': 6},
+    'specialties': {'table': 'spec', 'strings': 6},
+    'artifacts':   {'table': 'artifact', 'loc': ('an', 'anSet'),
+                    'files': ('artifact_code_mapping.json', 'artifact_overrides.json'),
+                    'constants': ('MAINTYPE_TO_EFFECT', 'NAME_TO_FORMAT', 'ART_TYPE_NAME_OVERRIDES')},
+}
+
+#: Output file -> (extractors whose rows it is built from, mapping files
+#: read while enriching).  additional_strings.json sits next to --bin.
+OUTPUT_DEPENDENCIES = {
+    'creatures.json':            (('creatures', 'equipment'), ()),
+    'mercenary_skills.json':     (('items',), ()),
+    'random_merc_skills.json':   (('items',), ()),
+    'sub_slot_troops.json':      (('items',), ()),
+    'enemies.json':              (('enemies',), ()),
+    'bosses.json':               (('bosses',), ()),
+    'equipment.json':            (('equipment', 'creatures'), ()),
+    'commanders_full.json':      (('commanders', 'specialties'), ('additional_strings.json',)),
+    'artifacts.json':            (('artifacts',), ('premium_effects.json',)),
+    'mercenaries_by_grade.json': (('creatures', 'equipment'), ()),
+}
+
+
+def _canonical(value):
+    """JSON-able form of a mapping constant with a stable order."""
+    if isinstance(value, dict):
+        return sorted(([_canonical(k), _canonical(v)] for k, v in value.items()), key=repr)
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v) for v in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def _file_digest(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return 'missing'
+
+
+_CODE_DIGEST = None
+
+
+def _code_digest() -> str:
+    """Digest of the _CODE_FILES sources, so editing an extractor, a parser
+    or an enrichment step invalidates the entries it produced."""
+    global _CODE_DIGEST
+    if _CODE_DIGEST is None:
+        here = Path(__file__).parent
+        _CODE_DIGEST = ','.join(f"{fname}:{_file_digest(here / fname)}"
+                                for fname in _CODE_FILES)
+    return _CODE_DIGEST
+
+
+def table_cache_key(ctx: ExtractionContext, name: str) -> str:
+    """Content key of one extractor's rows for this binary (see above)."""
+    deps = TABLE_DEPENDENCIES[name]
+    table = deps['table']
+    h = hashlib.sha256()
+    h.update(f"{TABLE_CACHE_VERSION}:{_code_digest()}:{name}:{ctx.rows[table]}".encode())
+    h.update(field_records_digest(ctx.data, ctx.fields[table]).encode())
+    h.update(json.dumps(sorted(ctx.field_types.markers.items())).encode())
+    for prefix in deps.get('loc', ()):
+        h.update(json.dumps([prefix, _canonical(ctx.loc.tables.get(prefix))],
+                            ensure_ascii=False).encode('utf-8'))
+    if 'strings' in deps:
+        rows = gather_table_string_ids(ctx.name_sids, ctx.strings, ctx.map_starts[table],
+                                       ctx.rows[table], stride=deps['strings'])
+        h.update(json.dumps(rows.tolist(), ensure_ascii=False).encode('utf-8'))
+    here = Path(__file__).parent
+    for fname in deps.get('files', ()):
+        h.update(f"{fname}:{_file_digest(here / fname)}".encode())
+    for const in deps.get('constants', ()):
+        h.update(json.dumps([const, _canonical(globals()[const])], ensure_ascii=False).encode('utf-8'))
+    return h.hexdigest()
+
+
+def output_cache_key(fname: str, table_keys: dict, bin_dir: Path) -> str:
+    """Content key of an output file: its extractors' keys and enrichment files."""
+    extractors, files = OUTPUT_DEPENDENCIES[fname]
+    h = hashlib.sha256(f"{TABLE_CACHE_VERSION}:{_code_digest()}:{fname}".encode())
+    for name in extractors:
+        h.update(table_keys[name].encode())
+    for extra in files:
+        path = bin_dir / extra if extra == 'additional_strings.json' else Path(__file__).parent / extra
+        h.update(f"{extra}:{_file_digest(path)}".encode())
+    return h.hexdigest()
+
+
+class TableCache:
+    """Extractor rows stored as ``<cache_dir>/tables/<key>.json``, plus a
+    manifest of the output files written from each output key."""
+
+    MANIFEST = 'outputs.json'
+
+    def __init__(self, cache_dir):
+        self.dir = Path(cache_dir) / TABLE_CACHE_SUBDIR
+        try:
+            self.outputs = json.loads((self.dir / self.MANIFEST).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self.outputs = {}
+
+    def load_rows(self, key: str) -> Optional[list]:
+        try:
+            raw = json.loads((self.dir / f'{key}.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return raw.get('rows') if raw.get('version') == TABLE_CACHE_VERSION else None
+
+    def store_rows(self, key: str, name: str, rows: list) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self.dir / f'{key}.json'
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'version': TABLE_CACHE_VERSION, 'table': name, 'rows': rows},
+                                  ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp, path)
+
+    def output_current(self, path: Path, key: str) -> bool:
+        """True when ``path`` is the untouched file last written for ``key``."""
+        entry = self.outputs.get(str(path.resolve()))
+        if entry is None or entry['key'] != key:
+            return False
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        return entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns
+
+    def record_output(self, path: Path, key: str) -> None:
+        st = path.stat()
+        self.outputs[str(path.resolve())] = {'key': key, 'size': st.st_size,
+                                             'mtime_ns': st.st_mtime_ns}
+
+    def save_manifest(self) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self.dir / self.MANIFEST
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.outputs, indent=1), encoding='utf-8')
+        os.replace(tmp, path)
+
+
 # ===========================================================================
 # Phase 4: Build cross-reference lookups
 # ===========================================================================
@@ -1878,6 +2314,70 @@ def build_commanders_full(commanders: list, specialties: list,
     }
 
 
+# ===========================================================================
+# Phase 5b: Locale shards
+# ===========================================================================
+# A shard holds only the localized strings of a table, keyed by the same
+# index as the Korean output; numeric columns are not repeated per locale.
+
+def creature_locale_strings(creatures: list, loc: LocalizationIndex) -> list:
+    """Localized texts of each creature, looked up with the same helpers as
+    extract_creatures().  A missing name falls back to the story's first
+    word (_extract_name_from_story), which also works for non-Korean text."""
+    rows = []
+    for c in creatures:
+        hero_id = c['hero_id']
+        name = loc.lookup('hn', hero_id)
+        story = loc.lookup('hs', hero_id)
+        if not name and story:
+            name = _extract_name_from_story(story)
+        codes = {key: c['types'][f'{key}_code'] for key, _prefix in CREATURE_TYPE_PREFIXES}
+        rows.append({
+            'hero_id': hero_id,
+            'name': name,
+            'subtitle': loc.lookup('hc', hero_id),
+            'subtitle_grade': loc.lookup('hcg', hero_id),
+            'story': story,
+            'skills': creature_skills(loc, [sk['id'] for sk in c['skills']]),
+            'types': creature_type_labels(loc, codes),
+        })
+    return rows
+
+
+def equipment_locale_strings(equipment: list, loc: LocalizationIndex) -> list:
+    return [{'index': e['index'], 'name': loc.lookup('in', e['index'])}
+            for e in equipment]
+
+
+def artifact_locale_strings(artifacts: list, loc: LocalizationIndex) -> list:
+    return [{'index': a['index'],
+             'name': loc.lookup('an', a['index']),
+             'set_name': loc.lookup('anSet', a['set_id']) if a['set_id'] else ''}
+            for a in artifacts]
+
+
+def write_locale_shards(out_dir: Path, locales: LocaleIndexes, wanted: list,
+                        creatures: list, equipment: list, artifacts: list) -> list:
+    """Write locales/<locale>/{creatures,equipment,artifacts}.json.
+
+    Returns the locales written.
+    """
+    written = []
+    for locale in wanted:
+        if locale not in locales:
+            print(f"  [locales] {locale}: no string table in this binary")
+            continue
+        loc = locales[locale]
+        shard_dir = out_dir / 'locales' / locale
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        save_json(creature_locale_strings(creatures, loc), shard_dir / 'creatures.json')
+        save_json(equipment_locale_strings(equipment, loc), shard_dir / 'equipment.json')
+        save_json(artifact_locale_strings(artifacts, loc), shard_dir / 'artifacts.json')
+        print(f"  [locales] {locale}: {len(loc)} keys -> {shard_dir}")
+        written.append(locale)
+    return written
+
+
 # ===========================================================================
 # Phase 6: Save output files
 # ===========================================================================
@@ -1939,112 +2439,110 @@ def main():
                         help='Path to bgdb_clean.bin')
     parser.add_argument('--out', default=str(Path(__file__).parent),
                         help='Output directory')
+    parser.add_argument('--apk', default=None,
+                        help='Read the BGDatabase straight out of the game APK instead of --bin')
+    parser.add_argument('--apk-member', default=None,
+                        help='APK member holding the database (auto-detected by default)')
+    parser.add_argument('--no-mmap', action='store_true',
+                        help='Read the binary into memory instead of memory-mapping it')
+    parser.add_argument('--cache-dir', default=str(Path(__file__).parent / DEFAULT_CACHE_DIR),
+                        help='Layout cache directory (keyed by binary sha256)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore and do not write the layout and per-table caches')
+    parser.add_argument('--locales', default=None,
+                        help="Also write per-locale string shards: 'all' or e.g. koKR,enUS")
+    parser.add_argument('--string-pool', action='store_true',
+                        help='Also write string_pool.json and id-encoded copies under pooled/')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='Extract the tables in N worker processes (output is identical; '
+                             '--stats then covers the main process only)')
+    parser.add_argument('--stats', nargs='?', type=int, const=15, default=None, metavar='N',
+                        help='Print parser timings and the top N fields by decode time (default 15)')
     args = parser.parse_args()
+    stats = enable_stats() if args.stats is not None else None
 
     bin_path = Path(args.bin)
     out_dir  = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"Loading binary: {bin_path}", flush=True)
-    data = load_binary(bin_path)
+    if args.apk:
+        print(f"Loading binary from APK: {args.apk}", flush=True)
+        data = load_apk_binary(args.apk, member=args.apk_member)
+    else:
+        print(f"Loading binary: {bin_path}", flush=True)
+        data = load_binary(bin_path, mmap_mode=not args.no_mmap)
     print(f"  File size: {len(data):,} bytes")
 
-    # Auto-detect offsets for this binary version
-    kokr_off, name_map_off = detect_offsets(data)
+    # Auto-detect offsets for this binary version (or reuse the cached layout)
+    layout = detect_layout(data, cache_dir=None if args.no_cache else args.cache_dir)
+    if layout['cached']:
+        print(f"  [layout cache] hit {layout['sha256'][:12]}")
+    kokr_off, name_map_off = layout['kokr_off'], layout['name_map_off']
     if kokr_off != KOKR_OFF or name_map_off != NAME_MAP_OFF:
         print(f"  [auto-detect] koKR offset: {kokr_off} (default {KOKR_OFF})")
         print(f"  [auto-detect] name_map offset: {name_map_off} (default {NAME_MAP_OFF})")
 
-    # Auto-detect field offsets for all tables
-    scanned = scan_all_table_fields(data)
-    _field_remap = {
-        'creature': CREATURE_FIELDS, 'item': ITEM_FIELDS,
-        'enemy': ENEMY_FIELDS, 'boss': BOSS_FIELDS,
-        'equip': EQUIP_FIELDS, 'commander': CMD_FIELDS,
-        'spec': SPEC_FIELDS, 'artifact': ART_FIELDS,
-    }
-    # Equipment field name aliases (new binary may rename fields)
-    _equip_aliases = {
-        'hero0': 'specializedHero0', 'hero1': 'specializedHero1',
-        'hero2': 'specializedHero2', 'hero3': 'specializedHero3',
-        'hero4': 'specializedHero4', 'hero5': 'specializedHero5',
-        'specEffect': 'specializedEffect',
-    }
-    for tbl_key, fields_dict in _field_remap.items():
-        s = scanned.get(tbl_key, {})
-        if not s:
-            continue
-        updated = 0
-        for old_name in list(fields_dict.keys()):
-            if old_name in s:
-                if fields_dict[old_name] != s[old_name]:
-                    fields_dict[old_name] = s[old_name]
-                    updated += 1
-            elif tbl_key == 'equip' and old_name in _equip_aliases:
-                new_name = _equip_aliases[old_name]
-                if new_name in s:
-                    fields_dict[old_name] = s[new_name]
-                    updated += 1
-        if updated:
-            print(f"  [auto-detect] {tbl_key}: {updated} field offsets updated")
-
-    # Auto-detect row counts and recalculate name_map slice starts
-    global CREATURE_ROWS, ITEM_ROWS, ENEMY_ROWS, BOSS_ROWS, STAGE_ROWS
-    global EQUIP_ROWS, CMD_ROWS, SPEC_ROWS, ART_ROWS
-    global ITEM_MAP_START, ENEMY_MAP_START, BOSS_MAP_START, STAGE_MAP_START
-    global EQUIP_MAP_START, CMD_MAP_START, SPEC_MAP_START, ART_MAP_START
-    row_counts = detect_row_counts(data, scanned)
-    _row_vars = [
-        ('creature', 'CREATURE_ROWS'), ('item', 'ITEM_ROWS'),
-        ('enemy', 'ENEMY_ROWS'), ('boss', 'BOSS_ROWS'),
-        ('stage', 'STAGE_ROWS'), ('equip', 'EQUIP_ROWS'),
-        ('commander', 'CMD_ROWS'), ('spec', 'SPEC_ROWS'),
-        ('artifact', 'ART_ROWS'),
-    ]
-    rows_changed = False
-    for tbl_key, var_name in _row_vars:
-        new_val = row_counts.get(tbl_key)
-        old_val = globals()[var_name]
-        if new_val and new_val != old_val:
-            globals()[var_name] = new_val
-            print(f"  [auto-detect] {var_name}: {old_val} -> {new_val}")
-            rows_changed = True
-    if rows_changed:
-        ITEM_MAP_START  = CREATURE_ROWS
-        ENEMY_MAP_START = ITEM_MAP_START + ITEM_ROWS
-        BOSS_MAP_START  = ENEMY_MAP_START + ENEMY_ROWS
-        STAGE_MAP_START = BOSS_MAP_START + BOSS_ROWS
-        EQUIP_MAP_START = STAGE_MAP_START + STAGE_ROWS
-        CMD_MAP_START   = EQUIP_MAP_START + EQUIP_ROWS
-        SPEC_MAP_START  = CMD_MAP_START + CMD_ROWS
-        ART_MAP_START   = SPEC_MAP_START + SPEC_ROWS
-        print(f"  [auto-detect] name_map starts recalculated")
-
-    print("\nParsing koKR string table...", flush=True)
-    strings = parse_kokr_strings(data, kokr_off=kokr_off)
-    print(f"  {len(strings)} strings loaded (max sid={max(strings) if strings else 0})")
-
-    print("Parsing name_map...", flush=True)
-    name_map = parse_name_map(data, off=name_map_off)
-    print(f"  {len(name_map)} entries loaded")
+    # Field offsets, row counts and type markers detected for this binary
+    ctx = ExtractionContext.from_layout(data, layout)
+    print(f"  [types] {len(ctx.field_types.markers)} type markers learned")
+    for marker, types in sorted(ctx.field_types.conflicts.items()):
+        print(f"  [types] marker {marker:#x} is ambiguous ({', '.join(sorted(types))}); not used")
+
+    print("\nParsing koKR string table and name_map...", flush=True)
+    ctx.load_strings()
+    print(f"  {len(ctx.strings)} strings loaded (max sid={ctx.strings.max_id or 0})")
+    print(f"  {len(ctx.name_map)} name_map entries loaded")
 
     print("Building localization lookup...", flush=True)
-    key_to_id, ko_map = build_localization(data)
-    print(f"  {len(key_to_id)} localization keys, {len(ko_map)} Korean strings")
+    ctx.loc, loc_cached = build_localization_index(
+        data, block_starts=layout['dict_blocks'],
+        cache_dir=None if args.no_cache else args.cache_dir,
+        digest=layout['sha256'])
+    print(f"  {len(ctx.loc)} localization keys, {len(ctx.loc.tables)} prefix tables"
+          + (" (cached index)" if loc_cached else ""))
 
     # -----------------------------------------------------------------------
     # Phase 1+2+3: Raw extraction of all tables
     # -----------------------------------------------------------------------
     print("\n--- Phase 1-3: Raw Extraction ---", flush=True)
 
-    creatures   = extract_creatures(data, name_map, strings, key_to_id, ko_map)
-    items       = extract_items(data, name_map, strings, key_to_id, ko_map)
-    enemies     = extract_enemies(data, name_map, strings)
-    bosses      = extract_bosses(data, key_to_id, ko_map)
-    equipment   = extract_equipment(data, name_map, strings, key_to_id, ko_map)
-    commanders  = extract_commanders(data, name_map, strings)
-    specialties = extract_specialties(data, name_map, strings)
-    artifacts   = extract_artifacts(data, name_map, strings, key_to_id, ko_map)
+    table_cache = None if args.no_cache else TableCache(args.cache_dir)
+    table_keys = {name: table_cache_key(ctx, name) for name, _ in EXTRACTORS}
+    results = {}
+    if table_cache is not None:
+        for name, key in table_keys.items():
+            rows = table_cache.load_rows(key)
+            if rows is not None:
+                results[name] = rows
+        if results:
+            print(f"  [table cache] hit: {', '.join(results)}")
+    missing = [name for name, _ in EXTRACTORS if name not in results]
+
+    if args.jobs > 1 and len(missing) > 1:
+        print(f"  [jobs] {min(args.jobs, len(missing))} worker processes", flush=True)
+        loc_path = None if args.no_cache else localization_index_path(args.cache_dir, layout['sha256'])
+        extracted = extract_tables_parallel(ctx, args.jobs, None if args.apk else bin_path,
+                                            loc_path, names=missing)
+    else:
+        extracted = run_extractors(ctx, names=missing)
+    if table_cache is not None:
+        for name, rows in extracted.items():
+            table_cache.store_rows(table_keys[name], name, rows)
+    results.update(extracted)
+    (creatures, items, enemies, bosses, equipment, commanders, specialties,
+     artifacts) = (results[name] for name, _ in EXTRACTORS)
+
+    # With --string-pool, intern on ingest: equal strings across all tables
+    # share one object.
+    pool = None
+    pool_path = out_dir / 'string_pool.json'
+    if args.string_pool:
+        pool = StringPool()
+        if pool_path.exists():
+            pool = StringPool.load(pool_path)   # keep the ids of earlier builds
+        for rows in (creatures, items, enemies, bosses, equipment, commanders,
+                     specialties, artifacts):
+            pool.intern_tree(rows)
 
     # -----------------------------------------------------------------------
     # Phase 4: Build lookups
@@ -2097,20 +2595,48 @@ def main():
     p_commanders  = out_dir / 'commanders_full.json'
     p_artifacts   = out_dir / 'artifacts.json'
 
-    save_json(creatures,          p_creatures)
-    save_json(mercenary_skills,   p_merc)
-    save_json(random_merc_skills, p_rand)
-    save_json(sub_slot_troops,    p_sub)
-    save_json(enemies,            p_enemies)
-    save_json(bosses,             p_bosses)
-    save_json(equipment,          p_equipment)
-    save_json(commanders_full,    p_commanders)
-    save_json(artifacts,          p_artifacts)
-
-    # Build and save mercenaries_by_grade.json
     merc_by_grade = build_mercenaries_by_grade(creatures)
     p_merc_grade = out_dir / 'mercenaries_by_grade.json'
-    save_json(merc_by_grade, p_merc_grade)
+
+    skipped = []
+    for obj, path in ((creatures, p_creatures), (mercenary_skills, p_merc),
+                      (random_merc_skills, p_rand), (sub_slot_troops, p_sub),
+                      (enemies, p_enemies), (bosses, p_bosses),
+                      (equipment, p_equipment), (commanders_full, p_commanders),
+                      (artifacts, p_artifacts), (merc_by_grade, p_merc_grade)):
+        if table_cache is None:
+            save_json(obj, path)
+            continue
+        key = output_cache_key(path.name, table_keys, add_strings_path.parent)
+        if table_cache.output_current(path, key):
+            skipped.append(path.name)
+            continue
+        save_json(obj, path)
+        table_cache.record_output(path, key)
+    if table_cache is not None:
+        table_cache.save_manifest()
+    if skipped:
+        print(f"  [table cache] unchanged, not rewritten: {', '.join(skipped)}")
+
+    if args.locales:
+        locales = LocaleIndexes(data, layout['locale_blocks'],
+                                block_starts=layout['dict_blocks'],
+                                indexes={'koKR': ctx.loc})
+        print(f"  [locales] found: {', '.join(locales) or 'none'}")
+        wanted = list(locales) if args.locales == 'all' else args.locales.split(',')
+        write_locale_shards(out_dir, locales, wanted, creatures, equipment, artifacts)
+
+    if args.string_pool:
+        pooled_dir = out_dir / 'pooled'
+        pooled_dir.mkdir(exist_ok=True)
+        outputs = [creatures, mercenary_skills, random_merc_skills, sub_slot_troops,
+                   enemies, bosses, equipment, commanders_full, artifacts, merc_by_grade]
+        paths = [p_creatures, p_merc, p_rand, p_sub, p_enemies, p_bosses,
+                 p_equipment, p_commanders, p_artifacts, p_merc_grade]
+        for rows, path in zip(outputs, paths):
+            save_json(pool.encode_rows(pool.intern_tree(rows)), pooled_dir / path.name)
+        pool.save(pool_path)
+        print(f"  [string pool] {len(pool)} strings -> {pool_path}")
 
     print("  All files written.")
 
@@ -2141,6 +2667,10 @@ def main():
     print(f"\n{'='*60}")
     print("Done. All 9 files written to:", out_dir)
 
+    if stats is not None:
+        print("\n========== PARSER STATS ==========")
+        print(stats.format_report(args.stats))
+
 
 if __name__ == '__main__':
     main()
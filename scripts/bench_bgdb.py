@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark BGDatabase field discovery on a real binary.
+
+Compares the single-pass field catalog (build_field_catalog) against the
+legacy per-table window scan and reports where the two disagree, and times
+the full discovery dump (budget: under a second for the 2.7 MB binary).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bgdb_utils import (  # noqa: E402
+    build_field_catalog,
+    load_binary,
+    scan_all_table_fields,
+    scan_all_table_fields_windowed,
+    write_discovery_dump,
+)
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bin", default=str(ROOT / "bgdb_clean.bin"), help="Path to bgdb_clean.bin")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    bin_path = Path(args.bin)
+    if not bin_path.exists():
+        raise SystemExit(f"BGDatabase binary not found: {bin_path}")
+    data = load_binary(bin_path)
+
+    t_catalog = best_of(lambda: build_field_catalog(data), args.repeat)
+    t_windowed = best_of(lambda: scan_all_table_fields_windowed(data), args.repeat)
+    print(f"{bin_path.name}: {len(data):,} bytes")
+    print(f"  catalog (whole binary): {t_catalog * 1000:8.2f} ms")
+    print(f"  windowed (per table)  : {t_windowed * 1000:8.2f} ms")
+
+    catalog = build_field_catalog(data)
+    print(f"  tables catalogued: {len(catalog)}")
+    with tempfile.TemporaryDirectory() as tmp:
+        t_dump = best_of(lambda: write_discovery_dump(data, tmp, build_field_catalog(data)), args.repeat)
+    flag = "" if t_dump < 1.0 else "  (over the 1 s budget)"
+    print(f"  discovery dump (catalog + write): {t_dump * 1000:8.2f} ms{flag}")
+    catalog_fields = scan_all_table_fields(data, catalog)
+    windowed_fields = scan_all_table_fields_windowed(data)
+    for key, fields in windowed_fields.items():
+        found = catalog_fields.get(key, {})
+        missing = sorted(set(fields) - set(found))
+        moved = sorted(n for n in fields if n in found and found[n] != fields[n])
+        if missing or moved:
+            print(f"  [{key}] window scan only: {missing}  offset differs: {moved}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
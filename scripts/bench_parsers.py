@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the bgdb_utils parsers against a stored baseline.
+
+Times each parser on the real binary (when bgdb_clean.bin is present) and on
+synthetic fixtures from bgdb_synth at the requested scales, and writes the
+results as JSON. With --compare, every (fixture, parser) pair is checked
+against the baseline and the run fails if any got slower than --threshold.
+
+    python3 scripts/bench_parsers.py --save-baseline     # before a change
+    python3 scripts/bench_parsers.py --compare           # after it
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bgdb_synth import build_synthetic_bgdb  # noqa: E402
+from bgdb_utils import (  # noqa: E402
+    build_localization,
+    detect_layout,
+    detect_offsets,
+    load_binary,
+    parse_float32_field,
+    parse_int32_field,
+    parse_kokr_strings,
+    parse_name_map,
+    parse_rank_field,
+    scan_all_table_fields,
+)
+from extract_all import (  # noqa: E402
+    parse_nested_float32,
+    parse_nested_int32,
+    parse_nested_string,
+)
+
+RESULTS_VERSION = 1
+
+#: (table, field) read by each field-level benchmark.
+FIELDS = {
+    "parse_int32_field": ("creature", "damage"),
+    "parse_float32_field": ("creature", "attackCooldown"),
+    "parse_rank_field": ("creature", "rank"),
+    "parse_nested_int32": ("artifact", "aType"),
+    "parse_nested_float32": ("artifact", "aEffect"),
+    "parse_nested_string": ("spec", "type"),
+}
+
+
+def benchmarks(data: bytes) -> dict:
+    """Return {name: zero-argument callable} for one binary."""
+    layout = detect_layout(data, cache_dir=None)
+    fields = layout["table_fields"]
+    rows = layout["row_counts"]
+
+    def field(name: str) -> int:
+        table, fname = FIELDS[name]
+        return fields[table][fname]
+
+    benches = {
+        "parse_int32_field": lambda off=field("parse_int32_field"): parse_int32_field(data, off),
+        "parse_float32_field": lambda off=field("parse_float32_field"): parse_float32_field(data, off),
+        "parse_rank_field": lambda off=field("parse_rank_field"): parse_rank_field(data, off, rows["creature"]),
+        "parse_nested_int32": lambda off=field("parse_nested_int32"): parse_nested_int32(data, off),
+        "parse_nested_float32": lambda off=field("parse_nested_float32"): parse_nested_float32(data, off),
+        "parse_nested_string": lambda off=field("parse_nested_string"): parse_nested_string(data, off),
+        "parse_kokr_strings": lambda: parse_kokr_strings(data, kokr_off=layout["kokr_off"]),
+        "parse_name_map": lambda: parse_name_map(data, off=layout["name_map_off"]),
+        "build_localization": lambda: build_localization(data),
+        "detect_offsets": lambda: detect_offsets(data),
+        "scan_all_table_fields": lambda: scan_all_table_fields(data),
+    }
+    return benches
+
+
+def time_call(fn, repeat: int) -> dict:
+    """Best seconds per call over ``repeat`` rounds of an autoranged loop."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {"seconds": best, "number": number, "repeat": repeat}
+
+
+def fixtures(bin_path: Path, scales: list) -> dict:
+    found = {}
+    if bin_path.exists():
+        found["real"] = load_binary(bin_path)
+    for scale in scales:
+        found[f"synth_x{scale}"] = build_synthetic_bgdb(scale)[0]
+    return found
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Print old/new per benchmark; return the regressions."""
+    regressions = []
+    print(f"\n{'fixture':<12} {'parser':<24} {'baseline':>11} {'now':>11} {'ratio':>7}")
+    for fixture, benches in results["results"].items():
+        old_benches = baseline.get("results", {}).get(fixture, {})
+        for name, res in benches.items():
+            old = old_benches.get(name)
+            if old is None:
+                continue
+            ratio = res["seconds"] / old["seconds"] if old["seconds"] else float("inf")
+            flag = "  REGRESSED" if ratio > 1 + threshold else ""
+            print(f"{fixture:<12} {name:<24} {old['seconds'] * 1000:>9.3f}ms "
+                  f"{res['seconds'] * 1000:>9.3f}ms {ratio:>6.2f}x{flag}")
+            if flag:
+                regressions.append((fixture, name, ratio))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bin", default=str(ROOT / "bgdb_clean.bin"), help="Real binary (skipped if missing)")
+    parser.add_argument("--scale", type=int, nargs="*", default=[1, 10], help="Synthetic fixture scales")
+    parser.add_argument("--only", nargs="*", default=None, help="Run only these parsers")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds per parser (best is kept)")
+    parser.add_argument("--out", default=str(ROOT / "bench_output.json"), help="Results JSON")
+    parser.add_argument("--baseline", default=str(ROOT / "bench_baseline.json"), help="Baseline JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="Fail on regressions against the baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {},
+    }
+    for fixture, data in fixtures(Path(args.bin), args.scale).items():
+        print(f"[{fixture}] {len(data):,} bytes", flush=True)
+        per_fixture = results["results"][fixture] = {}
+        for name, fn in benchmarks(data).items():
+            if args.only and name not in args.only:
+                continue
+            start = time.perf_counter()
+            per_fixture[name] = res = time_call(fn, args.repeat)
+            print(f"  {name:<24} {res['seconds'] * 1000:9.3f} ms/call "
+                  f"({res['number']} x {res['repeat']}, {time.perf_counter() - start:.1f} s)", flush=True)
+
+    Path(args.out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"results -> {args.out}")
+    if args.save_baseline:
+        Path(args.baseline).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"baseline -> {args.baseline}")
+
+    if args.compare:
+        baseline_path = Path(args.baseline)
+        if not baseline_path.exists():
+            raise SystemExit(f"No baseline at {baseline_path}; run with --save-baseline first")
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} parser(s) regressed more than {args.threshold:.0%}")
+            return 1
+        print("\nno regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
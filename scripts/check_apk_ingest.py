@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Check APK ingestion against synthetic zip fixtures.
+
+Builds a synthetic database (bgdb_synth.py) and zips it in memory three
+ways: as a bare member, wrapped the way a TextAsset stores it
+([name][uint32 size][payload], 4-byte aligned), and behind a decoy UnityFS
+member that sorts first. load_apk_binary() must return exactly the
+generated bytes for each. Then extract_all.py is run once with --bin and
+once with --apk on the wrapped fixture, and the outputs must be identical.
+
+    python3 scripts/check_apk_ingest.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import filecmp
+import io
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bgdb_synth import build_synthetic_bgdb  # noqa: E402
+from bgdb_utils import load_apk_binary  # noqa: E402
+
+ASSET_NAME = b"BGDatabase"
+
+
+def text_asset(payload: bytes) -> bytes:
+    """``payload`` serialized like a Unity TextAsset: aligned name, then
+    the length-prefixed bytes, padded to 4."""
+    name = struct.pack("<I", len(ASSET_NAME)) + ASSET_NAME
+    name += b"\0" * (-len(name) % 4)
+    body = struct.pack("<I", len(payload)) + payload
+    return name + body + b"\0" * (-len(body) % 4)
+
+
+def make_fixture(members: list) -> bytes:
+    """A zip archive of (name, bytes) members, built in memory."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, payload in members:
+            zf.writestr(name, payload)
+    return buf.getvalue()
+
+
+def fixtures(data: bytes) -> dict:
+    # Would pass the koKR/name_map check too; only its header rules it out.
+    decoy = b"UnityFS\0" + bytes(64) + data
+    return {
+        "bare": make_fixture([("assets/bin/Data/bgdb.bytes", data)]),
+        "wrapped": make_fixture([("assets/bin/Data/bgdb.bytes", text_asset(data))]),
+        "decoy": make_fixture([("assets/bin/Data/bgdb_bundle.bgdb", decoy),
+                               ("assets/bin/Data/database.bytes", text_asset(data))]),
+    }
+
+
+def run_extract(args: list, out: Path, cache: Path) -> None:
+    cmd = [sys.executable, str(ROOT / "extract_all.py"), *args,
+           "--out", str(out), "--cache-dir", str(cache)]
+    subprocess.run(cmd, check=True, cwd=ROOT, stdout=subprocess.DEVNULL)
+
+
+def compare_dirs(left: Path, right: Path) -> list:
+    """Relative paths of files that differ or exist on one side only."""
+    problems = []
+    left_files = {p.relative_to(left) for p in left.rglob("*") if p.is_file()}
+    right_files = {p.relative_to(right) for p in right.rglob("*") if p.is_file()}
+    if not left_files:
+        problems.append(f"no output in {left}")
+    for rel in sorted(left_files ^ right_files):
+        problems.append(f"only on one side: {rel}")
+    for rel in sorted(left_files & right_files):
+        if not filecmp.cmp(left / rel, right / rel, shallow=False):
+            problems.append(f"differs: {rel}")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=1863, help="Random seed")
+    parser.add_argument("--no-extract", action="store_true", help="Skip the --apk/--bin extract_all.py comparison")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    data, _layout = build_synthetic_bgdb(1, seed=args.seed)
+    zips = fixtures(data)
+    failed = 0
+    for name, blob in zips.items():
+        loaded = load_apk_binary(io.BytesIO(blob))
+        ok = loaded == data
+        failed += not ok
+        print(f"  {name:8s} {len(blob):,} byte zip -> {'OK' if ok else f'MISMATCH ({len(loaded):,} bytes)'}")
+
+    if not args.no_extract:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            (tmp / "bgdb.bin").write_bytes(data)
+            # --apk reads additional_strings.json next to the default --bin
+            extra = ROOT / "additional_strings.json"
+            if extra.exists():
+                (tmp / extra.name).write_bytes(extra.read_bytes())
+            (tmp / "game.apk").write_bytes(zips["wrapped"])
+            run_extract(["--bin", str(tmp / "bgdb.bin")], tmp / "from_bin", tmp / "cache_bin")
+            run_extract(["--apk", str(tmp / "game.apk")], tmp / "from_apk", tmp / "cache_apk")
+            problems = compare_dirs(tmp / "from_bin", tmp / "from_apk")
+            for problem in problems:
+                print(f"  MISMATCH --apk vs --bin: {problem}")
+            if not problems:
+                print("  --apk and --bin outputs identical")
+            failed += bool(problems)
+
+    print(f"done in {time.perf_counter() - start:.1f} s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
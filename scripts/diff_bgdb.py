@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Show what changed in the balance data between two game builds.
+
+Aligns the binaries by field catalog (not raw offsets), decodes each table
+with the same columnar decoders extract_all.py uses, and reports changed
+cells by table, row key and field:
+
+    creature hero_id 219 damageUp 120 -> 135
+    artifact 57 aEffect[1] 0.02 -> 0.025
+
+Rows are matched by their 'index' column (row position for tables without
+one). With more than two binaries, consecutive builds are diffed in turn
+(or every pair with --all-pairs); layouts come from the layout cache.
+
+    python3 scripts/diff_bgdb.py old/bgdb_clean.bin new/bgdb_clean.bin
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bgdb_utils import (  # noqa: E402
+    DEFAULT_CACHE_DIR,
+    catalog_from_dict,
+    detect_layout,
+    diff_tables,
+    load_binary,
+    load_tables,
+)
+from extract_all import EQUIP_FIELD_ALIASES, calibrate_field_types, table_column_types  # noqa: E402
+
+#: How the row key is labelled per table in the report.
+KEY_LABELS = {"creature": "hero_id "}
+
+#: Known field renames per table (old name -> new name).
+RENAMES = {"equip": EQUIP_FIELD_ALIASES}
+
+
+def open_build(path: str, cache_dir: str | None) -> dict:
+    """Every catalogued table of one binary as BGTables (decoded on access).
+
+    Tables without a signature are keyed by their field names, so the same
+    table lines up across builds even when it moves.
+    """
+    data = load_binary(path)
+    layout = detect_layout(data, cache_dir=cache_dir)
+    catalog = catalog_from_dict(layout["catalog"])
+    registry = calibrate_field_types(data, layout["table_fields"])
+    return load_tables(data, catalog, table_column_types(), registry)
+
+
+def fmt(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    if isinstance(value, list):
+        return "[" + ", ".join(fmt(v) for v in value) + "]"
+    return str(value)
+
+
+def diff_builds(old: dict, new: dict) -> list:
+    diffs = []
+    for key, table in new.items():
+        if key in old:
+            diffs.append(diff_tables(old[key], table, renames=RENAMES.get(key)))
+    return diffs
+
+
+def print_diffs(diffs: list, limit: int) -> None:
+    for d in diffs:
+        if not d:
+            continue
+        label = KEY_LABELS.get(d.table, "")
+        print(f"[{d.table}] {len(d.changes)} changed cells, "
+              f"+{len(d.added_rows)}/-{len(d.removed_rows)} rows, "
+              f"+{len(d.added_fields)}/-{len(d.removed_fields)} fields")
+        if d.added_fields or d.removed_fields:
+            print(f"  fields added: {d.added_fields}  removed: {d.removed_fields}")
+        if d.added_rows or d.removed_rows:
+            print(f"  rows added: {d.added_rows[:20]}  removed: {d.removed_rows[:20]}")
+        for change in d.changes[:limit]:
+            print(f"  {d.table} {label}{change.key} {change.field} {fmt(change.old)} -> {fmt(change.new)}")
+        if len(d.changes) > limit:
+            print(f"  ... {len(d.changes) - limit} more")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("binaries", nargs="+", help="bgdb binaries or APKs, oldest first")
+    parser.add_argument("--all-pairs", action="store_true", help="Diff every pair, not just consecutive builds")
+    parser.add_argument("--limit", type=int, default=50, help="Changed cells listed per table")
+    parser.add_argument("--json", default=None, help="Also write all diffs as JSON")
+    parser.add_argument("--cache-dir", default=str(ROOT / DEFAULT_CACHE_DIR), help="Layout cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not write the layout cache")
+    args = parser.parse_args()
+    if len(args.binaries) < 2:
+        raise SystemExit("Need at least two binaries to diff")
+
+    start = time.perf_counter()
+    cache_dir = None if args.no_cache else args.cache_dir
+    builds = [open_build(path, cache_dir) for path in args.binaries]
+    indices = range(len(builds))
+    pairs = itertools.combinations(indices, 2) if args.all_pairs else zip(indices, indices[1:])
+
+    report = []
+    for i, j in pairs:
+        diffs = diff_builds(builds[i], builds[j])
+        print(f"=== {args.binaries[i]} -> {args.binaries[j]}")
+        print_diffs(diffs, args.limit)
+        if not any(diffs):
+            print("  no differences")
+        report.append({"old": args.binaries[i], "new": args.binaries[j],
+                       "tables": [asdict(d) for d in diffs if d]})
+    print(f"done in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2, ensure_ascii=False, default=str), encoding="utf-8")
+        print(f"report -> {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Dump every table and field of a BGDatabase binary for discovery.
+
+Writes a columnar dump (columns.bin + catalog.json) covering all tables the
+field catalog finds, not just the nine extract_all.py knows about. Builders
+open it with bgdb_utils.load_discovery_dump() and read columns by name:
+
+    tables = load_discovery_dump("output/bgdb_dump")
+    tables["jewel"]["level"]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bgdb_utils import (  # noqa: E402
+    DEFAULT_CACHE_DIR,
+    catalog_from_dict,
+    detect_layout,
+    load_binary,
+    write_discovery_dump,
+)
+from extract_all import calibrate_field_types  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bin", default=str(ROOT / "bgdb_clean.bin"), help="Path to bgdb_clean.bin")
+    parser.add_argument("--out", default=str(ROOT / "output" / "bgdb_dump"), help="Dump directory")
+    parser.add_argument("--cache-dir", default=str(ROOT / DEFAULT_CACHE_DIR), help="Layout cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not write the layout cache")
+    args = parser.parse_args()
+
+    bin_path = Path(args.bin)
+    if not bin_path.exists():
+        raise SystemExit(f"BGDatabase binary not found: {bin_path}")
+
+    start = time.perf_counter()
+    data = load_binary(bin_path, mmap_mode=True)
+    layout = detect_layout(data, cache_dir=None if args.no_cache else args.cache_dir)
+    catalog = catalog_from_dict(layout["catalog"])
+    registry = calibrate_field_types(data, layout["table_fields"])
+    manifest = write_discovery_dump(data, args.out, catalog, registry)
+    elapsed = time.perf_counter() - start
+
+    n_fields = sum(len(t.fields) for t in catalog.values())
+    print(f"{bin_path.name}: {len(catalog)} tables, {n_fields} fields -> {manifest.parent}")
+    for key, table in catalog.items():
+        print(f"  {key:<16} {table.row_count:>6} rows  {len(table.fields):>3} fields")
+    print(f"done in {elapsed * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
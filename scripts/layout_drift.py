@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Report how the BGDatabase layout drifts between game builds.
+
+Compares the hardcoded offsets in extract_all.py (the "defaults" column) and
+any number of binaries or APKs, table by table and field by field:
+offset and data_size deltas against the first column, row-count changes,
+renamed fields (EQUIP_FIELD_ALIASES, or a field replaced in place by one of
+the same size) and fields that are new or gone. Binaries are catalogued in
+parallel, and layouts already in the cache are not rescanned.
+
+    python3 scripts/layout_drift.py bgdb_v1862.bin bgdb_v1863.bin
+    python3 scripts/layout_drift.py --no-defaults old.apk new.apk --json drift.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import extract_all  # noqa: E402
+from bgdb_utils import DEFAULT_CACHE_DIR, detect_layout, load_binary  # noqa: E402
+
+#: table key -> (extract_all field dict, row-count constant)
+DEFAULT_TABLES = {
+    "creature": ("CREATURE_FIELDS", "CREATURE_ROWS"),
+    "item": ("ITEM_FIELDS", "ITEM_ROWS"),
+    "enemy": ("ENEMY_FIELDS", "ENEMY_ROWS"),
+    "boss": ("BOSS_FIELDS", "BOSS_ROWS"),
+    "stage": (None, "STAGE_ROWS"),
+    "equip": ("EQUIP_FIELDS", "EQUIP_ROWS"),
+    "commander": ("CMD_FIELDS", "CMD_ROWS"),
+    "spec": ("SPEC_FIELDS", "SPEC_ROWS"),
+    "artifact": ("ART_FIELDS", "ART_ROWS"),
+}
+
+#: Known renames per table: old name -> new name.
+ALIASES = {"equip": extract_all.EQUIP_FIELD_ALIASES}
+
+
+def defaults_snapshot() -> dict:
+    """The layout extract_all.py assumes before auto-detection (no sizes)."""
+    tables = {}
+    for key, (fields_name, rows_name) in DEFAULT_TABLES.items():
+        fields = getattr(extract_all, fields_name) if fields_name else {}
+        tables[key] = {
+            "rows": getattr(extract_all, rows_name),
+            "fields": {name: [off, None] for name, off in fields.items()},
+        }
+    return {"label": "defaults", "sha256": "", "tables": tables}
+
+
+def binary_snapshot(path: str, cache_dir: str | None) -> dict:
+    """Catalogue the known tables of one binary (runs in a worker)."""
+    data = load_binary(path)
+    layout = detect_layout(data, cache_dir=cache_dir)
+    tables = {
+        key: {
+            "rows": t["row_count"],
+            "fields": {name: entry[:2] for name, entry in t["fields"].items()},
+        }
+        for key, t in layout["catalog"].items()
+        if key in DEFAULT_TABLES
+    }
+    return {"label": Path(path).name, "sha256": layout["sha256"][:12], "tables": tables}
+
+
+def table_drift(ref: dict, cur: dict, aliases: dict) -> dict:
+    """Field-by-field drift of one table from ``ref`` to ``cur``."""
+    ref_fields, cur_fields = ref["fields"], cur["fields"]
+    ref_order, cur_order = list(ref_fields), list(cur_fields)
+    removed = [n for n in ref_order if n not in cur_fields]
+    added = [n for n in cur_order if n not in ref_fields]
+
+    renamed = {}   # new name -> old name
+    for old in removed:
+        new = aliases.get(old)
+        if new in added:
+            renamed[new] = old
+    # A field replaced in place: same position, same size (sizes unknown
+    # for the defaults column, where position alone decides).
+    for old in removed:
+        if old in renamed.values():
+            continue
+        pos = ref_order.index(old)
+        if pos < len(cur_order):
+            new = cur_order[pos]
+            old_size, new_size = ref_fields[old][1], cur_fields[new][1]
+            if new in added and new not in renamed and old_size in (None, new_size):
+                renamed[new] = old
+
+    fields = {}
+    for name in cur_order:
+        source = renamed.get(name, name)
+        if source not in ref_fields:
+            fields[name] = {"status": "new", "offset": cur_fields[name][0], "size": cur_fields[name][1]}
+            continue
+        (r_off, r_size), (c_off, c_size) = ref_fields[source], cur_fields[name]
+        d_off = c_off - r_off
+        d_size = None if r_size is None or c_size is None else c_size - r_size
+        status = "renamed" if source != name else ("moved" if d_off else "same")
+        if d_size:
+            status = "resized" if status in ("same", "moved") else status
+        fields[name] = {"status": status, "offset": c_off, "size": c_size,
+                        "offset_delta": d_off, "size_delta": d_size}
+        if source != name:
+            fields[name]["renamed_from"] = source
+    for name in removed:
+        if name not in renamed.values():
+            fields[name] = {"status": "removed"}
+    return {"rows": cur["rows"], "rows_delta": cur["rows"] - ref["rows"], "fields": fields}
+
+
+def drift_report(snapshots: list) -> dict:
+    """Drift of every snapshot after the first against the first."""
+    ref = snapshots[0]
+    report = {"reference": ref["label"], "columns": []}
+    for snap in snapshots[1:]:
+        tables = {}
+        for key in DEFAULT_TABLES:
+            r, c = ref["tables"].get(key), snap["tables"].get(key)
+            if r is None or c is None:
+                tables[key] = {"missing": "reference" if r is None else "binary"}
+                continue
+            tables[key] = table_drift(r, c, ALIASES.get(key, {}))
+        report["columns"].append({"label": snap["label"], "sha256": snap["sha256"], "tables": tables})
+    return report
+
+
+def _cell(entry: dict) -> str:
+    status = entry["status"]
+    if status == "removed":
+        return "GONE"
+    if status == "new":
+        return f"NEW @{entry['offset']}"
+    text = f"{entry['offset_delta']:+d}" if entry["offset_delta"] else "="
+    if entry.get("size_delta"):
+        text += f" size{entry['size_delta']:+d}"
+    if status == "renamed":
+        text += f" <-{entry['renamed_from']}"
+    return text
+
+
+def print_report(report: dict, snapshots: list, changed_only: bool) -> None:
+    labels = [c["label"] for c in report["columns"]]
+    width = max([22] + [len(label) + 2 for label in labels])
+    ref_tables = snapshots[0]["tables"]
+    print(f"reference: {report['reference']}")
+    for key in DEFAULT_TABLES:
+        cols = [c["tables"][key] for c in report["columns"]]
+        ref = ref_tables.get(key, {"rows": "?", "fields": {}})
+        print(f"\n[{key}]")
+        print(f"  {'field':<22} {'ref offset':>10}  " + "".join(f"{label:<{width}}" for label in labels))
+        rows = [f"{c['rows']} ({c['rows_delta']:+d})" if "rows" in c else f"missing in {c['missing']}" for c in cols]
+        print(f"  {'(rows)':<22} {ref['rows']:>10}  " + "".join(f"{r:<{width}}" for r in rows))
+        names = list(ref["fields"])
+        for c in cols:
+            names += [n for n in c.get("fields", {}) if n not in names]
+        for name in names:
+            cells = []
+            for c in cols:
+                entry = c.get("fields", {}).get(name)
+                if entry is None:
+                    # Shown on its new name's line (renamed) or absent.
+                    cells.append("" if any(e.get("renamed_from") == name for e in c.get("fields", {}).values()) else "-")
+                else:
+                    cells.append(_cell(entry))
+            if all(cell == "" for cell in cells):
+                continue   # renamed everywhere; listed under the new names
+            if changed_only and all(cell in ("=", "", "-") for cell in cells):
+                continue
+            ref_off = ref["fields"].get(name, [""])[0]
+            print(f"  {name:<22} {ref_off:>10}  " + "".join(f"{cell:<{width}}" for cell in cells))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("binaries", nargs="+", help="bgdb binaries or APKs, oldest first")
+    parser.add_argument("--no-defaults", action="store_true",
+                        help="Use the first binary as the reference instead of extract_all's defaults")
+    parser.add_argument("--changed", action="store_true", help="Only list fields that changed somewhere")
+    parser.add_argument("--json", default=None, help="Also write the drift report as JSON")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: one per binary)")
+    parser.add_argument("--cache-dir", default=str(ROOT / DEFAULT_CACHE_DIR), help="Layout cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not write the layout cache")
+    args = parser.parse_args()
+
+    for path in args.binaries:
+        if not Path(path).exists():
+            raise SystemExit(f"BGDatabase binary not found: {path}")
+    cache_dir = None if args.no_cache else args.cache_dir
+    jobs = args.jobs or len(args.binaries)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        snapshots = list(pool.map(binary_snapshot, args.binaries, [cache_dir] * len(args.binaries)))
+    if not args.no_defaults:
+        snapshots.insert(0, defaults_snapshot())
+    if len(snapshots) < 2:
+        raise SystemExit("Need at least two layouts to compare (drop --no-defaults or add a binary)")
+
+    report = drift_report(snapshots)
+    print_report(report, snapshots, args.changed)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\nreport -> {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
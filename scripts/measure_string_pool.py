@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Measure what the shared string pool saves on extracted JSON.
+
+Loads the extract_all.py outputs in a directory twice: once as plain
+json.load() results, and once interned through one StringPool. Reports the
+retained memory of each (tracemalloc), the number of distinct strings, and
+the serialized size of the plain files against the id-encoded files plus
+string_pool.json, all written the way extract_all.save_json() writes them.
+
+    python3 scripts/measure_string_pool.py --dir output
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bgdb_utils import StringPool  # noqa: E402
+
+OUTPUT_FILES = [
+    "creatures.json", "mercenary_skills.json", "random_merc_skills.json",
+    "sub_slot_troops.json", "enemies.json", "bosses.json", "equipment.json",
+    "commanders_full.json", "artifacts.json", "mercenaries_by_grade.json",
+]
+
+
+def dumps(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def retained_bytes(load) -> tuple:
+    """(result, bytes still allocated after ``load()`` returns)."""
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default=str(ROOT / "output"), help="Directory with extract_all.py outputs")
+    args = parser.parse_args()
+
+    paths = [Path(args.dir) / name for name in OUTPUT_FILES if (Path(args.dir) / name).exists()]
+    if not paths:
+        raise SystemExit(f"No extract_all.py outputs in {args.dir}")
+    texts = [p.read_text(encoding="utf-8") for p in paths]
+
+    plain, plain_mem = retained_bytes(lambda: [json.loads(t) for t in texts])
+
+    def load_pooled():
+        pool = StringPool()
+        return pool, [pool.intern_tree(json.loads(t)) for t in texts]
+
+    (pool, pooled), pooled_mem = retained_bytes(load_pooled)
+
+    plain_size = sum(len(dumps(rows)) for rows in plain)
+    encoded_size = sum(len(dumps(pool.encode_rows(rows))) for rows in pooled)
+    pool_size = len(json.dumps(pool.to_dict(), ensure_ascii=False).encode("utf-8"))
+    for rows in pooled:
+        assert pool.decode_rows(pool.encode_rows(rows)) == rows
+
+    print(f"{args.dir}: {len(paths)} files, {len(pool):,} distinct strings")
+    print(f"  memory  plain {plain_mem / 1e6:8.2f} MB   interned {pooled_mem / 1e6:8.2f} MB"
+          f"   ({1 - pooled_mem / plain_mem:.1%} saved)")
+    print(f"  on disk plain {plain_size / 1e6:8.2f} MB   ids {encoded_size / 1e6:.2f} MB + pool {pool_size / 1e6:.2f} MB"
+          f"   ({1 - (encoded_size + pool_size) / plain_size:.1%} saved)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Write synthetic BGDatabase binaries for tests and scale benchmarks.
+
+Each scale N writes <out>/bgdb_synth_xN.bin with N times the v1863 row
+counts (see bgdb_synth.py), then checks that the parsers find what was
+written: field offsets and row counts (scan_all_table_fields), the koKR and
+name_map offsets, and the localization keys (build_localization).  It then
+runs every extract_all.py extractor on the binary and compares row counts
+and sample values (creature index/name/damage, equipment grades, artifact
+aEffect, boss names) with the raw field bytes the generator wrote.
+
+    python3 scripts/synth_bgdb.py --scale 1 10 100
+    python3 extract_all.py --bin output/synth/bgdb_synth_x10.bin --out /tmp/x10
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import struct
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bgdb_synth import BASE_ROWS, build_synthetic_bgdb  # noqa: E402
+from bgdb_utils import LocalizationIndex, build_localization, detect_layout  # noqa: E402
+from extract_all import GRADE_NORMALIZE, ExtractionContext, run_extractors  # noqa: E402
+
+#: Extractor -> table its rows come from.
+EXTRACTOR_TABLES = {
+    "creatures": "creature", "items": "item", "enemies": "enemy", "bosses": "boss",
+    "equipment": "equip", "commanders": "commander", "specialties": "spec",
+    "artifacts": "artifact",
+}
+
+
+def raw_fields(data: bytes, start: int) -> dict:
+    """field name -> data bytes of the table starting at ``start``, walked
+    straight from the record layout (independent of bgdb_utils)."""
+    fields = {}
+    off = start
+    while off + 4 <= len(data):
+        name_len = struct.unpack_from("<I", data, off)[0]
+        name = data[off + 4:off + 4 + name_len]
+        if not 1 <= name_len <= 30 or not name.isascii() or not name.replace(b"_", b"").isalnum():
+            break
+        size_off = off + 4 + name_len + 31
+        size = struct.unpack_from("<I", data, size_off)[0]
+        fields[name.decode()] = data[size_off + 4:size_off + 4 + size]
+        off = size_off + 4 + size + 22
+    return fields
+
+
+def nested_floats(block: bytes) -> list:
+    """Rows of a nested float32 block: [count][(row, off) * count][body]."""
+    count = struct.unpack_from("<I", block)[0]
+    offs = [struct.unpack_from("<II", block, 4 + 8 * i)[1] for i in range(count)]
+    body = 4 + 8 * count
+    ends = offs[1:] + [len(block) - body]
+    return [list(struct.unpack_from(f"<{(e - o) // 4}f", block, body + o)) for o, e in zip(offs, ends)]
+
+
+def verify_extractors(data: bytes, layout: dict, detected: dict, loc: LocalizationIndex,
+                      scale: int) -> list:
+    """Run every extractor and compare with what the generator wrote."""
+    problems = []
+    ctx = ExtractionContext.from_layout(data, detected, verbose=False)
+    ctx.load_strings()
+    ctx.loc = loc
+    with redirect_stdout(io.StringIO()):
+        results = run_extractors(ctx)
+    for name, table in EXTRACTOR_TABLES.items():
+        if len(results[name]) != BASE_ROWS[table] * scale:
+            problems.append(f"{name}: {len(results[name])} rows extracted != {BASE_ROWS[table] * scale}")
+
+    raw = {key: raw_fields(data, layout[key]) for key in ("creature", "equip", "artifact")}
+    nc = BASE_ROWS["creature"] * scale
+    damage = struct.unpack(f"<{nc}i", raw["creature"]["damage"])
+    for i, c in enumerate(results["creatures"]):
+        if (c["hero_id"], c["name"], c["damage_raw"]["damage"]) != (i, f"용병{i}", damage[i]):
+            problems.append(f"creature {i}: hero_id/name/damage "
+                            f"{c['hero_id']}/{c['name']}/{c['damage_raw']['damage']} != {i}/용병{i}/{damage[i]}")
+            break
+    letters = raw["equip"]["rank"][4 + 8 * BASE_ROWS["equip"] * scale:].decode("ascii")
+    grades = [GRADE_NORMALIZE.get(g, g) for g in letters]
+    if [e["grade"] for e in results["equipment"]] != grades:
+        problems.append("equipment: grades differ from the rank block letters")
+    aeffect = nested_floats(raw["artifact"]["aEffect"])
+    for i, a in enumerate(results["artifacts"]):
+        # extract_artifacts shifts aType/aEffect down one row
+        expected = [round(v, 6) for v in aeffect[i - 1]] if i else []
+        if a["aEffect"] != expected:
+            problems.append(f"artifact {i}: aEffect {a['aEffect']} != {expected}")
+            break
+    names = [b["name"] for b in results["bosses"]]
+    if names != [f"보스{i}" for i in range(BASE_ROWS["boss"] * scale)]:
+        problems.append(f"bosses: names {names[:3]} ... are not 보스0, 보스1, ...")
+    return problems
+
+
+def verify(data: bytes, layout: dict, scale: int) -> list:
+    """Return a list of mismatches between the generator layout and what
+    the parsers detect (empty when the binary round-trips)."""
+    problems = []
+    detected = detect_layout(data, cache_dir=None)
+    if detected["kokr_off"] != layout["kokr"]:
+        problems.append(f"koKR offset {detected['kokr_off']} != {layout['kokr']}")
+    if detected["name_map_off"] != layout["name_map"]:
+        problems.append(f"name_map offset {detected['name_map_off']} != {layout['name_map']}")
+    for key, rows in BASE_ROWS.items():
+        fields = detected["table_fields"].get(key)
+        if not fields:
+            problems.append(f"{key}: no fields found")
+            continue
+        if min(fields.values()) != layout[key]:
+            problems.append(f"{key}: first field at {min(fields.values())} != {layout[key]}")
+        if detected["row_counts"].get(key) != rows * scale:
+            problems.append(f"{key}: {detected['row_counts'].get(key)} rows != {rows * scale}")
+    key_to_id, ko_map = build_localization(data, block_starts=detected["dict_blocks"])
+    if len(key_to_id) != len(ko_map):
+        problems.append(f"localization: {len(key_to_id)} keys but {len(ko_map)} strings")
+    for probe in ("hn0", f"hn{BASE_ROWS['creature'] * scale - 1}", "anSet1"):
+        if probe not in key_to_id:
+            problems.append(f"localization: key {probe} missing")
+    if problems:
+        return problems
+    loc = LocalizationIndex.from_maps(key_to_id, ko_map)
+    return verify_extractors(data, layout, detected, loc, scale)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, nargs="+", default=[1], help="Row-count multipliers (1-100)")
+    parser.add_argument("--seed", type=int, default=1863, help="Random seed")
+    parser.add_argument("--locales", default="", help="Extra locale tables, e.g. enUS,jaJP")
+    parser.add_argument("--out", default=str(ROOT / "output" / "synth"), help="Output directory")
+    parser.add_argument("--no-verify", action="store_true", help="Skip the parser round-trip check")
+    args = parser.parse_args()
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    locales = [loc for loc in args.locales.split(",") if loc]
+    failed = 0
+    for scale in args.scale:
+        if not 1 <= scale <= 100:
+            raise SystemExit(f"--scale must be between 1 and 100, got {scale}")
+        start = time.perf_counter()
+        data, layout = build_synthetic_bgdb(scale, seed=args.seed, locales=locales)
+        path = out_dir / f"bgdb_synth_x{scale}.bin"
+        path.write_bytes(data)
+        print(f"{path}: {len(data):,} bytes in {time.perf_counter() - start:.1f} s")
+        if args.no_verify:
+            continue
+        problems = verify(data, layout, scale)
+        for problem in problems:
+            print(f"  MISMATCH {problem}")
+        if not problems:
+            print("  round-trip OK")
+        failed += bool(problems)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -128,7 +128,12 @@ def update_versions(game_version: str | None, guide_version: str | None, apk_nam
         index.write_text(text, encoding="utf-8")
 
 
-def extract_data(bin_path: Path, out_dir: Path) -> None:
+def extract_data(bin_path: Path, out_dir: Path, apk_path: Path | None = None) -> None:
+    if apk_path is not None:
+        if not apk_path.exists():
+            raise SystemExit(f"APK not found: {apk_path}")
+        run([sys.executable, "extract_all.py", "--apk", str(apk_path), "--out", str(out_dir)])
+        return
     if not bin_path.exists():
         raise SystemExit(f"BGDatabase binary not found: {bin_path}")
     run([sys.executable, "extract_all.py", "--bin", str(bin_path), "--out", str(out_dir)])
@@ -223,6 +228,7 @@ def check_live(url: str, game_version: str | None, guide_version: str | None) ->
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--bin", default="bgdb_clean.bin", help="Path to bgdb_clean.bin")
+    parser.add_argument("--apk", help="Extract straight from the game APK instead of --bin")
     parser.add_argument("--out", default="output", help="Extraction output directory")
     parser.add_argument("--skip-extract", action="store_true", help="Reuse current output/*.json")
     parser.add_argument("--game-version", help='Example: "v.1863 TEST_8"')
@@ -246,13 +252,15 @@ def main() -> int:
     if args.push and not args.commit:
         raise SystemExit("--push requires --commit")
 
+    apk_path = (ROOT / args.apk).resolve() if args.apk else None
     if not args.skip_extract:
-        extract_data((ROOT / args.bin).resolve(), ROOT / args.out)
+        extract_data((ROOT / args.bin).resolve(), ROOT / args.out, apk_path)
 
     sync_legacy_files()
     for _label, cmd in BUILD_STEPS:
         run(cmd)
-    update_versions(args.game_version, args.guide_version, args.apk_name)
+    apk_name = args.apk_name or (apk_path.name if apk_path else None)
+    update_versions(args.game_version, args.guide_version, apk_name)
     verify(strict_codes=args.strict_codes, strict_mercenary_skills=args.strict_mercenary_skills)
 
     if args.commit:
@@ -65,6 +65,33 @@ def names_by_grade(rows):
     return grouped
 
 
+def binary_equipment_rows(bin_path):
+    """index/name/grade of every equipment row read straight from the binary.
+
+    Goes through the lazy BGTable, so only the index column and the rank
+    block are decoded; the other equipment columns are never touched.
+    """
+    sys.path.insert(0, str(ROOT))
+    from bgdb_utils import DEFAULT_CACHE_DIR, build_localization_index, detect_layout, load_binary
+    from extract_all import ExtractionContext
+
+    cache_dir = ROOT / DEFAULT_CACHE_DIR
+    data = load_binary(bin_path, mmap_mode=True)
+    layout = detect_layout(data, cache_dir=cache_dir)
+    ctx = ExtractionContext.from_layout(data, layout, verbose=False)
+    loc, _ = build_localization_index(data, block_starts=layout["dict_blocks"],
+                                      cache_dir=cache_dir, digest=layout["sha256"])
+    table = ctx.table("equip")
+    rows = [{"index": row.index, "name": loc.lookup("in", row.index), "grade": row.grade}
+            for row in table.rows()]
+    print(f"  [binary] equipment columns decoded: {', '.join(table.decoded())}")
+    return rows
+
+
+#: dataset label -> rows read from the binary (for --bin)
+BINARY_ROWS = {"equipment": binary_equipment_rows}
+
+
 def extract_values(row, path):
     if not path:
         yield row
@@ -95,12 +122,14 @@ def portrait_warnings(rows):
     return {grade: counts[grade] for grade in GRADE_ORDER if counts[grade]}, len(missing)
 
 
-def compare_dataset(spec, strict_codes=False):
+def compare_dataset(spec, strict_codes=False, bin_path=None):
     errors = []
     warnings = []
     label = spec["label"]
     loaded = [(name, load_json(path)) for name, path in spec["sources"]]
     loaded.append(("index", load_inline_const(spec["inline_const"])))
+    if bin_path is not None and label in BINARY_ROWS:
+        loaded.append(("binary", BINARY_ROWS[label](bin_path)))
 
     print(f"\n[{label}]")
     for name, rows in loaded:
@@ -142,12 +171,13 @@ def compare_dataset(spec, strict_codes=False):
 def main():
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--strict-codes", action="store_true", help="fail on unresolved '코드 N' effect names")
+    parser.add_argument("--bin", default=None, help="also check equipment names/grades against this bgdb binary")
     args = parser.parse_args()
 
     all_errors = []
     all_warnings = []
     for spec in DATASETS:
-        errors, warnings = compare_dataset(spec, strict_codes=args.strict_codes)
+        errors, warnings = compare_dataset(spec, strict_codes=args.strict_codes, bin_path=args.bin)
         all_errors.extend(errors)
         all_warnings.extend(warnings)
 